@@ -0,0 +1,105 @@
+"""Added item hourly price continuous aggregate
+
+Revision ID: b1e7d4c2a9f0
+Revises: 965e766db0a0
+Create Date: 2026-10-18 10:12:31.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b1e7d4c2a9f0"
+down_revision: Union[str, None] = "965e766db0a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same amount of items the plotter averages over per hour
+BOTTOM_N_PRICES = 20
+
+
+# `item` is partitioned on an integer time column, so timescale needs to know what "now" is.
+# Currencies are ingested every hour, so the latest currency hour is the current hour.
+# `currency` is small, unlike `item`, which would be scanned on every policy run.
+ITEM_CURRENT_HOUR_FUNCTION = """
+    CREATE OR REPLACE FUNCTION item_current_hour() RETURNS SMALLINT
+        LANGUAGE SQL STABLE AS
+    $$
+        SELECT COALESCE(MAX("createdHoursSinceLaunch"), 0)::SMALLINT FROM currency
+    $$;
+"""
+
+SET_ITEM_INTEGER_NOW_FUNCTION = (
+    "SELECT set_integer_now_func('item', 'item_current_hour');"
+)
+
+# The cheapest items of an hour across all currencies are always among the
+# cheapest items of each currency, so keeping the bottom N amounts per currency
+# is enough to rank the bottom N in chaos later on.
+ITEM_HOURLY_PRICE_VIEW = f"""
+    CREATE MATERIALIZED VIEW item_hourly_price
+    WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+    SELECT
+        time_bucket(1::SMALLINT, item."createdHoursSinceLaunch") AS "createdHoursSinceLaunch",
+        item."leagueId",
+        item.name,
+        item."itemBaseTypeId",
+        item.identified,
+        item."currencyId",
+        COUNT(*) AS "nItems",
+        (ARRAY_AGG(item."currencyAmount" ORDER BY item."currencyAmount" ASC))[1:{BOTTOM_N_PRICES}] AS "bottomCurrencyAmounts"
+    FROM item
+    GROUP BY
+        time_bucket(1::SMALLINT, item."createdHoursSinceLaunch"),
+        item."leagueId",
+        item.name,
+        item."itemBaseTypeId",
+        item.identified,
+        item."currencyId"
+    WITH NO DATA;
+"""
+
+ITEM_HOURLY_PRICE_INDEX = """
+    CREATE INDEX "ix_item_hourly_price_name_leagueId_createdHoursSinceLaunch"
+        ON item_hourly_price (name, "leagueId", "createdHoursSinceLaunch");
+"""
+
+
+def upgrade() -> None:
+    op.execute(ITEM_CURRENT_HOUR_FUNCTION)
+    op.execute(SET_ITEM_INTEGER_NOW_FUNCTION)
+
+    # Continuous aggregates can not be created inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(ITEM_HOURLY_PRICE_VIEW)
+        op.execute(
+            """
+            SELECT add_continuous_aggregate_policy(
+                'item_hourly_price',
+                start_offset => 168::SMALLINT,
+                end_offset => 1::SMALLINT,
+                schedule_interval => INTERVAL '1 hour'
+            );
+            """
+        )  # Refreshes the last 7 days, the current hour is served from `item` directly
+        op.execute(
+            """
+            CALL refresh_continuous_aggregate('item_hourly_price', NULL, NULL);
+            """
+        )
+
+    op.execute(ITEM_HOURLY_PRICE_INDEX)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "SELECT remove_continuous_aggregate_policy('item_hourly_price', if_exists => TRUE);"
+        )
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS item_hourly_price;")
+    # `item_current_hour` is kept, since it is still registered as the integer now function of `item`
@@ -1,17 +1,17 @@
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.datastructures import Headers
 
 from app.core.cache.user_cache import UserCache, UserCacheTokenType
 from app.core.config import settings
-from app.core.models.database import AsyncSessionLocal, SessionLocal
+from app.core.models.database import AsyncSessionLocal, HeavyAsyncSessionLocal
 from app.core.models.models import User
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
+from app.core.schemas.user import UserInCache
 from app.exceptions import (
     DbObjectDoesNotExistError,
     InvalidHeaderProvidedError,
@@ -28,19 +28,25 @@ reusable_oauth2 = OAuth2PasswordBearer(
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as db:
+async def get_async_heavy_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get a session on the heavy pool, for plots, ingestion and exports."""
+    async with HeavyAsyncSessionLocal() as db:
         yield db
 
 
+def get_async_heavy_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Get the session maker of the heavy pool, for sessions that outlive the route,
+    like streamed exports.
+    """
+    return HeavyAsyncSessionLocal
+
+
 async def get_user_cache_session() -> AsyncGenerator[UserCache, None]:
     """Get user cache session."""
     async with UserCache(UserCacheTokenType.ACCESS_SESSION) as user_cache_session:
@@ -90,33 +96,33 @@ UserCacheUpdateMeSession = Annotated[
 async def get_current_user(
     token: TokenDep,
     user_cache_session: UserCacheSession,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     user_cached = await user_cache_session.verify_token(token)
-
-    user = db.get(User, user_cached.userId)
-    if not user:
-        raise DbObjectDoesNotExistError(
-            model_table_name=User.__tablename__,
-            filter={"userId": user_cached.userId},
-            function_name=get_current_user.__name__,
-        )
-    if not user.isActive:
-        raise UserIsNotActiveError(
-            function_name=get_current_user.__name__,
-        )
+    async with db.begin():
+        user = await db.get(User, user_cached.userId)
+        if not user:
+            raise DbObjectDoesNotExistError(
+                model_table_name=User.__tablename__,
+                filter={"userId": user_cached.userId},
+                function_name=get_current_user.__name__,
+            )
+        if not await user.awaitable_attrs.isActive:
+            raise UserIsNotActiveError(
+                function_name=get_current_user.__name__,
+            )
     return user
 
 
 async def get_current_user_not_active(
     token: TokenDep,
     user_cache_session: UserCacheSession,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Use if user is not active yet."""
     user_cached = await user_cache_session.verify_token(token)
-
-    user = db.get(User, user_cached.userId)
+    async with db.begin():
+        user = await db.get(User, user_cached.userId)
     if not user:
         raise DbObjectDoesNotExistError(
             model_table_name=User.__tablename__,
@@ -126,33 +132,44 @@ async def get_current_user_not_active(
     return user
 
 
-async def get_async_current_user(
+async def get_current_cached_user(
     token: TokenDep,
     user_cache_session: UserCacheSession,
     db: AsyncSession = Depends(get_async_db),
-) -> User:
+) -> UserInCache:
+    """
+    Like `get_current_user`, but trusts the cached copy of the user row, which is
+    at most `USER_CACHE_TRUST_SECONDS` old. The database is only queried on a miss.
+
+    Use for checks only, the returned user is not a database object.
+    """
     user_cached = await user_cache_session.verify_token(token)
-    async with db.begin():
-        user = await db.get(User, user_cached.userId)
-        if not user:
+    user = await UserCache.get_user(user_cached.userId)
+    if user is None:
+        async with db.begin():
+            db_user = await db.get(User, user_cached.userId)
+        if not db_user:
             raise DbObjectDoesNotExistError(
                 model_table_name=User.__tablename__,
                 filter={"userId": user_cached.userId},
-                function_name=get_current_user.__name__,
-            )
-        if not await user.awaitable_attrs.isActive:
-            raise UserIsNotActiveError(
-                function_name=get_current_user.__name__,
+                function_name=get_current_cached_user.__name__,
             )
+        user = await UserCache.set_user(db_user)
+    if not user.isActive:
+        raise UserIsNotActiveError(
+            function_name=get_current_cached_user.__name__,
+        )
     return user
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentUserNotActive = Annotated[User, Depends(get_current_user_not_active)]
-AsyncCurrentUser = Annotated[User, Depends(get_async_current_user)]
+CachedCurrentUser = Annotated[UserInCache, Depends(get_current_cached_user)]
 
 
-async def get_current_active_superuser(current_user: CurrentUser) -> User:
+async def get_current_active_superuser(
+    current_user: CachedCurrentUser,
+) -> UserInCache:
     if not current_user.isSuperuser:
         raise UserWithNotEnoughPrivilegesError(
             function_name=get_current_active_superuser.__name__,
@@ -160,11 +177,7 @@ async def get_current_active_superuser(current_user: CurrentUser) -> User:
     return current_user
 
 
-async def get_current_active_user(current_user: CurrentUser) -> User:
-    return current_user
-
-
-async def get_async_current_active_user(current_user: AsyncCurrentUser) -> User:
+async def get_current_active_user(current_user: CachedCurrentUser) -> UserInCache:
     return current_user
 
 
@@ -224,6 +237,8 @@ async def get_rate_limit_tier_by_request(
     token = get_user_token_by_request(request)
 
     user = await user_cache_session.verify_token(token)
+    # The token holds the user as it was on login, the tier may have changed since
+    user = await UserCache.get_user(user.userId) or user
 
     if user.isSuperuser:
         return rate_limit_settings.TIER_SUPERUSER_PLOT_RATE_LIMIT
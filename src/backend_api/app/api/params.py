@@ -2,9 +2,36 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from app.utils.export import ExportFormat
+
+CSV_REQUEST_BODY = {
+    "requestBody": {
+        "content": {"text/csv": {"schema": {"type": "string"}}},
+        "required": True,
+    }
+}
+
 
 class FilterParams(BaseModel):
+    """
+    `after` is a keyset pagination cursor: the `sort_key` value followed by the
+    primary key values of the last object on the previous page, as a JSON array.
+    Prefer it over `skip` for deep pages, as skipped rows are still read.
+    """
+
     limit: int | None = Field(None, gt=0)
     skip: int | None = Field(None, ge=0)
     sort_key: str | None = Field(None)
     sort_method: Literal["asc", "desc"] | None = Field(None)
+    after: str | None = Field(None)
+
+
+class ExportParams(BaseModel):
+    """
+    `start` and `end` are an inclusive range of `createdHoursSinceLaunch`.
+    """
+
+    league_id: int
+    start: int | None = Field(None, ge=0)
+    end: int | None = Field(None, ge=0)
+    export_format: ExportFormat = Field("ndjson")
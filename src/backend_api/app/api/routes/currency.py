@@ -1,18 +1,19 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.core.schemas as schemas
 from app.api.api_message_util import (
     get_delete_return_msg,
 )
 from app.api.deps import (
+    get_async_db,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
 from app.api.params import FilterParams
+from app.core.config import settings
 from app.core.models.models import Currency
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import (
@@ -44,7 +45,7 @@ async def get_currency(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     currencyId: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get currency by key and value for "currencyId".
@@ -67,7 +68,7 @@ async def get_currency(
 )
 async def get_all_currencies(
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all currencies.
@@ -97,7 +98,7 @@ async def get_all_currencies(
 async def get_latest_currency_id(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get the latest currencyId, returns 1 if table is empty
@@ -107,6 +108,26 @@ async def get_latest_currency_id(
     return await CRUD_currency.get_latest_currency_id(db)
 
 
+@router.post(
+    "/reserve_ids/",
+    response_model=schemas.ReservedIds,
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def reserve_currency_ids(
+    count: Annotated[int, Query(gt=0, le=settings.RESERVE_IDS_MAX_COUNT)],
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Reserve `count` currencyIds, to assign before creating currencies.
+
+    Reserved ids are never generated for other currencies. Returns ascending
+    ranges of ids, where both the first and last id are included.
+    """
+    id_ranges = await CRUD_currency.reserve_ids(db, count=count)
+
+    return schemas.ReservedIds(ranges=id_ranges)
+
+
 @router.get(
     "/latest_hours/",
     response_model=dict[int, int],
@@ -125,7 +146,7 @@ async def get_latest_hours(
     league_ids: Annotated[list[int], Query(min_length=1)],
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Returns a dict mapping league id to the most recent hour relating to that league. Dict is empty if no currencies exist.
@@ -153,7 +174,7 @@ async def get_latest_currencies(
     league_ids: Annotated[list[int], Query(min_length=1)],
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Returns a list of currencies for all queried leagues (if data exists).
@@ -178,7 +199,7 @@ async def get_currency_from_query(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     query_list: list[CurrencyQuery],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Returns a list of currencies that match any of the queries
@@ -196,7 +217,7 @@ async def get_currency_from_query(
 async def create_currency(
     currency: schemas.CurrencyCreate | list[schemas.CurrencyCreate],
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create one or a list of currencies.
@@ -219,7 +240,7 @@ async def create_currency(
 async def update_currency(
     currencyId: int,
     currency_update: schemas.CurrencyUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Update a currency by key and value for "currencyId".
@@ -245,7 +266,7 @@ async def update_currency(
 )
 async def delete_currency(
     currencyId: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Delete a currency by key and value for "currencyId".
@@ -1,19 +1,27 @@
+import io
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 import app.core.schemas as schemas
 from app.api.deps import (
+    get_async_db,
+    get_async_heavy_db,
+    get_async_heavy_sessionmaker,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
-from app.api.params import FilterParams
+from app.api.params import CSV_REQUEST_BODY, ExportParams, FilterParams
+from app.core.cache.plot_cache import plot_cache
+from app.core.config import settings
+from app.core.models.models import Item as model_Item
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import apply_user_rate_limits
 from app.crud import CRUD_item
+from app.utils.export import EXPORT_MEDIA_TYPES, filter_hours, stream_export
 
 router = APIRouter()
 
@@ -36,7 +44,7 @@ item_prefix = "item"
 async def get_latest_item_id(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get the latest "itemId"
@@ -44,13 +52,36 @@ async def get_latest_item_id(
     Can only be used safely on an empty table or directly after an insertion.
     """
 
-    result = db.execute(text("""SELECT MAX("itemId") FROM item""")).fetchone()
+    async with db.begin():
+        result = (
+            await db.execute(text("""SELECT MAX("itemId") FROM item"""))
+        ).fetchone()
     if not result or not result[0]:
         return None
 
     return int(result[0])
 
 
+@router.post(
+    "/reserve_ids/",
+    response_model=schemas.ReservedIds,
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def reserve_item_ids(
+    count: Annotated[int, Query(gt=0, le=settings.RESERVE_IDS_MAX_COUNT)],
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Reserve `count` itemIds, to assign before creating items.
+
+    Reserved ids are never generated for other items. Returns ascending
+    ranges of ids, where both the first and last id are included.
+    """
+    id_ranges = await CRUD_item.reserve_ids(db, count=count)
+
+    return schemas.ReservedIds(ranges=id_ranges)
+
+
 @router.get(
     "/",
     response_model=schemas.Item | list[schemas.Item],
@@ -58,7 +89,7 @@ async def get_latest_item_id(
 )
 async def get_all_items(
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all items.
@@ -71,20 +102,93 @@ async def get_all_items(
     return all_items
 
 
+@router.get(
+    "/export/",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def export_items(
+    export_params: Annotated[ExportParams, Query()],
+    session_maker: async_sessionmaker[AsyncSession] = Depends(
+        get_async_heavy_sessionmaker
+    ),
+):
+    """
+    Export all items in a league, optionally in an hour range.
+
+    Streams the items as NDJSON or CSV, without loading all of them in memory.
+    """
+    statement = select(*model_Item.__table__.columns).where(
+        model_Item.leagueId == export_params.league_id
+    )
+    statement = filter_hours(
+        statement,
+        model_Item.createdHoursSinceLaunch,
+        start=export_params.start,
+        end=export_params.end,
+    )
+
+    return StreamingResponse(
+        stream_export(
+            statement,
+            session_maker=session_maker,
+            export_format=export_params.export_format,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_params.export_format],
+    )
+
+
 @router.post(
     "/",
-    response_model=schemas.ItemCreate | list[schemas.ItemCreate] | None,
+    response_model=schemas.ItemCreate | list[schemas.ItemCreate] | list[int] | None,
     dependencies=[Depends(get_current_active_superuser)],
 )
 async def create_item(
     item: schemas.ItemCreate | list[schemas.ItemCreate],
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    use_copy: bool | None = None,
+    return_ids: bool | None = None,
+    db: AsyncSession = Depends(get_async_heavy_db),
 ):
     """
     Create one or a list of new items.
 
     Returns the created item or list of items.
+
+    `use_copy` inserts with `COPY FROM STDIN`, which is faster for large lists.
+
+    `return_ids` returns only the assigned `itemId`s, in the same order as the items.
     """
 
-    return await CRUD_item.create(db=db, obj_in=item, return_nothing=return_nothing)
+    if return_ids:
+        created_items = await CRUD_item.create_returning_ids(db=db, obj_in=item)
+    else:
+        created_items = await CRUD_item.create(
+            db=db, obj_in=item, return_nothing=return_nothing, use_copy=use_copy
+        )
+    await plot_cache.register_league_hours(item if isinstance(item, list) else [item])
+
+    return created_items
+
+
+@router.post(
+    "/csv/",
+    openapi_extra=CSV_REQUEST_BODY,
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def create_items_from_csv(
+    request: Request,
+    db: AsyncSession = Depends(get_async_heavy_db),
+):
+    """
+    Create items from a CSV body, with the column names in the first row.
+
+    Skips validation per object. The columns are validated once, and each value is
+    parsed by the database while copying. Empty unquoted values are null.
+    """
+    csv_file = io.BytesIO(await request.body())
+    await CRUD_item.create_from_csv(db, csv_file=csv_file)
+    await plot_cache.register_csv_league_hours(csv_file)
@@ -1,18 +1,19 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.core.schemas as schemas
 from app.api.api_message_util import (
     get_delete_return_msg,
 )
 from app.api.deps import (
+    get_async_db,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
 from app.api.params import FilterParams
+from app.core.cache.reference_cache import reference_cache
 from app.core.models.models import ItemBaseType
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import (
@@ -42,7 +43,7 @@ async def get_item_base_type(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     itemBaseTypeId: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get item base type by key and value for "itemBaseTypeId".
@@ -65,12 +66,13 @@ async def get_item_base_type(
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
+    lease=True,
 )
 async def get_all_item_base_types(
-    request: Request,  # noqa: ARG001
+    request: Request,
     response: Response,  # noqa: ARG001
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all item base types.
@@ -78,12 +80,22 @@ async def get_all_item_base_types(
     Returns a list of all item base types.
     """
 
-    all_item_base_types = await CRUD_itemBaseType.get(
-        db=db, filter_params=filter_params
+    if filter_params != FilterParams():
+        return await reference_cache.get_conditional_response(
+            request,
+            table_name=ItemBaseType.__tablename__,
+            load=lambda: CRUD_itemBaseType.get(db=db, filter_params=filter_params),
+            response_model=schemas.ItemBaseType | list[schemas.ItemBaseType],
+        )
+
+    return await reference_cache.get_response(
+        request,
+        name="all_item_base_types",
+        table_name=ItemBaseType.__tablename__,
+        load=lambda: CRUD_itemBaseType.get(db=db),
+        response_model=schemas.ItemBaseType | list[schemas.ItemBaseType],
     )
 
-    return all_item_base_types
-
 
 @router.post(
     "/",
@@ -96,7 +108,7 @@ async def create_item_base_type(
     itemBaseType: schemas.ItemBaseTypeCreate | list[schemas.ItemBaseTypeCreate],
     on_duplicate_pkey_do_nothing: bool | None = None,
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create one or a list of new item base types.
@@ -122,7 +134,7 @@ async def create_item_base_type(
 async def update_item_base_type(
     itemBaseTypeId: int,
     item_base_type_update: schemas.ItemBaseTypeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Update an item base type by key and value for "itemBaseTypeId".
@@ -147,7 +159,7 @@ async def update_item_base_type(
 )
 async def delete_item_base_type(
     itemBaseTypeId: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Delete an item base type by key and value for "itemBaseTypeId".
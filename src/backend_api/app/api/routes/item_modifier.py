@@ -1,15 +1,23 @@
+import io
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 import app.core.schemas as schemas
 from app.api.deps import (
+    get_async_db,
+    get_async_heavy_db,
+    get_async_heavy_sessionmaker,
     get_current_active_superuser,
-    get_db,
 )
-from app.api.params import FilterParams
+from app.api.params import CSV_REQUEST_BODY, ExportParams, FilterParams
+from app.core.models.models import Item as model_Item
+from app.core.models.models import ItemModifier as model_ItemModifier
 from app.crud import CRUD_itemModifier
+from app.utils.export import EXPORT_MEDIA_TYPES, filter_hours, stream_export
 
 router = APIRouter()
 
@@ -24,7 +32,7 @@ item_modifier_prefix = "itemModifier"
 )
 async def get_all_item_modifiers(
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all item modifiers.
@@ -37,6 +45,52 @@ async def get_all_item_modifiers(
     return all_itemModifiers
 
 
+@router.get(
+    "/export/",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def export_item_modifiers(
+    export_params: Annotated[ExportParams, Query()],
+    session_maker: async_sessionmaker[AsyncSession] = Depends(
+        get_async_heavy_sessionmaker
+    ),
+):
+    """
+    Export all item modifiers in a league, optionally in an hour range.
+
+    Streams the item modifiers as NDJSON or CSV, without loading all of them in memory.
+    """
+    statement = (
+        select(*model_ItemModifier.__table__.columns)
+        .join(model_Item, model_Item.itemId == model_ItemModifier.itemId)
+        .where(model_Item.leagueId == export_params.league_id)
+    )
+    # Filtering both hypertables on hours lets both exclude chunks
+    for created_hours_since_launch in (
+        model_ItemModifier.createdHoursSinceLaunch,
+        model_Item.createdHoursSinceLaunch,
+    ):
+        statement = filter_hours(
+            statement,
+            created_hours_since_launch,
+            start=export_params.start,
+            end=export_params.end,
+        )
+
+    return StreamingResponse(
+        stream_export(
+            statement,
+            session_maker=session_maker,
+            export_format=export_params.export_format,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_params.export_format],
+    )
+
+
 @router.post(
     "/",
     response_model=schemas.ItemModifierCreate | list[schemas.ItemModifierCreate] | None,
@@ -45,16 +99,39 @@ async def get_all_item_modifiers(
 async def create_item_modifier(
     itemModifier: schemas.ItemModifierCreate | list[schemas.ItemModifierCreate],
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    use_copy: bool | None = None,
+    db: AsyncSession = Depends(get_async_heavy_db),
 ):
     """
     Create one or a list item modifiers.
 
     Returns the created item modifier or list of item modifiers.
+
+    `use_copy` inserts with `COPY FROM STDIN`, which is faster for large lists.
     """
 
     return await CRUD_itemModifier.create(
         db=db,
         obj_in=itemModifier,
         return_nothing=return_nothing,
+        use_copy=use_copy,
     )
+
+
+@router.post(
+    "/csv/",
+    openapi_extra=CSV_REQUEST_BODY,
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def create_item_modifiers_from_csv(
+    request: Request,
+    db: AsyncSession = Depends(get_async_heavy_db),
+):
+    """
+    Create item modifiers from a CSV body, with the column names in the first row.
+
+    Skips validation per object. The columns are validated once, and each value is
+    parsed by the database while copying. Empty unquoted values are null.
+    """
+    csv_file = io.BytesIO(await request.body())
+    await CRUD_itemModifier.create_from_csv(db, csv_file=csv_file)
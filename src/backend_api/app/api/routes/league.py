@@ -1,15 +1,18 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.core.schemas as schemas
 from app.api.deps import (
+    get_async_db,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
 from app.api.params import FilterParams
+from app.core.cache.reference_cache import reference_cache
+from app.core.config import settings
+from app.core.models.models import League
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import (
     apply_ip_rate_limits,
@@ -35,12 +38,13 @@ league_prefix = "league"
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
+    lease=True,
 )
 async def get_league(
-    request: Request,  # noqa: ARG001
+    request: Request,
     response: Response,  # noqa: ARG001
     leagueId: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get league by key and value for "leagueId".
@@ -49,9 +53,13 @@ async def get_league(
     """
 
     league_map = {"leagueId": leagueId}
-    league = await CRUD_league.get(db=db, filter=league_map)
 
-    return league
+    return await reference_cache.get_conditional_response(
+        request,
+        table_name=League.__tablename__,
+        load=lambda: CRUD_league.get(db=db, filter=league_map),
+        response_model=schemas.League,
+    )
 
 
 @router.get(
@@ -63,12 +71,13 @@ async def get_league(
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
+    lease=True,
 )
 async def get_all_leagues(
-    request: Request,  # noqa: ARG001
+    request: Request,
     response: Response,  # noqa: ARG001
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all leagues.
@@ -76,9 +85,12 @@ async def get_all_leagues(
     Returns a list of all leagues.
     """
 
-    all_leagues = await CRUD_league.get(db=db, filter_params=filter_params)
-
-    return all_leagues
+    return await reference_cache.get_conditional_response(
+        request,
+        table_name=League.__tablename__,
+        load=lambda: CRUD_league.get(db=db, filter_params=filter_params),
+        response_model=schemas.League | list[schemas.League],
+    )
 
 
 @router.get(
@@ -93,11 +105,12 @@ async def get_all_leagues(
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
+    lease=True,
 )
 async def get_active_leagues(
-    request: Request,  # noqa: ARG001
+    request: Request,
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get leagues that are still valid/active
@@ -105,9 +118,15 @@ async def get_active_leagues(
     Always returns a list, but it may be empty.
     """
 
-    leagues = await CRUD_league.get_active_leagues(db=db)
-
-    return leagues
+    return await reference_cache.get_response(
+        request,
+        name="active_leagues",
+        table_name=League.__tablename__,
+        load=lambda: CRUD_league.get_active_leagues(db=db),
+        response_model=list[schemas.League],
+        expire_seconds=settings.REFERENCE_CACHE_ACTIVE_LEAGUE_EXPIRE_SECONDS,
+        version_etag=False,
+    )
 
 
 @router.post(
@@ -118,7 +137,7 @@ async def get_active_leagues(
 async def create_league(
     league: schemas.LeagueCreate | list[schemas.LeagueCreate],
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create one or a list of new leagues.
@@ -137,7 +156,7 @@ async def create_league(
 async def update_modifier(
     leagueId: int,
     league_update: schemas.LeagueUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Update a league by key and value for "leagueId"
@@ -3,11 +3,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
     UserCacheSession,
-    get_db,
+    get_async_db,
 )
 from app.core.config import settings
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
@@ -37,12 +37,12 @@ async def login_access_session(
     response: Response,  # noqa: ARG001
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     user_session_cache: UserCacheSession,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Token:
     """
     OAuth2 compatible session login.
     """
-    user = CRUD_user.authenticate(
+    user = await CRUD_user.authenticate(
         db=db, email_or_username=form_data.username, password=form_data.password
     )
 
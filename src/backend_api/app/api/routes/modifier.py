@@ -1,18 +1,19 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.core.schemas as schemas
 from app.api.api_message_util import (
     get_delete_return_msg,
 )
 from app.api.deps import (
+    get_async_db,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
 from app.api.params import FilterParams
+from app.core.cache.reference_cache import reference_cache
 from app.core.models.models import Modifier
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import (
@@ -42,7 +43,7 @@ async def get_modifier(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     modifierId: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get modifier or list of modifiers by key and
@@ -69,12 +70,13 @@ async def get_modifier(
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
+    lease=True,
 )
 async def get_all_modifiers(
-    request: Request,  # noqa: ARG001
+    request: Request,
     response: Response,  # noqa: ARG001
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all modifiers.
@@ -82,9 +84,21 @@ async def get_all_modifiers(
     Returns a list of all modifiers.
     """
 
-    all_modifiers = await CRUD_modifier.get(db=db, filter_params=filter_params)
-
-    return all_modifiers
+    if filter_params != FilterParams():
+        return await reference_cache.get_conditional_response(
+            request,
+            table_name=Modifier.__tablename__,
+            load=lambda: CRUD_modifier.get(db=db, filter_params=filter_params),
+            response_model=schemas.Modifier | list[schemas.Modifier],
+        )
+
+    return await reference_cache.get_response(
+        request,
+        name="all_modifiers",
+        table_name=Modifier.__tablename__,
+        load=lambda: CRUD_modifier.get(db=db),
+        response_model=schemas.Modifier | list[schemas.Modifier],
+    )
 
 
 @router.get(
@@ -97,11 +111,12 @@ async def get_all_modifiers(
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
     rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
+    lease=True,
 )
 async def get_grouped_modifier_by_effect(
-    request: Request,  # noqa: ARG001
+    request: Request,
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all grouped modifiers by effect.
@@ -109,12 +124,15 @@ async def get_grouped_modifier_by_effect(
     Returns a list of all grouped modifiers by effect.
     """
 
-    all_grouped_modifiers_by_effect = (
-        await CRUD_modifier.get_grouped_modifier_by_effect(db=db)
+    return await reference_cache.get_response(
+        request,
+        name="grouped_modifiers_by_effect",
+        table_name=Modifier.__tablename__,
+        load=lambda: CRUD_modifier.get_grouped_modifier_by_effect(db=db),
+        response_model=schemas.GroupedModifierByEffect
+        | list[schemas.GroupedModifierByEffect],
     )
 
-    return all_grouped_modifiers_by_effect
-
 
 @router.post(
     "/",
@@ -124,7 +142,7 @@ async def get_grouped_modifier_by_effect(
 async def create_modifier(
     modifier: schemas.ModifierCreate | list[schemas.ModifierCreate],
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Create one or a list of new modifiers.
@@ -146,7 +164,7 @@ async def update_modifier(
     modifierId: int,
     position: int,
     modifier_update: schemas.ModifierUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Update a modifier by key and value for "modifierId" and "position"
@@ -172,7 +190,7 @@ async def update_modifier(
 async def delete_modifier(
     modifierId: int,
     position: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Delete a modifier by key and value for "modifierId"
@@ -1,20 +1,40 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
-    get_async_db,
+    get_async_heavy_db,
     get_user_ip_from_header,
 )
 from app.core.rate_limit.custom_rate_limiter import RateSpec
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import apply_custom_rate_limit
-from app.core.schemas.plot import PlotData, PlotQuery
-from app.plotting import configure_plotter_by_query, plotter_service
+from app.core.schemas.plot import (
+    BatchPlotQuery,
+    ColumnarPlotData,
+    PlotData,
+    PlotQuery,
+)
+from app.plotting import (
+    PLOT_COLUMNAR_MEDIA_TYPE,
+    accepts_columnar_plot_data,
+    configure_plotter_by_query,
+    plotter_service,
+    to_columnar_plot_data,
+)
 
 router = APIRouter()
 
 plot_prefix = "plot"
 
+# Plot data is sent in the representation picked by `Accept`
+_VARY_HEADERS = {"Vary": "Accept"}
+
+# Plot data is built without validation, and serialized straight into the response.
+# `response_model` only documents the routes, as returned responses skip it.
+_batch_plot_data_adapter = TypeAdapter(list[PlotData | None])
+_batch_columnar_plot_data_adapter = TypeAdapter(list[ColumnarPlotData | None])
+
 
 def _get_ratespec_ip(request: Request) -> tuple[RateSpec, str]:
     request_limit = rate_limit_settings.TIER_0_PLOT_RATE_LIMIT
@@ -30,17 +50,26 @@ def _get_ratespec_ip(request: Request) -> tuple[RateSpec, str]:
 @router.post(
     "/",
     response_model=PlotData,
+    responses={
+        200: {
+            "content": {PLOT_COLUMNAR_MEDIA_TYPE: {}},
+            "description": f"`PlotData`, or `ColumnarPlotData` with `Accept: {PLOT_COLUMNAR_MEDIA_TYPE}`",
+        }
+    },
 )
 async def get_plot_data(
     request: Request,
     query: PlotQuery,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_heavy_db),
 ):
     """
     Takes a query based on the 'PlotQuery' schema and retrieves data
     to be used for plotting in the format of the 'PlotData' schema.
 
     The 'PlotQuery' schema allows for modifier restriction and item specifications.
+
+    Send `Accept: application/vnd.pom.plot.columnar+json` to get the data in the
+    'ColumnarPlotData' schema instead, with one array per field and league.
     """
 
     rate_spec, client_ip = _get_ratespec_ip(request)
@@ -49,6 +78,7 @@ async def get_plot_data(
         unique_key="plot_" + client_ip,
         rate_spec=rate_spec,
         prefix=plot_prefix,
+        lease=True,
     ):
         plotter = configure_plotter_by_query(query)
         plot_data = await plotter_service.plot(
@@ -56,4 +86,67 @@ async def get_plot_data(
             db,
             query=query,
         )
-        return plot_data
+        if accepts_columnar_plot_data(request.headers.get("accept")):
+            return Response(
+                content=to_columnar_plot_data(plot_data).model_dump_json(),
+                media_type=PLOT_COLUMNAR_MEDIA_TYPE,
+                headers=_VARY_HEADERS,
+            )
+        return Response(
+            content=plot_data.model_dump_json(),
+            media_type="application/json",
+            headers=_VARY_HEADERS,
+        )
+
+
+@router.post(
+    "/batch",
+    response_model=list[PlotData | None],
+    responses={
+        200: {
+            "content": {PLOT_COLUMNAR_MEDIA_TYPE: {}},
+            "description": f"List of `PlotData`, or `ColumnarPlotData` with `Accept: {PLOT_COLUMNAR_MEDIA_TYPE}`. `null` for queries without matching data",
+        }
+    },
+)
+async def get_batch_plot_data(
+    request: Request,
+    batch_query: BatchPlotQuery,
+    db: AsyncSession = Depends(get_async_heavy_db),
+):
+    """
+    Takes multiple queries based on the 'PlotQuery' schema and retrieves one
+    'PlotData' per query, in the same order as the queries.
+
+    Queries that only differ in `wantedModifiers` are plotted together. The
+    whole batch counts as one plot request towards the rate limit.
+
+    Queries without matching data get `null` instead of failing the whole batch.
+    """
+
+    rate_spec, client_ip = _get_ratespec_ip(request)
+
+    async with apply_custom_rate_limit(
+        unique_key="plot_" + client_ip,
+        rate_spec=rate_spec,
+        prefix=plot_prefix,
+        lease=True,
+    ):
+        plot_data = await plotter_service.plot_batch(db, batch_query.queries)
+        if accepts_columnar_plot_data(request.headers.get("accept")):
+            columnar_plot_data = [
+                to_columnar_plot_data(query_plot_data)
+                if query_plot_data is not None
+                else None
+                for query_plot_data in plot_data
+            ]
+            return Response(
+                content=_batch_columnar_plot_data_adapter.dump_json(columnar_plot_data),
+                media_type=PLOT_COLUMNAR_MEDIA_TYPE,
+                headers=_VARY_HEADERS,
+            )
+        return Response(
+            content=_batch_plot_data_adapter.dump_json(plot_data),
+            media_type="application/json",
+            headers=_VARY_HEADERS,
+        )
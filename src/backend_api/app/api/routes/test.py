@@ -3,11 +3,11 @@ from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import insert
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
+    get_async_db,
     get_current_active_superuser,
-    get_db,
 )
 from app.core.config import settings
 from app.core.models.models import Item as model_Item
@@ -23,7 +23,7 @@ router = APIRouter()
 test_prefix = "test"
 
 
-def bulk_insert_raw_sql(db: Session, count: int):
+async def bulk_insert_raw_sql(db: AsyncSession, count: int):
     """Generate dummy data for `count` objects"""
     data = [
         ItemCreate(
@@ -40,10 +40,9 @@ def bulk_insert_raw_sql(db: Session, count: int):
 
     # Prepare the raw SQL statement for bulk insert
     create_stmt = insert(model_Item)
-    db.execute(create_stmt, data)
-
     # Execute the raw SQL with all accounts data
-    db.commit()
+    async with db.begin():
+        await db.execute(create_stmt, data)
 
 
 @router.post(
@@ -55,7 +54,7 @@ def bulk_insert_raw_sql(db: Session, count: int):
 )
 async def bulk_insert_test(
     count: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Can only be used in `settings.ENVIRONMENT=local` environment.
@@ -71,7 +70,7 @@ async def bulk_insert_test(
 
     try:
         # Perform the bulk insert
-        bulk_insert_raw_sql(db, count)
+        await bulk_insert_raw_sql(db, count)
         return {"message": "Successfully bulk inserted data."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Bulk insert failed: {str(e)}")
@@ -82,7 +81,9 @@ async def bulk_insert_test(
     dependencies=[Depends(get_current_active_superuser)],
     response_model=list[str],
 )
-async def bulk_insert_users_and_verify(count: int, db: Session = Depends(get_db)):
+async def bulk_insert_users_and_verify(
+    count: int, db: AsyncSession = Depends(get_async_db)
+):
     """
     Can only be used in `settings.ENVIRONMENT=local` environment.
 
@@ -115,7 +116,7 @@ async def bulk_insert_users_and_verify(count: int, db: Session = Depends(get_db)
     filtered_users = [
         user
         for user in users_create
-        if CRUD_user.get(db, filter={"email": user.email}) is None
+        if await CRUD_user.get(db, filter={"email": user.email}) is None
     ]
 
     try:
@@ -123,8 +124,8 @@ async def bulk_insert_users_and_verify(count: int, db: Session = Depends(get_db)
             logger.debug("No users to insert")
         else:
             create_stmt = insert(model_User)
-            db.execute(create_stmt, filtered_users)
-            db.commit()
+            async with db.begin():
+                await db.execute(create_stmt, filtered_users)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Bulk insert failed: {str(e)}")
 
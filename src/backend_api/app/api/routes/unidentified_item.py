@@ -1,19 +1,26 @@
+import io
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 import app.core.schemas as schemas
 from app.api.deps import (
+    get_async_db,
+    get_async_heavy_db,
+    get_async_heavy_sessionmaker,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
-from app.api.params import FilterParams
+from app.api.params import CSV_REQUEST_BODY, ExportParams, FilterParams
+from app.core.cache.plot_cache import plot_cache
+from app.core.models.models import UnidentifiedItem as model_UnidentifiedItem
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
 from app.core.rate_limit.rate_limiters import apply_user_rate_limits
 from app.crud import CRUD_unidentifiedItem
+from app.utils.export import EXPORT_MEDIA_TYPES, filter_hours, stream_export
 
 router = APIRouter()
 
@@ -36,7 +43,7 @@ unidentified_item_prefix = "unidentifiedItem"
 async def get_latest_item_id(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get the latest "itemId"
@@ -44,9 +51,10 @@ async def get_latest_item_id(
     Can only be used safely on an empty table or directly after an insertion.
     """
 
-    result = db.execute(
-        text("""SELECT MAX("itemId") FROM unidentified_item""")
-    ).fetchone()
+    async with db.begin():
+        result = (
+            await db.execute(text("""SELECT MAX("itemId") FROM unidentified_item"""))
+        ).fetchone()
     if not result or not result[0]:
         return None
 
@@ -60,7 +68,7 @@ async def get_latest_item_id(
 )
 async def get_all_items(
     filter_params: Annotated[FilterParams, Query()],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all items.
@@ -73,6 +81,45 @@ async def get_all_items(
     return all_items
 
 
+@router.get(
+    "/export/",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def export_unidentified_items(
+    export_params: Annotated[ExportParams, Query()],
+    session_maker: async_sessionmaker[AsyncSession] = Depends(
+        get_async_heavy_sessionmaker
+    ),
+):
+    """
+    Export all unidentified items in a league, optionally in an hour range.
+
+    Streams the unidentified items as NDJSON or CSV, without loading all of them in memory.
+    """
+    statement = select(*model_UnidentifiedItem.__table__.columns).where(
+        model_UnidentifiedItem.leagueId == export_params.league_id
+    )
+    statement = filter_hours(
+        statement,
+        model_UnidentifiedItem.createdHoursSinceLaunch,
+        start=export_params.start,
+        end=export_params.end,
+    )
+
+    return StreamingResponse(
+        stream_export(
+            statement,
+            session_maker=session_maker,
+            export_format=export_params.export_format,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_params.export_format],
+    )
+
+
 @router.post(
     "/",
     response_model=schemas.UnidentifiedItemCreate
@@ -83,17 +130,43 @@ async def get_all_items(
 async def create_item(
     item: schemas.UnidentifiedItemCreate | list[schemas.UnidentifiedItemCreate],
     return_nothing: bool | None = None,
-    db: Session = Depends(get_db),
+    use_copy: bool | None = None,
+    db: AsyncSession = Depends(get_async_heavy_db),
 ):
     """
     Create one or a list of new items.
 
     Returns the created item or list of items.
+
+    `use_copy` inserts with `COPY FROM STDIN`, which is faster for large lists.
     """
 
-    return await CRUD_unidentifiedItem.create(
-        db=db, obj_in=item, return_nothing=return_nothing
+    created_items = await CRUD_unidentifiedItem.create(
+        db=db, obj_in=item, return_nothing=return_nothing, use_copy=use_copy
     )
+    await plot_cache.register_league_hours(item if isinstance(item, list) else [item])
+
+    return created_items
+
+
+@router.post(
+    "/csv/",
+    openapi_extra=CSV_REQUEST_BODY,
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def create_unidentified_items_from_csv(
+    request: Request,
+    db: AsyncSession = Depends(get_async_heavy_db),
+):
+    """
+    Create unidentified items from a CSV body, with the column names in the first row.
+
+    Skips validation per object. The columns are validated once, and each value is
+    parsed by the database while copying. Empty unquoted values are null.
+    """
+    csv_file = io.BytesIO(await request.body())
+    await CRUD_unidentifiedItem.create_from_csv(db, csv_file=csv_file)
+    await plot_cache.register_csv_league_hours(csv_file)
 
 
 @router.get(
@@ -102,7 +175,7 @@ async def create_item(
     dependencies=[Depends(get_current_active_superuser)],
 )
 async def get_non_aggregated(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get the non aggregated unidentified items for the last 10 recorded hours
@@ -120,7 +193,7 @@ async def get_non_aggregated(
 )
 async def add_aggregated(
     aggregated_objs: list[schemas.UnidentifiedItemCreate],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Deletes the non aggregated unidentified items for the last 10 recorded hours
@@ -129,3 +202,4 @@ async def add_aggregated(
     """
 
     await CRUD_unidentifiedItem.add_aggregated(db=db, aggregated_objs=aggregated_objs)
+    await plot_cache.register_league_hours(aggregated_objs)
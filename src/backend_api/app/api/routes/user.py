@@ -2,7 +2,7 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.api_message_util import (
     get_activation_token_confirmation_sent_msg,
@@ -20,10 +20,11 @@ from app.api.deps import (
     CurrentUserNotActive,
     UserCacheRegisterSession,
     UserCacheUpdateMeSession,
+    get_async_db,
     get_current_active_superuser,
     get_current_active_user,
-    get_db,
 )
+from app.core.cache.user_cache import UserCache
 from app.core.config import settings
 from app.core.models.models import User
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
@@ -77,13 +78,13 @@ user_prefix = "user"
     response_model=UsersPublic,
 )
 async def get_all_users(
-    db: Session = Depends(get_db), skip: int = 0, limit: int = 100
+    db: AsyncSession = Depends(get_async_db), skip: int = 0, limit: int = 100
 ) -> Any:
     """
     Retrieve all users.
     """
 
-    users_public = CRUD_user.get_all(db, skip=skip, limit=limit)
+    users_public = await CRUD_user.get_all(db, skip=skip, limit=limit)
 
     return users_public
 
@@ -93,14 +94,14 @@ async def get_all_users(
 )
 async def create(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_in: UserCreate,
     background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Create new user.
     """
-    user = CRUD_user.create(db=db, user_create=user_in)
+    user = await CRUD_user.create(db=db, user_create=user_in)
     if settings.emails_enabled and user_in.email:
         email_data = generate_new_account_email(
             email_to=user_in.email, username=user_in.username
@@ -129,7 +130,7 @@ async def update_me_email_send_confirmation(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_cache_update_me: UserCacheUpdateMeSession,
     user_update_me_email: UserUpdateMe,
     current_user: CurrentUser,
@@ -146,7 +147,7 @@ async def update_me_email_send_confirmation(
         raise UpdateExisitingMeValuesError(
             function_name=update_me_email_send_confirmation.__name__,
         )
-    CRUD_user.check_exists_raise(
+    await CRUD_user.check_exists_raise(
         db,
         filter={"email": user_update_me_email.email},
     )
@@ -193,7 +194,7 @@ async def update_me_email_confirmation(
     current_user: CurrentUser,
     user_cache_update_me: UserCacheUpdateMeSession,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Message:
     """
     Confirm update email.
@@ -209,7 +210,7 @@ async def update_me_email_confirmation(
         raise UpdateExisitingMeValuesError(
             function_name=update_me_email_confirmation.__name__,
         )
-    CRUD_user.check_exists_raise(
+    await CRUD_user.check_exists_raise(
         db,
         filter={"email": update_email},
     )
@@ -225,13 +226,14 @@ async def update_me_email_confirmation(
             subject=email_data.subject,
             html_content=email_data.html_content,
         )
-    CRUD_user.update(
+    await CRUD_user.update(
         db,
         user_id=current_user.userId,
         user_in=UserUpdateMe(
             email=update_email,
         ),
     )
+    await UserCache.invalidate_user(current_user.userId)
 
     return get_user_update_me_success_msg(email_or_username=update_email)
 
@@ -249,7 +251,7 @@ async def update_me_username(
     response: Response,  # noqa: ARG001
     user_update_me_username: UserUpdateMe,
     current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Message:
     """
     Update username. Can only be used by users once a month.
@@ -262,17 +264,18 @@ async def update_me_username(
         raise UpdateExisitingMeValuesError(
             function_name=update_me_username.__name__,
         )
-    CRUD_user.check_exists_raise(
+    await CRUD_user.check_exists_raise(
         db,
         filter={"username": user_update_me_username.username},
     )
-    CRUD_user.update(
+    await CRUD_user.update(
         db,
         user_id=current_user.userId,
         user_in=UserUpdateMe(
             username=user_update_me_username.username,
         ),
     )
+    await UserCache.invalidate_user(current_user.userId)
 
     return get_user_update_me_success_msg(
         email_or_username=user_update_me_username.username
@@ -294,7 +297,7 @@ async def check_username_exists(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     username: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> bool:
     """
     Checks if username exists in the db.
@@ -302,7 +305,7 @@ async def check_username_exists(
     Returns `True` if the user exists, else `False`
     """
     try:
-        CRUD_user.check_exists_raise(
+        await CRUD_user.check_exists_raise(
             db,
             filter={"username": username},
         )
@@ -327,7 +330,7 @@ async def update_password_me(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     body: UpdatePassword,
     current_user: CurrentUser,
     background_tasks: BackgroundTasks,
@@ -335,7 +338,7 @@ async def update_password_me(
     """
     Update own password.
     """
-    CRUD_user.update_password(
+    await CRUD_user.update_password(
         db=db,
         db_user=current_user,
         body=body,
@@ -392,7 +395,7 @@ async def delete_user_me(
     request: Request,  # noqa: ARG001
     response: Response,  # noqa: ARG001
     current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Message:
     """
     Delete own user.
@@ -401,8 +404,9 @@ async def delete_user_me(
         raise SuperUserNotAllowedToDeleteSelfError(
             function_name=delete_user_me.__name__,
         )
-    db.delete(current_user)
-    db.commit()
+    async with db.begin():
+        await db.delete(current_user)
+    await UserCache.invalidate_user(current_user.userId)
     return get_delete_return_msg(
         model_table_name=User.__tablename__, filter={"userId": current_user.userId}
     )
@@ -421,15 +425,15 @@ async def register_user_send_confirmation(
     user_register_pre_confirmed: UserRegisterPreEmailConfirmation,
     user_cache_register_user: UserCacheRegisterSession,
     background_task: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Send email confirmation on user register. Account doesn't get created yet.
     """
-    CRUD_user.check_exists_raise(
+    await CRUD_user.check_exists_raise(
         db, filter={"email": user_register_pre_confirmed.email}
     )
-    CRUD_user.check_exists_raise(
+    await CRUD_user.check_exists_raise(
         db, filter={"username": user_register_pre_confirmed.username}
     )
 
@@ -440,7 +444,7 @@ async def register_user_send_confirmation(
         isActive=False,
     )
 
-    user = CRUD_user.create(db=db, user_create=user_create)
+    user = await CRUD_user.create(db=db, user_create=user_create)
 
     user_register_token = await user_cache_register_user.create_user_cache_instance(
         user=user, expire_seconds=settings.EMAIL_RESET_TOKEN_EXPIRE_SECONDS
@@ -476,7 +480,7 @@ async def register_user_confirm(
     response: Response,  # noqa: ARG001
     token: Token,
     user_cache_register_user: UserCacheRegisterSession,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Confirm new user without the need to be logged in. Requires email confirmation.
@@ -489,9 +493,10 @@ async def register_user_confirm(
             function_name=register_user_confirm.__name__,
         )
 
-    user_db = CRUD_user.get(db, filter={"email": email})
+    user_db = await CRUD_user.get(db, filter={"email": email})
 
-    user = CRUD_user.set_active(db=db, user_id=user_db.userId, active=True)
+    user = await CRUD_user.set_active(db=db, user_id=user_db.userId, active=True)
+    await UserCache.invalidate_user(user_db.userId)
 
     return get_user_successfully_registered_msg(
         username=user.username, email=user.email
@@ -514,13 +519,13 @@ async def get_user_by_id(
     response: Response,  # noqa: ARG001
     user_id: uuid.UUID,
     current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Any:
     """
     Get a specific user by id.
     """
     get_user_filter = {"userId": user_id}
-    db_user = CRUD_user.get(db, filter=get_user_filter)
+    db_user = await CRUD_user.get(db, filter=get_user_filter)
     if not db_user:
         raise DbObjectDoesNotExistError(
             model_table_name=User.__tablename__,
@@ -541,9 +546,9 @@ async def get_user_by_id(
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UserPublic,
 )
-def update_user(
+async def update_user(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: uuid.UUID,
     user_in: UserUpdate,
 ) -> Any:
@@ -551,7 +556,8 @@ def update_user(
     Update a user.
     """
 
-    db_user = CRUD_user.update(db=db, user_id=user_id, user_in=user_in)
+    db_user = await CRUD_user.update(db=db, user_id=user_id, user_in=user_in)
+    await UserCache.invalidate_user(user_id)
     return db_user
 
 
@@ -563,13 +569,13 @@ def update_user(
 async def delete_user(
     current_user: CurrentUser,
     user_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Message:
     """
     Delete a user.
     """
     delete_user_fiter = {"userId": user_id}
-    db_user = CRUD_user.get(db, filter=delete_user_fiter)
+    db_user = await CRUD_user.get(db, filter=delete_user_fiter)
     if not db_user:
         raise DbObjectDoesNotExistError(
             model_table_name=User.__tablename__,
@@ -580,8 +586,9 @@ async def delete_user(
         raise SuperUserNotAllowedToDeleteSelfError(
             function_name=delete_user.__name__,
         )
-    db.delete(db_user)
-    db.commit()
+    async with db.begin():
+        await db.delete(db_user)
+    await UserCache.invalidate_user(user_id)
     return get_delete_return_msg(
         model_table_name=User.__tablename__, filter=delete_user_fiter
     )
@@ -598,12 +605,12 @@ async def change_is_active_user(
     current_user: CurrentUser,
     user_id: uuid.UUID,
     is_active: bool,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Message:
     """
     Change activity to current user.
     """
-    db_user = CRUD_user.get(db, filter={"userId": user_id})
+    db_user = await CRUD_user.get(db, filter={"userId": user_id})
     if not db_user:
         raise DbObjectDoesNotExistError(
             model_table_name=User.__tablename__,
@@ -614,7 +621,8 @@ async def change_is_active_user(
         raise SuperUserNotAllowedToChangeActiveSelfError(
             function_name=change_is_active_user.__name__,
         )
-    CRUD_user.set_active(db, user_id=user_id, active=is_active)
+    await CRUD_user.set_active(db, user_id=user_id, active=is_active)
+    await UserCache.invalidate_user(user_id)
     return get_user_active_change_msg(db_user.username, is_active)
 
 
@@ -628,12 +636,12 @@ async def set_rate_limit_tier_user(
     response: Response,  # noqa: ARG001
     user_id: uuid.UUID,
     rate_limit_tier: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Message:
     """
     Set rate limit tier to current user.
     """
-    db_user = CRUD_user.get(db, filter={"userId": user_id})
+    db_user = await CRUD_user.get(db, filter={"userId": user_id})
     if not db_user:
         raise DbObjectDoesNotExistError(
             model_table_name=User.__tablename__,
@@ -641,7 +649,8 @@ async def set_rate_limit_tier_user(
             function_name=set_rate_limit_tier_user.__name__,
         )
     user_update = UserUpdate(rateLimitTier=rate_limit_tier)
-    CRUD_user.update(db=db, user_id=user_id, user_in=user_update)
+    await CRUD_user.update(db=db, user_id=user_id, user_in=user_update)
+    await UserCache.invalidate_user(user_id)
     return get_set_rate_limit_tier_success_msg(db_user.username, rate_limit_tier)
 
 
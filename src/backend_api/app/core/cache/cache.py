@@ -1,5 +1,15 @@
 import redis.asyncio as Redis
 
 from app.core.config import settings
+from app.core.models.pool_metrics import TimedBlockingConnectionPool
 
-cache = Redis.from_url(str(settings.CACHE_URI), decode_responses=True)
+# Connections are opened on first use, and the pools are closed on shutdown,
+# see `lifespan` in `app.main`. Clients never close the pool themselves.
+cache_pool = TimedBlockingConnectionPool.from_url(
+    str(settings.CACHE_URI),
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+    decode_responses=True,
+)
+
+cache = Redis.Redis(connection_pool=cache_pool)
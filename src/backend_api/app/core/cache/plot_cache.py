@@ -0,0 +1,222 @@
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import IO, Any, Protocol
+
+import pandas as pd
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache.cache import cache
+from app.core.config import settings
+from app.core.schemas.plot import PlotData, PlotQuery
+from app.logs.logger import plot_logger
+
+
+class _HasLeagueHour(Protocol):
+    leagueId: int
+    createdHoursSinceLaunch: int
+
+
+class PlotCache:
+    """
+    Some PlotCache mechanics:
+
+    Plot data only changes when rows with a new `createdHoursSinceLaunch` land for a league.
+    The latest ingested hour per league is kept in a sorted set (`league_hour_key`), which
+    is only ever moved forward.
+
+    Format of a cached plot key is '*plot:{league_hours}:{query_hash}*'
+
+    `league_hours` holds the latest hour of every league in the query, so when ingestion
+    registers a newer hour for a league, every entry containing that league is no longer
+    reachable and expires on its own.
+
+    Format of a cached plot rows key is '*plot_rows:{query_hash}*'
+
+    Plot rows are the per hour aggregate rows of a query, used for incremental plotting.
+    They stay valid across hours, so `end` is left out of their `query_hash`.
+    """
+
+    key_prefix = "plot"
+    rows_key_prefix = "plot_rows"
+    league_hour_key = "plot_league_hour"
+
+    def __init__(
+        self,
+        *,
+        expire_seconds: int = settings.PLOT_CACHE_EXPIRE_SECONDS,
+        rows_expire_seconds: int = settings.PLOT_INCREMENTAL_EXPIRE_SECONDS,
+        enabled: bool = settings.PLOT_CACHE_ENABLED,
+    ) -> None:
+        self.expire_seconds = expire_seconds
+        self.rows_expire_seconds = rows_expire_seconds
+        self.enabled = enabled
+
+    @staticmethod
+    def _drop_empty(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            dropped = {key: PlotCache._drop_empty(value) for key, value in obj.items()}
+            return {
+                key: value
+                for key, value in dropped.items()
+                if value is not None and value != {} and value != []
+            }
+        if isinstance(obj, list):
+            return [PlotCache._drop_empty(value) for value in obj]
+        return obj
+
+    @staticmethod
+    def _sort_key(obj: dict[str, Any]) -> str:
+        return json.dumps(obj, sort_keys=True)
+
+    @staticmethod
+    def get_league_ids(query: PlotQuery) -> list[int]:
+        if isinstance(query.leagueId, list):
+            return sorted(set(query.leagueId))
+        return [query.leagueId]
+
+    @classmethod
+    def normalize_query(cls, query: PlotQuery) -> dict[str, Any]:
+        """
+        Canonical form of the plot query. Queries that result in the same
+        plot statement have the same canonical form.
+
+        ``leagueId`` is always a sorted list, ``wantedModifiers`` and their
+        ``modifierLimitations`` are sorted, null fields and the default
+        ``resolution`` are dropped.
+        """
+        query_dict = query.model_dump(exclude_none=True)
+        query_dict["leagueId"] = cls.get_league_ids(query)
+        if query_dict.get("resolution") == "1h":
+            # Hourly is the default resolution
+            query_dict.pop("resolution")
+
+        wanted_modifiers = query_dict.get("wantedModifiers")
+        if wanted_modifiers:
+            for wanted_modifier in wanted_modifiers:
+                modifier_limitations = wanted_modifier.get("modifierLimitations")
+                if modifier_limitations:
+                    wanted_modifier["modifierLimitations"] = sorted(
+                        modifier_limitations, key=cls._sort_key
+                    )
+            query_dict["wantedModifiers"] = sorted(wanted_modifiers, key=cls._sort_key)
+
+        return cls._drop_empty(query_dict)
+
+    @classmethod
+    def hash_query(cls, query: PlotQuery) -> str:
+        normalized_query = json.dumps(
+            cls.normalize_query(query), sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(normalized_query.encode("utf-8")).hexdigest()
+
+    async def _get_league_hours(self, league_ids: list[int]) -> list[float | None]:
+        return await cache.zmscore(self.league_hour_key, league_ids)
+
+    async def _create_cache_key(self, query: PlotQuery) -> str:
+        league_ids = self.get_league_ids(query)
+        league_hours = await self._get_league_hours(league_ids)
+        league_hours_format = ",".join(
+            f"{league_id}-{int(hour) if hour is not None else 'none'}"
+            for league_id, hour in zip(league_ids, league_hours, strict=True)
+        )
+        return f"{self.key_prefix}:{league_hours_format}:{self.hash_query(query)}"
+
+    async def get(self, query: PlotQuery) -> PlotData | None:
+        """Get cached plot data for the query. Returns None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            cache_key = await self._create_cache_key(query)
+            cached_plot_data = await cache.get(cache_key)
+        except Exception as e:
+            plot_logger.warning(f"Could not read plot from cache: {e}")
+            return None
+
+        if cached_plot_data is None:
+            return None
+
+        plot_logger.debug(f"Plot cache hit for key {cache_key}")
+        return PlotData.model_validate_json(cached_plot_data)
+
+    async def set(self, query: PlotQuery, plot_data: PlotData) -> None:
+        """Store plot data for the query"""
+        if not self.enabled:
+            return
+        try:
+            cache_key = await self._create_cache_key(query)
+            await cache.set(
+                name=cache_key,
+                value=plot_data.model_dump_json(),
+                ex=self.expire_seconds,
+            )
+        except Exception as e:
+            plot_logger.warning(f"Could not store plot in cache: {e}")
+
+    def _create_rows_cache_key(self, query: PlotQuery) -> str:
+        query_without_end = query.model_copy(update={"end": None})
+        return f"{self.rows_key_prefix}:{self.hash_query(query_without_end)}"
+
+    async def get_rows(self, query: PlotQuery) -> str | None:
+        """Get cached per hour plot rows as a JSON records string. Returns None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            return await cache.get(self._create_rows_cache_key(query))
+        except Exception as e:
+            plot_logger.warning(f"Could not read plot rows from cache: {e}")
+            return None
+
+    async def set_rows(self, query: PlotQuery, rows: str) -> None:
+        """Store per hour plot rows as a JSON records string"""
+        if not self.enabled:
+            return
+        try:
+            await cache.set(
+                name=self._create_rows_cache_key(query),
+                value=rows,
+                ex=self.rows_expire_seconds,
+            )
+        except Exception as e:
+            plot_logger.warning(f"Could not store plot rows in cache: {e}")
+
+    async def register_league_hours(self, objs: Iterable[_HasLeagueHour]) -> None:
+        """
+        Registers the latest `createdHoursSinceLaunch` per league of newly ingested rows.
+
+        Moving the hour of a league forward invalidates all cached plots for that league.
+        """
+        if not self.enabled:
+            return
+        latest_hours: dict[int, int] = {}
+        for obj in objs:
+            latest_hours[obj.leagueId] = max(
+                obj.createdHoursSinceLaunch, latest_hours.get(obj.leagueId, 0)
+            )
+        if not latest_hours:
+            return
+        try:
+            await cache.zadd(self.league_hour_key, latest_hours, gt=True)
+        except Exception as e:
+            plot_logger.warning(f"Could not register league hours in plot cache: {e}")
+
+    async def register_csv_league_hours(self, csv_file: IO[bytes]) -> None:
+        "Registers the league hours of rows ingested from a CSV file, parsing two columns"
+        if not self.enabled:
+            return
+        # Parsing is CPU bound, so it runs outside of the event loop
+        league_hours = await run_in_threadpool(_read_csv_league_hours, csv_file)
+        await self.register_league_hours(league_hours.itertuples(index=False))
+
+
+def _read_csv_league_hours(csv_file: IO[bytes]) -> pd.DataFrame:
+    csv_file.seek(0)
+    return (
+        pd.read_csv(csv_file, usecols=["leagueId", "createdHoursSinceLaunch"])
+        .groupby("leagueId", as_index=False)
+        .max()
+        .astype(object)  # Python ints for redis
+    )
+
+
+plot_cache = PlotCache()
@@ -0,0 +1,298 @@
+import asyncio
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+from uuid import uuid4
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.core.cache.cache import cache
+from app.core.config import settings
+from app.logs.logger import logger
+
+
+@dataclass
+class ReferenceEntry:
+    table_name: str
+    version: str | None
+    content: bytes
+    etag: str
+    loaded_at: float
+
+
+def _create_etag_headers(etag: str) -> dict[str, str]:
+    # Clients may store the response, but must revalidate it on every use
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+@functools.cache
+def _get_type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def _dump_json(response_model: Any, data: Any) -> bytes:
+    "Serializes `data` like a route with `response_model` would, ORM objects included"
+    type_adapter = _get_type_adapter(response_model)
+    return type_adapter.dump_json(
+        type_adapter.validate_python(data, from_attributes=True), by_alias=True
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    "Weak comparison of an `If-None-Match` header against an ETag"
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ReferenceCache:
+    """
+    Some ReferenceCache mechanics:
+
+    Reference tables only change when `data_deposit` runs. Datasets read from them are
+    kept in process as serialized JSON responses, together with a strong ETag.
+
+    Every write to a reference table replaces the version of the table with a random token.
+    Format of a version key is '*reference_version:{table_name}*'
+
+    A dataset is reloaded when the version of its table has changed since it was loaded.
+    Versions are read at most every `version_check_seconds`, so writes from other
+    workers are picked up within that time. Writes in this process drop the
+    datasets of the table right away.
+
+    ETags are derived from the version and the dataset, so a matching `If-None-Match`
+    is answered without loading the dataset. Random tokens, unlike counters, never
+    repeat if redis loses its data. Without a version (redis is unavailable), the ETag
+    is a hash of the serialized dataset.
+
+    Datasets are reloaded after `expire_seconds` regardless, in case redis is unavailable.
+    """
+
+    key_prefix = "reference_version"
+
+    def __init__(
+        self,
+        *,
+        expire_seconds: int = settings.REFERENCE_CACHE_EXPIRE_SECONDS,
+        version_check_seconds: int = settings.REFERENCE_CACHE_VERSION_CHECK_SECONDS,
+        enabled: bool = settings.REFERENCE_CACHE_ENABLED,
+    ) -> None:
+        self.expire_seconds = expire_seconds
+        self.version_check_seconds = version_check_seconds
+        self.enabled = enabled
+        self._entries: dict[str, ReferenceEntry] = {}
+        self._versions: dict[str, str | None] = {}
+        self._versions_checked_at: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _create_version_key(self, table_name: str) -> str:
+        return f"{self.key_prefix}:{table_name}"
+
+    async def _get_version(self, table_name: str) -> str | None:
+        checked_at = self._versions_checked_at.get(table_name)
+        if (
+            checked_at is not None
+            and monotonic() - checked_at < self.version_check_seconds
+        ):
+            return self._versions.get(table_name)
+
+        self._versions_checked_at[table_name] = monotonic()
+        version_key = self._create_version_key(table_name)
+        try:
+            version = await cache.get(version_key)
+            if version is None:
+                # First read since redis lost its data, other workers may race to set it
+                await cache.set(version_key, uuid4().hex, nx=True)
+                version = await cache.get(version_key)
+        except Exception as e:
+            logger.warning(f"Could not read reference version of {table_name}: {e}")
+            return self._versions.get(table_name)
+
+        self._versions[table_name] = version
+        return version
+
+    def _is_fresh(
+        self, entry: ReferenceEntry | None, version: str | None, expire_seconds: int
+    ) -> bool:
+        return (
+            entry is not None
+            and entry.version == version
+            and monotonic() - entry.loaded_at <= expire_seconds
+        )
+
+    @staticmethod
+    def _create_etag(content: bytes) -> str:
+        return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+    @classmethod
+    def _create_version_etag(cls, version: str, name: str) -> str:
+        return cls._create_etag(f"{version}:{name}".encode())
+
+    @classmethod
+    def _create_entry(
+        cls,
+        name: str,
+        table_name: str,
+        version: str | None,
+        data: Any,
+        *,
+        response_model: Any,
+        version_etag: bool = True,
+    ) -> ReferenceEntry:
+        content = _dump_json(response_model, data)
+        return ReferenceEntry(
+            table_name=table_name,
+            version=version,
+            content=content,
+            etag=(
+                cls._create_version_etag(version, name)
+                if version is not None and version_etag
+                else cls._create_etag(content)
+            ),
+            loaded_at=monotonic(),
+        )
+
+    @staticmethod
+    def _create_not_modified_response(request: Request, etag: str) -> Response | None:
+        if not etag_matches(request.headers.get("if-none-match"), etag):
+            return None
+        return Response(status_code=304, headers=_create_etag_headers(etag))
+
+    @classmethod
+    def _create_response(cls, request: Request, entry: ReferenceEntry) -> Response:
+        not_modified_response = cls._create_not_modified_response(request, entry.etag)
+        if not_modified_response is not None:
+            return not_modified_response
+        return Response(
+            content=entry.content,
+            media_type="application/json",
+            headers=_create_etag_headers(entry.etag),
+        )
+
+    async def get_response(
+        self,
+        request: Request,
+        *,
+        name: str,
+        table_name: str,
+        load: Callable[[], Awaitable[Any]],
+        response_model: Any,
+        expire_seconds: int | None = None,
+        version_etag: bool = True,
+    ) -> Response:
+        """
+        Get the dataset `name` as a JSON response, loading it with `load` if it is
+        missing or stale. `table_name` is the reference table the dataset is read from.
+        The dataset is serialized through `response_model`, the route's response model.
+
+        Responds with 304 if `If-None-Match` holds the ETag of the dataset.
+        Datasets which also change without writes, like active leagues, need
+        `version_etag` disabled, so their ETag is a hash of the dataset instead.
+        """
+        if not self.enabled:
+            return self._create_response(
+                request,
+                self._create_entry(
+                    name,
+                    table_name,
+                    None,
+                    await load(),
+                    response_model=response_model,
+                ),
+            )
+
+        if expire_seconds is None:
+            expire_seconds = self.expire_seconds
+        version = await self._get_version(table_name)
+        if version is not None and version_etag:
+            not_modified_response = self._create_not_modified_response(
+                request, self._create_version_etag(version, name)
+            )
+            if not_modified_response is not None:
+                return not_modified_response
+
+        entry = self._entries.get(name)
+        if not self._is_fresh(entry, version, expire_seconds):
+            # Concurrent misses wait for the first load
+            async with self._locks.setdefault(name, asyncio.Lock()):
+                entry = self._entries.get(name)
+                if not self._is_fresh(entry, version, expire_seconds):
+                    entry = self._create_entry(
+                        name,
+                        table_name,
+                        version,
+                        await load(),
+                        response_model=response_model,
+                        version_etag=version_etag,
+                    )
+                    self._entries[name] = entry
+
+        return self._create_response(request, entry)
+
+    async def get_conditional_response(
+        self,
+        request: Request,
+        *,
+        table_name: str,
+        load: Callable[[], Awaitable[Any]],
+        response_model: Any,
+    ) -> Response:
+        """
+        Get a JSON response with an ETag derived from the version of `table_name`
+        and the request URL, without keeping the response in process.
+
+        For reads of reference tables with many variants, like paginated or single
+        object reads. Responds with 304 without calling `load` if `If-None-Match`
+        holds the ETag.
+        """
+        name = str(request.url)
+        version = await self._get_version(table_name) if self.enabled else None
+        if version is not None:
+            not_modified_response = self._create_not_modified_response(
+                request, self._create_version_etag(version, name)
+            )
+            if not_modified_response is not None:
+                return not_modified_response
+
+        return self._create_response(
+            request,
+            self._create_entry(
+                name,
+                table_name,
+                version,
+                await load(),
+                response_model=response_model,
+            ),
+        )
+
+    async def invalidate(self, table_name: str) -> None:
+        """
+        Marks the datasets of a reference table as stale, in this process and,
+        through the version counter, in every other process.
+        """
+        if not self.enabled:
+            return
+        self._entries = {
+            name: entry
+            for name, entry in self._entries.items()
+            if entry.table_name != table_name
+        }
+        version = uuid4().hex
+        try:
+            await cache.set(self._create_version_key(table_name), version)
+            self._versions[table_name] = version
+            self._versions_checked_at[table_name] = monotonic()
+        except Exception as e:
+            logger.warning(f"Could not bump reference version of {table_name}: {e}")
+
+
+reference_cache = ReferenceCache()
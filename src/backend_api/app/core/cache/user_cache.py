@@ -5,6 +5,7 @@ from uuid import UUID, uuid4
 from pydantic import TypeAdapter
 
 from app.core.cache.cache import cache
+from app.core.config import settings
 from app.core.models.models import User as model_User
 from app.core.schemas.user import UserInCache
 from app.exceptions import (
@@ -37,8 +38,14 @@ class UserCache:
     Format of `cache_key` is '*{user_token_type}:{token_uuid}*'
 
     We don't need user_id when storing the key inside the cache.
+
+    A copy of the user row, trusted by authentication for `USER_CACHE_TRUST_SECONDS`,
+    is stored separately from the tokens, as it is shared by all tokens of the user.
+    Format of its key is '*user:{user_id}*'. Routes changing a user delete it.
     """
 
+    user_key_prefix = "user"
+
     def __init__(self, user_token_type: UserCacheTokenType) -> None:
         self.user_token_type = user_token_type
 
@@ -46,12 +53,43 @@ class UserCache:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await cache.aclose()
+        # The connection pool is shared by all requests, and closed on shutdown
+        pass
 
     @staticmethod
     def extract_user_id_from_token(token: str) -> str:
         return token.split(":", 1)[0]
 
+    @classmethod
+    def _create_user_key(cls, user_id: UUID | str) -> str:
+        return f"{cls.user_key_prefix}:{user_id}"
+
+    @classmethod
+    async def get_user(cls, user_id: UUID | str) -> UserInCache | None:
+        """Get the cached copy of the user row. Returns None on a miss."""
+        user = await cache.get(cls._create_user_key(user_id))
+        return user_cache_adapter.validate_json(user) if user else None
+
+    @classmethod
+    async def set_user(
+        cls,
+        user: model_User,
+        expire_seconds: int = settings.USER_CACHE_TRUST_SECONDS,
+    ) -> UserInCache:
+        """Store a copy of the user row, and return it"""
+        user_in_cache = UserInCache.model_validate(user, from_attributes=True)
+        await cache.set(
+            name=cls._create_user_key(user.userId),
+            value=user_in_cache.model_dump_json(),
+            ex=expire_seconds,
+        )
+        return user_in_cache
+
+    @classmethod
+    async def invalidate_user(cls, user_id: UUID | str) -> None:
+        """Delete the cached copy of the user row, after the user has changed"""
+        await cache.delete(cls._create_user_key(user_id))
+
     def _create_cache_key_format(self, uuid_instance: UUID | str) -> str:
         return f"{self.user_token_type.value}:{uuid_instance}"
 
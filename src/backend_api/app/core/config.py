@@ -33,7 +33,14 @@ class Settings(BaseSettings):
 
     TURNSTILE_SECRET_KEY: str
 
+    # Bcrypt runs on this many threads, and at most this many calls wait for a thread.
+    # Calls beyond that are answered with 503, instead of stalling the event loop.
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUED: int = 20
+
     ACCESS_SESSION_EXPIRE_SECONDS: int = 60 * 60 * 24 * 3  # 3 days
+    # Authenticated users are checked against a cached copy of their row, this old at most
+    USER_CACHE_TRUST_SECONDS: int = 60
     DOMAIN: str
     ENVIRONMENT: Literal["local", "staging", "production"] = "production"
 
@@ -97,6 +104,62 @@ class Settings(BaseSettings):
             path=self.REDIS_CACHE,
         )
 
+    # One redis connection pool is shared by the app, including the rate limiters.
+    # Callers wait up to the pool timeout for a connection when all are in use.
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: int = 5
+
+    # Light pool for lookups and auth. Heavy pool for plots, ingestion and exports,
+    # so they can not starve the light pool. Statements are cancelled after the
+    # statement timeout of their pool.
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT_SECONDS: int = 10
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 30_000  # 30 seconds
+    DATABASE_HEAVY_POOL_SIZE: int = 5
+    DATABASE_HEAVY_MAX_OVERFLOW: int = 5
+    DATABASE_HEAVY_POOL_TIMEOUT_SECONDS: int = 30
+    DATABASE_HEAVY_STATEMENT_TIMEOUT_MS: int = 120_000  # 2 minutes
+    # Connections are checked before use, and replaced after the recycle time
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_RECYCLE_SECONDS: int = 60 * 30  # 30 minutes
+    # Pool sizes, checkouts and wait times are logged this often
+    DATABASE_POOL_METRICS_INTERVAL_SECONDS: int = 60
+
+    # Reference tables (modifiers, item base types, leagues) are served from serialized
+    # responses kept in process. Writes change a version in redis, checked this often.
+    REFERENCE_CACHE_ENABLED: bool = True
+    REFERENCE_CACHE_EXPIRE_SECONDS: int = 60 * 60  # 1 hour
+    REFERENCE_CACHE_VERSION_CHECK_SECONDS: int = 5
+    # Active leagues also change as time passes, without any writes
+    REFERENCE_CACHE_ACTIVE_LEAGUE_EXPIRE_SECONDS: int = 60
+
+    # Plot result cache. Entries are invalidated per league on new ingestion hours
+    PLOT_CACHE_ENABLED: bool = True
+    PLOT_CACHE_EXPIRE_SECONDS: int = 60 * 60  # 1 hour
+    # Incremental plotting only computes hours newer than the cached per hour rows
+    PLOT_INCREMENTAL_ENABLED: bool = True
+    PLOT_INCREMENTAL_EXPIRE_SECONDS: int = 60 * 60 * 24  # 1 day
+    # Plots without modifiers are served from the `item_hourly_price` continuous aggregate
+    PLOT_HOURLY_AGGREGATE_ENABLED: bool = True
+    # Plot statements are logged by fingerprint, literal SQL only when slower than this
+    PLOT_SLOW_STATEMENT_MS: int = 2000
+    PLOT_STATEMENT_CACHE_SIZE: int = 500
+    # Multi modifier plots intersect candidate item ids, rarest modifier ids first
+    PLOT_MODIFIER_INTERSECT_ENABLED: bool = True
+    PLOT_MODIFIER_SELECTIVITY_EXPIRE_SECONDS: int = 60 * 60  # 1 hour
+    # Plot statements are planned before execution. Costs are in postgres planner units.
+    PLOT_ADMISSION_CONTROL_ENABLED: bool = True
+    PLOT_LOW_PRIORITY_COST: float = 1_000_000  # Run in the low priority pool above this
+    PLOT_REJECT_COST: float = 50_000_000  # Reject above this
+    PLOT_LOW_PRIORITY_POOL_SIZE: int = 2
+    PLOT_LOW_PRIORITY_POOL_TIMEOUT_SECONDS: int = 10
+    PLOT_LOW_PRIORITY_STATEMENT_TIMEOUT_MS: int = 30_000  # 30 seconds
+    # Exports stream rows from a server side cursor, this many rows at a time
+    EXPORT_BATCH_SIZE: int = 10_000
+    # Maximum number of ids reserved in one request, for client side id assignment
+    RESERVE_IDS_MAX_COUNT: int = 100_000
+
     SMTP_TLS: bool = True
     SMTP_SSL: bool = True
     SMTP_PORT: int = 587
@@ -170,6 +233,10 @@ class Settings(BaseSettings):
     # API Rate Limiting
     RATE_LIMIT: bool = False  # Activate or deactivate rate limiting in app
     SKIP_RATE_LIMIT_TEST: bool = False  # Skip rate limiting in tests
+    # Hot routes lease up to this many requests at a time from redis, and decide them
+    # in process within the lease time. Less is leased near the limit. 1 disables it.
+    RATE_LIMIT_LEASE_SIZE: int = 10
+    RATE_LIMIT_LEASE_SECONDS: float = 1
 
 
 settings = Settings()  # type: ignore
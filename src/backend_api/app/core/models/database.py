@@ -1,18 +1,90 @@
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncAttrs, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncAttrs,
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.core.config import settings
+from app.core.models.pool_metrics import TimedAsyncAdaptedQueuePool
+
+
+def _create_async_engine(
+    *,
+    name: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: int,
+    statement_timeout_ms: int,
+) -> AsyncEngine:
+    return create_async_engine(
+        str(settings.ASYNC_DATABASE_URI),
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name=name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+        connect_args={
+            "server_settings": {"statement_timeout": str(statement_timeout_ms)}
+        },
+    )
 
-engine = create_engine(str(settings.DATABASE_URI))
-async_engine = create_async_engine(  # This engine is used for plotting queries
-    str(settings.ASYNC_DATABASE_URI)
+
+engine = create_engine(
+    str(settings.DATABASE_URI),
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+)
+# Light engine, used by the API routes for lookups and auth
+async_engine = _create_async_engine(
+    name="light",
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+    statement_timeout_ms=settings.DATABASE_STATEMENT_TIMEOUT_MS,
+)
+# Heavy engine, used for plots, ingestion and exports, so they can not starve
+# `async_engine`
+heavy_async_engine = _create_async_engine(
+    name="heavy",
+    pool_size=settings.DATABASE_HEAVY_POOL_SIZE,
+    max_overflow=settings.DATABASE_HEAVY_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_HEAVY_POOL_TIMEOUT_SECONDS,
+    statement_timeout_ms=settings.DATABASE_HEAVY_STATEMENT_TIMEOUT_MS,
+)
+# Plotting queries estimated to be expensive get their own small pool, so they
+# can not starve `heavy_async_engine`. Their statements are cancelled after a timeout.
+low_priority_async_engine = _create_async_engine(
+    name="low_priority",
+    pool_size=settings.PLOT_LOW_PRIORITY_POOL_SIZE,
+    max_overflow=0,
+    pool_timeout=settings.PLOT_LOW_PRIORITY_POOL_TIMEOUT_SECONDS,
+    statement_timeout_ms=settings.PLOT_LOW_PRIORITY_STATEMENT_TIMEOUT_MS,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit, as attributes can not be lazy loaded in async
 AsyncSessionLocal = async_sessionmaker(
-    autocommit=False, autoflush=False, bind=async_engine, autobegin=False
+    autocommit=False,
+    autoflush=False,
+    bind=async_engine,
+    autobegin=False,
+    expire_on_commit=False,
+)
+HeavyAsyncSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=heavy_async_engine,
+    autobegin=False,
+    expire_on_commit=False,
+)
+LowPriorityAsyncSessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, bind=low_priority_async_engine, autobegin=False
 )
 
 
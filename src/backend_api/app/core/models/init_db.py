@@ -1,5 +1,5 @@
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.models.models import User
@@ -7,10 +7,13 @@ from app.core.schemas.user import UserCreate
 from app.crud import CRUD_user
 
 
-def init_db(session: Session) -> None:
-    user = session.execute(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
+async def init_db(session: AsyncSession) -> None:
+    async with session.begin():
+        user = (
+            await session.execute(
+                select(User).where(User.email == settings.FIRST_SUPERUSER)
+            )
+        ).first()
     if not user:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
@@ -18,4 +21,4 @@ def init_db(session: Session) -> None:
             password=settings.FIRST_SUPERUSER_PASSWORD,
             isSuperuser=True,
         )
-        user = CRUD_user.create(db=session, user_create=user_in)
+        user = await CRUD_user.create(db=session, user_create=user_in)
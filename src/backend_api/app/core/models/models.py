@@ -5,6 +5,7 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     CheckConstraint,
+    Column,
     DateTime,
     Float,
     ForeignKey,
@@ -12,13 +13,15 @@ from sqlalchemy import (
     Identity,
     Index,
     Integer,
+    MetaData,
     PrimaryKeyConstraint,
     SmallInteger,
     String,
+    Table,
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.models.database import Base
@@ -239,6 +242,34 @@ class Modifier(Base):
     )
 
 
+# Views are managed by hand written alembic revisions, so they are kept out of
+# `Base.metadata` and autogenerate does not try to create them as tables
+view_metadata = MetaData()
+
+
+class ItemHourlyPrice(Base):
+    """
+    Continuous aggregate over `item`, one row per league, name, base type, hour,
+    identified and currency. Holds the cheapest `currencyAmount`s of the group,
+    which is enough to rank the 20 cheapest items of an hour across currencies.
+
+    For continuous aggregate specs, see alembic revision `b1e7d4c2a9f0`
+    """
+
+    __table__ = Table(
+        "item_hourly_price",
+        view_metadata,
+        Column("createdHoursSinceLaunch", SmallInteger, primary_key=True),
+        Column("leagueId", SmallInteger, primary_key=True),
+        Column("name", Text, primary_key=True),
+        Column("itemBaseTypeId", SmallInteger, primary_key=True),
+        Column("identified", Boolean, primary_key=True),
+        Column("currencyId", Integer, primary_key=True),
+        Column("nItems", BigInteger, nullable=False),
+        Column("bottomCurrencyAmounts", ARRAY(Float(4)), nullable=False),
+    )
+
+
 class ItemModifier(Base):
     # Hypertable
     # For hypertable specs, see alembic revision `cc29b89156db'
@@ -0,0 +1,201 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, TypeVar
+
+import redis.asyncio as Redis
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.logs.logger import pool_logger
+
+T = TypeVar("T")
+
+
+class PoolWaitTimes:
+    """
+    Time spent waiting for a connection from a pool, since the last report.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+# By pool logging name. Pools are recreated on `dispose`, with the same name.
+pool_wait_times: dict[str, PoolWaitTimes] = {}
+
+redis_pool_name = "redis"
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    "Queue pool which records how long checkouts wait for a connection"
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_times.setdefault(self.logging_name, PoolWaitTimes()).record(
+                perf_counter() - start
+            )
+
+
+class TimedBlockingConnectionPool(Redis.BlockingConnectionPool):
+    "Redis connection pool which records how long commands wait for a connection"
+
+    async def get_connection(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return await super().get_connection(*args, **kwargs)
+        finally:
+            pool_wait_times.setdefault(redis_pool_name, PoolWaitTimes()).record(
+                perf_counter() - start
+            )
+
+
+class TimedBoundedThreadPool:
+    """
+    Thread pool which records how long calls wait for a thread.
+
+    At most `max_queued` calls wait for a thread, calls beyond that raise
+    `asyncio.QueueFull` right away.
+    """
+
+    def __init__(self, name: str, *, max_workers: int, max_queued: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+
+    @property
+    def running(self) -> int:
+        return min(self.pending, self.max_workers)
+
+    @property
+    def queued(self) -> int:
+        return max(self.pending - self.max_workers, 0)
+
+    def _release(self) -> None:
+        self.pending -= 1
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        # Calls only wait when every thread is busy
+        if self.pending >= self.max_workers + self.max_queued:
+            self.rejected += 1
+            raise asyncio.QueueFull(f"{self.name} pool has {self.queued} queued calls")
+
+        submitted_at = perf_counter()
+
+        def timed_func() -> tuple[float, T]:
+            return perf_counter(), func(*args)
+
+        loop = asyncio.get_running_loop()
+
+        def release(_: Future) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._release)
+
+        self.pending += 1
+        # Released once the thread is done. A cancelled caller stops waiting, but its
+        # call keeps running in the thread, so it is still pending until then.
+        future = self._executor.submit(timed_func)
+        future.add_done_callback(release)
+        started_at, result = await asyncio.wrap_future(future)
+        pool_wait_times.setdefault(self.name, PoolWaitTimes()).record(
+            started_at - submitted_at
+        )
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _format_metrics(
+    name: str, *, size: int, checked_out: int, checked_in: int, overflow: int
+) -> str:
+    "Pool metrics as `key=value` pairs, parsed into fields by the log pipeline"
+    wait_times = pool_wait_times.setdefault(name, PoolWaitTimes())
+    avg_wait_ms = (
+        wait_times.total_wait_seconds / wait_times.checkouts * 1000
+        if wait_times.checkouts
+        else 0.0
+    )
+    pool_metrics = (
+        f"pool={name} "
+        f"size={size} "
+        f"checked_out={checked_out} "
+        f"checked_in={checked_in} "
+        f"overflow={overflow} "
+        f"checkouts={wait_times.checkouts} "
+        f"avg_wait_ms={avg_wait_ms:.2f} "
+        f"max_wait_ms={wait_times.max_wait_seconds * 1000:.2f}"
+    )
+    wait_times.reset()
+    return pool_metrics
+
+
+def format_pool_metrics(pool: QueuePool) -> str:
+    return _format_metrics(
+        pool.logging_name,
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        checked_in=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+    )
+
+
+def format_redis_pool_metrics(pool: Redis.ConnectionPool) -> str:
+    "Size is the maximum number of connections, which are opened on demand"
+    return _format_metrics(
+        redis_pool_name,
+        size=pool.max_connections,
+        checked_out=len(pool._in_use_connections),
+        checked_in=len(pool._available_connections),
+        overflow=0,
+    )
+
+
+def format_thread_pool_metrics(pool: TimedBoundedThreadPool) -> str:
+    "Size is the number of threads. Queued calls are waiting for a thread."
+    pool_metrics = _format_metrics(
+        pool.name,
+        size=pool.max_workers,
+        checked_out=pool.running,
+        checked_in=pool.max_workers - pool.running,
+        overflow=0,
+    )
+    pool_metrics += f" queued={pool.queued} rejected={pool.rejected}"
+    pool.rejected = 0
+    return pool_metrics
+
+
+async def log_pool_metrics(
+    engines: list[AsyncEngine],
+    redis_pool: Redis.ConnectionPool,
+    thread_pools: list[TimedBoundedThreadPool],
+    *,
+    interval_seconds: float,
+) -> None:
+    "Logs metrics of the engine, redis and thread pools every `interval_seconds`, until cancelled"
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for engine in engines:
+            pool_logger.info(format_pool_metrics(engine.pool))
+        pool_logger.info(format_redis_pool_metrics(redis_pool))
+        for thread_pool in thread_pools:
+            pool_logger.info(format_thread_pool_metrics(thread_pool))
@@ -1,14 +1,14 @@
-# From https://github.com/wemake-services/asyncio-redis-rate-limit
-import asyncio
+# Based on https://github.com/wemake-services/asyncio-redis-rate-limit
 import hashlib
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from time import monotonic
 from types import TracebackType
 from typing import NamedTuple, TypeAlias, TypeVar
+from uuid import uuid4
 
-from asyncio_redis_rate_limit.compat import (
-    AnyPipeline,
-    AnyRedis,
-    pipeline_expire,
-)
+import redis.asyncio as Redis
 from typing_extensions import final
 
 from app.exceptions.model_exceptions.rate_limit_exception import RateLimitExceededError
@@ -18,6 +18,75 @@ _Seconds: TypeAlias = int
 
 _RateLimiterT = TypeVar("_RateLimiterT", bound="RateLimiter")
 
+_GRANULARITY_SECONDS: dict[str, _Seconds] = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 60 * 60 * 24,
+    "month": 60 * 60 * 24 * 30,
+    "year": 60 * 60 * 24 * 365,
+}
+
+# Sliding window log over all windows of a key, in one round trip.
+# KEYS[1]: sorted set of allowed requests, scored by time in milliseconds.
+# Milliseconds, as redis converts Lua numbers to strings with 14 significant digits.
+# ARGV[1]: unique member prefix for this call
+# ARGV[2]: requests to lease, at most half of what remains in every window
+# ARGV[3..]: pairs of requests and window seconds
+# Returns allowed (1 or 0), requests, remaining, reset and window of the tightest
+# window, and the amount of leased requests.
+# Reset is when a request is allowed again if rejected, else when the window frees up.
+_SLIDING_WINDOW_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local max_window = 0
+for i = 3, #ARGV, 2 do
+    max_window = math.max(max_window, tonumber(ARGV[i + 1]))
+end
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - max_window * 1000)
+
+local allowed = 1
+local leased = tonumber(ARGV[2])
+local tightest = nil
+for i = 3, #ARGV, 2 do
+    local requests = tonumber(ARGV[i])
+    local window = tonumber(ARGV[i + 1]) * 1000
+    local window_start = "(" .. (now - window)
+    local count = redis.call("ZCOUNT", KEYS[1], window_start, "+inf")
+    local remaining = requests - count
+    local reset = 0
+    if count > 0 then
+        -- The oldest request which has to leave the window, before another is allowed
+        local offset = math.max(count - requests, 0)
+        local oldest = redis.call(
+            "ZRANGEBYSCORE", KEYS[1], window_start, "+inf", "WITHSCORES", "LIMIT", offset, 1
+        )
+        reset = tonumber(oldest[2]) + window - now
+    end
+    leased = math.min(leased, math.floor(remaining / 2))
+    if remaining <= 0 then
+        if allowed == 1 or reset > tightest[3] then
+            tightest = {requests, 0, reset, window}
+        end
+        allowed = 0
+    elseif allowed == 1 and (tightest == nil or remaining < tightest[2]) then
+        tightest = {requests, remaining, reset > 0 and reset or window, window}
+    end
+end
+
+if allowed == 0 then
+    return {0, tightest[1], 0, tightest[3], tightest[4] / 1000, 0}
+end
+-- Near the limit, requests are checked one by one
+leased = math.max(leased, 1)
+for i = 1, leased do
+    redis.call("ZADD", KEYS[1], now, ARGV[1] .. ":" .. i)
+end
+redis.call("PEXPIRE", KEYS[1], max_window * 1000)
+return {1, tightest[1], tightest[2] - leased, tightest[3], tightest[4] / 1000, leased}
+"""
+
 
 @final
 class RateSpec(NamedTuple):
@@ -31,34 +100,137 @@ class RateSpec(NamedTuple):
     cooldown_seconds: _Seconds
 
 
+def parse_rate_spec(limit: str) -> RateSpec:
+    """Parses a limit like ``12/second`` or ``1/month`` into a ``RateSpec``."""
+    requests, granularity = limit.split("/")
+    return RateSpec(
+        requests=int(requests),
+        cooldown_seconds=_GRANULARITY_SECONDS[granularity.strip().lower()],
+    )
+
+
+@final
+class RateLimitState(NamedTuple):
+    """Outcome of a request, for the tightest window of the rate specs."""
+
+    allowed: bool
+    requests: int
+    remaining: int
+    reset_seconds: _Seconds
+    cooldown_seconds: _Seconds
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.requests),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset_seconds),
+        }
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    expires_at: float
+    state: RateLimitState
+
+
+class LocalTokenBuckets:
+    """
+    Requests leased from redis, kept in process per cache key.
+
+    Leased requests are already recorded in redis, so they count against the limits of
+    every worker. They are used within the lease time, and are lost if unused, which
+    only makes the limits stricter. Since they are recorded when leased, the smallest
+    window may admit up to one lease more than its limit, as requests leased at the
+    end of a window are used after it.
+    """
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        self.max_keys = max_keys
+        self._leases: dict[str, _Lease] = {}
+
+    def take(self, key: str) -> RateLimitState | None:
+        """Takes a leased request of `key`, or returns None if none is left."""
+        lease = self._leases.get(key)
+        if lease is None:
+            return None
+        if lease.tokens <= 0 or monotonic() >= lease.expires_at:
+            del self._leases[key]
+            return None
+        lease.tokens -= 1
+        return lease.state._replace(remaining=lease.state.remaining + lease.tokens)
+
+    def put(
+        self, key: str, *, tokens: int, lease_seconds: float, state: RateLimitState
+    ) -> None:
+        """Keeps `tokens` leased requests of `key`, replacing any left over."""
+        if len(self._leases) >= self.max_keys:
+            now = monotonic()
+            self._leases = {
+                key: lease
+                for key, lease in self._leases.items()
+                if lease.tokens > 0 and now < lease.expires_at
+            }
+            if len(self._leases) >= self.max_keys:
+                self._leases.clear()
+        self._leases[key] = _Lease(
+            tokens=tokens, expires_at=monotonic() + lease_seconds, state=state
+        )
+
+
+local_token_buckets = LocalTokenBuckets()
+
+
 class RateLimiter:
-    """Implements rate limiting."""
+    """
+    Implements sliding window rate limiting.
+
+    All rate specs of a key are checked, and the request recorded, atomically by a
+    single script call. Rejected requests are not recorded.
+
+    With a `lease_size` above 1, up to that many requests are leased at a time, and
+    kept in `local_token_buckets`, so most requests are decided without redis. Near
+    the limit, less is leased, down to checking every request in redis.
+    """
 
     __slots__ = (
         "_unique_key",
-        "_rate_spec",
+        "_rate_specs",
         "_backend",
         "_cache_prefix",
-        "_lock",
         "_enabled",
+        "_lease_size",
+        "_lease_seconds",
+        "state",
     )
 
     def __init__(
         self,
         unique_key: str,
-        rate_spec: RateSpec,
-        backend: AnyRedis,
+        rate_spec: RateSpec | Sequence[RateSpec],
+        backend: Redis.Redis,
         *,
         cache_prefix: str,
         enabled: bool = True,
+        lease_size: int = 1,
+        lease_seconds: float = 1,
     ) -> None:
         """In the future other backends might be supported as well."""
         self._unique_key = unique_key
-        self._rate_spec = rate_spec
+        self._rate_specs = (
+            [rate_spec] if isinstance(rate_spec, RateSpec) else list(rate_spec)
+        )
         self._backend = backend
         self._cache_prefix = cache_prefix
-        self._lock = asyncio.Lock()
         self._enabled = enabled
+        self._lease_size = lease_size
+        # Leases are used up within the smallest window
+        self._lease_seconds = min(
+            lease_seconds,
+            *(rate_spec.cooldown_seconds for rate_spec in self._rate_specs),
+        )
+        self.state: RateLimitState | None = None
 
     async def __aenter__(self: _RateLimiterT) -> _RateLimiterT:
         """
@@ -85,43 +257,65 @@ class RateLimiter:
     async def _acquire(self) -> None:
         cache_key = self._make_cache_key(
             unique_key=self._unique_key,
-            rate_spec=self._rate_spec,
+            rate_specs=self._rate_specs,
             cache_prefix=self._cache_prefix,
         )
-        pipeline = self._backend.pipeline()
-
-        async with self._lock:
-            current_rate = await self._run_pipeline(cache_key, pipeline)
-            # This looks like a coverage error on 3.10:
-            if current_rate > self._rate_spec.requests:  # pragma: no cover
-                raise RateLimitExceededError(
-                    retry_after_seconds=self._rate_spec.cooldown_seconds,
-                    max_amount_of_tries_per_time_period=self._rate_spec.requests,
-                    cooldown_seconds=self._rate_spec.cooldown_seconds,
-                    function_name=self._acquire.__name__,
-                    class_name=self.__class__.__name__,
-                )
-
-    async def _run_pipeline(
-        self,
-        cache_key: str,
-        pipeline: AnyPipeline,
-    ) -> int:
-        # https://redis.io/commands/incr/#pattern-rate-limiter-1
-        current_rate, _ = await pipeline_expire(
-            pipeline.incr(cache_key),
-            cache_key,
-            self._rate_spec.cooldown_seconds,
-        ).execute()
-        return current_rate  # type: ignore[no-any-return]
+        if self._lease_size > 1:
+            state = local_token_buckets.take(cache_key)
+            if state is not None:
+                self.state = state
+                return
+
+        self.state, leased = await self._run_script(cache_key)
+        if leased > 1:
+            local_token_buckets.put(
+                cache_key,
+                tokens=leased - 1,
+                lease_seconds=self._lease_seconds,
+                state=self.state,
+            )
+            self.state = self.state._replace(
+                remaining=self.state.remaining + leased - 1
+            )
+        if not self.state.allowed:
+            raise RateLimitExceededError(
+                retry_after_seconds=self.state.reset_seconds,
+                max_amount_of_tries_per_time_period=self.state.requests,
+                cooldown_seconds=self.state.cooldown_seconds,
+                function_name=self._acquire.__name__,
+                class_name=self.__class__.__name__,
+            )
+
+    async def _run_script(self, cache_key: str) -> tuple[RateLimitState, int]:
+        # Runs with EVALSHA, the script is loaded on first use
+        script = self._backend.register_script(_SLIDING_WINDOW_SCRIPT)
+        args: list[str | int] = [uuid4().hex, self._lease_size]
+        for rate_spec in self._rate_specs:
+            args.extend(rate_spec)
+        (
+            allowed,
+            requests,
+            remaining,
+            reset_ms,
+            cooldown_seconds,
+            leased,
+        ) = await script(keys=[cache_key], args=args)
+        state = RateLimitState(
+            allowed=bool(allowed),
+            requests=int(requests),
+            remaining=int(remaining),
+            reset_seconds=max(math.ceil(int(reset_ms) / 1000), 1),
+            cooldown_seconds=int(cooldown_seconds),
+        )
+        return state, int(leased)
 
     def _make_cache_key(
         self,
         unique_key: str,
-        rate_spec: RateSpec,
+        rate_specs: list[RateSpec],
         cache_prefix: str,
     ) -> str:
-        parts = "".join([unique_key, str(rate_spec)])
+        parts = "".join([unique_key, *map(str, rate_specs)])
         return (
             cache_prefix
             + hashlib.md5(  # noqa: S303, S324
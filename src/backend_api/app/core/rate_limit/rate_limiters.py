@@ -1,77 +1,126 @@
+import functools
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 
-from slowapi import Limiter
+from fastapi import Request, Response
 
 from app.api.deps import get_username_by_request, get_user_ip_from_header
 from app.core.cache.cache import cache
 from app.core.config import settings
-from app.core.rate_limit.custom_rate_limiter import RateLimiter, RateSpec
-from app.core.rate_limit.rate_limit_config import rate_limit_settings
+from app.core.rate_limit.custom_rate_limiter import (
+    RateLimiter,
+    RateSpec,
+    parse_rate_spec,
+)
+
 
+class RouteRateLimiter:
+    """
+    Rate limits routes by a key taken from the request, like slowapi's `Limiter`.
 
-def default_limit_provider() -> list[str]:
-    return [
-        rate_limit_settings.DEFAULT_USER_RATE_LIMIT_SECOND,
-        rate_limit_settings.DEFAULT_USER_RATE_LIMIT_MINUTE,
-        rate_limit_settings.DEFAULT_USER_RATE_LIMIT_HOUR,
-        rate_limit_settings.DEFAULT_USER_RATE_LIMIT_DAY,
-    ]
+    All limits of a route are checked in a single round trip to redis. The tightest
+    remaining quota is sent in `X-RateLimit-*` headers. Decorated routes need a
+    `request: Request` parameter, and a `response: Response` parameter for the headers.
+
+    Routes limited with `lease=True` decide most requests in process, from requests
+    leased from redis, see `RateLimiter`.
+    """
+
+    def __init__(
+        self,
+        key_func: Callable[[Request], str],
+        *,
+        cache_prefix: str,
+        enabled: bool = settings.RATE_LIMIT,
+    ) -> None:
+        self.key_func = key_func
+        self.cache_prefix = cache_prefix
+        self.enabled = enabled
+
+    def limit(
+        self, *limits: str, lease: bool = False
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        rate_specs = [parse_rate_spec(limit) for limit in limits]
+        lease_size = settings.RATE_LIMIT_LEASE_SIZE if lease else 1
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            route_name = f"{func.__module__}.{func.__name__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+
+                request: Request = kwargs["request"]
+                async with RateLimiter(
+                    unique_key=f"{route_name}:{self.key_func(request)}",
+                    rate_spec=rate_specs,
+                    backend=cache,
+                    cache_prefix=self.cache_prefix,
+                    lease_size=lease_size,
+                    lease_seconds=settings.RATE_LIMIT_LEASE_SECONDS,
+                ) as rate_limiter:
+                    result = await func(*args, **kwargs)
+
+                headers = rate_limiter.state.headers
+                if isinstance(result, Response):
+                    result.headers.update(headers)
+                elif kwargs.get("response") is not None:
+                    kwargs["response"].headers.update(headers)
+                return result
+
+            return wrapper
+
+        return decorator
 
 
 # Limiter for user
-limiter_user = Limiter(
-    key_func=get_username_by_request,
-    default_limits=default_limit_provider(),
-    storage_uri=str(settings.CACHE_URI),
-    headers_enabled=True,
-    enabled=settings.RATE_LIMIT,
+limiter_user = RouteRateLimiter(
+    key_func=get_username_by_request, cache_prefix="rate_limit:user:"
 )
 
 # Limiter for IP
-limiter_ip = Limiter(
-    key_func=get_user_ip_from_header,
-    default_limits=default_limit_provider(),
-    storage_uri=str(settings.CACHE_URI),
-    headers_enabled=True,
-    enabled=settings.RATE_LIMIT,
+limiter_ip = RouteRateLimiter(
+    key_func=get_user_ip_from_header, cache_prefix="rate_limit:ip:"
 )
 
 
 def apply_rate_limits(
-    limiter: Limiter, *limits: str
+    limiter: RouteRateLimiter, *limits: str, lease: bool = False
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func = limiter.limit(*limits, lease=lease)(func)
         # Dynamically add the _rate_limits attribute using setattr
         func._rate_limits = limits
-
-        # Apply each limit individually
-        for limit in limits:
-            func = limiter.limit(limit)(func)
         return func
 
     return decorator
 
 
 def apply_user_rate_limits(
-    *limits: str,
+    *limits: str, lease: bool = False
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    return apply_rate_limits(limiter_user, *limits)
+    return apply_rate_limits(limiter_user, *limits, lease=lease)
 
 
 def apply_ip_rate_limits(
-    *limits: str,
+    *limits: str, lease: bool = False
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    return apply_rate_limits(limiter_ip, *limits)
+    return apply_rate_limits(limiter_ip, *limits, lease=lease)
 
 
 @asynccontextmanager
 async def apply_custom_rate_limit(
-    unique_key: str, rate_spec: RateSpec, prefix: str
+    unique_key: str,
+    rate_spec: RateSpec | list[RateSpec],
+    prefix: str,
+    *,
+    lease: bool = False,
 ) -> AsyncGenerator[None, RateLimiter]:
     """
     Helper function to apply custom rate limit based on a unique key.
+    With `lease`, most requests are decided in process, see `RateLimiter`.
     """
     async with RateLimiter(
         unique_key=unique_key,
@@ -79,5 +128,7 @@ async def apply_custom_rate_limit(
         rate_spec=rate_spec,
         cache_prefix=prefix,
         enabled=settings.RATE_LIMIT,
+        lease_size=settings.RATE_LIMIT_LEASE_SIZE if lease else 1,
+        lease_seconds=settings.RATE_LIMIT_LEASE_SECONDS,
     ):
         yield
@@ -28,6 +28,7 @@ from .modifier import (
     ModifierInDB,
     ModifierUpdate,
 )
+from .reserved_ids import ReservedIds
 from .token import NewPassword, Token, TokenPayload
 from .turnstile import TurnstileQuery, TurnstileResponse
 from .unidentified_item import (
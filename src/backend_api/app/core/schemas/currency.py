@@ -13,6 +13,7 @@ class _BaseCurrency(_pydantic.BaseModel):
 # Properties to receive on currency creation
 class CurrencyCreate(_BaseCurrency):
     createdHoursSinceLaunch: int
+    currencyId: int | None = None  # Reserved id, generated when left out
 
 
 # Properties to receive on update
@@ -39,6 +39,7 @@ class _BaseItem(_pydantic.BaseModel):
 # Properties to receive on item creation
 class ItemCreate(_BaseItem):
     createdHoursSinceLaunch: int
+    itemId: int | None = None  # Reserved id, generated when left out
 
 
 # Properties to receive on update
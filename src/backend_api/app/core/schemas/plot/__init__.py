@@ -1,5 +1,6 @@
 from .input import (
     BasePlotQuery,
+    BatchPlotQuery,
     PlotQuery,
     IdentifiedPlotQuery,
     UnidentifiedPlotQuery,
@@ -8,4 +9,10 @@ from .input import (
     WantedModifier,
     ModifierLimitation,
 )
-from .output import PlotData
+from .output import (
+    ColumnarPlotData,
+    Datum,
+    PlotData,
+    TimeseriesColumns,
+    TimeseriesData,
+)
@@ -1,3 +1,5 @@
+from typing import Literal
+
 import pydantic as _pydantic
 
 from app.core.schemas.item import Influences
@@ -44,6 +46,10 @@ class BasePlotQuery(_pydantic.BaseModel):
     baseSpecifications: BaseSpecs | None = None
     end: int | None = None
     start: int | None = None
+    # Size of the time buckets each data point is averaged over
+    resolution: Literal["1h", "6h", "1d"] | None = None
+    # Max amount of data points per league, downsampled with LTTB
+    downsample: int | None = _pydantic.Field(default=None, ge=3)
 
 
 class PlotQuery(BasePlotQuery):
@@ -60,3 +66,9 @@ class IdentifiedPlotQuery(BasePlotQuery):
 
 class UnidentifiedPlotQuery(BasePlotQuery):
     """Plots for unidentified items"""
+
+
+class BatchPlotQuery(_pydantic.BaseModel):
+    "Multiple plot queries performed in one request"
+
+    queries: list[PlotQuery] = _pydantic.Field(min_length=1, max_length=10)
@@ -19,3 +19,19 @@ class TimeseriesData(_pydantic.BaseModel):
 class PlotData(_pydantic.BaseModel):
     mostCommonCurrencyUsed: str
     data: list[TimeseriesData]
+
+
+class TimeseriesColumns(_pydantic.BaseModel):
+    "Same as `TimeseriesData`, but with one array per `Datum` field"
+
+    leagueId: int
+    confidenceRating: Literal["low", "medium", "high"]
+    hoursSinceLaunch: list[int]
+    valueInChaos: list[float]
+    valueInMostCommonCurrencyUsed: list[float]
+    confidence: list[Literal["low", "medium", "high"]]
+
+
+class ColumnarPlotData(_pydantic.BaseModel):
+    mostCommonCurrencyUsed: str
+    data: list[TimeseriesColumns]
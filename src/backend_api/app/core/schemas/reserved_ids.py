@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+# Identity values reserved for a table
+# Ranges are ascending, and both the first and last id are included
+class ReservedIds(BaseModel):
+    ranges: list[tuple[int, int]]
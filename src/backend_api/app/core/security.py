@@ -1,5 +1,24 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 from bcrypt import checkpw, gensalt, hashpw
 
+from app.core.config import settings
+from app.core.models.pool_metrics import TimedBoundedThreadPool
+from app.exceptions.model_exceptions.user_login_exception import (
+    PasswordHashingBusyError,
+)
+
+T = TypeVar("T")
+
+# Bcrypt takes a few hundred milliseconds per call, and releases the GIL while hashing
+password_hash_pool = TimedBoundedThreadPool(
+    "password_hash",
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queued=settings.PASSWORD_HASH_MAX_QUEUED,
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
@@ -7,3 +26,31 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return hashpw(password.encode("utf-8"), gensalt()).decode("utf-8")
+
+
+async def _run_in_password_hash_pool(
+    func: Callable[..., T], *args: Any, function_name: str
+) -> T:
+    try:
+        return await password_hash_pool.run(func, *args)
+    except asyncio.QueueFull:
+        raise PasswordHashingBusyError(function_name=function_name)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    "`verify_password` on the password hash pool, without blocking the event loop"
+    return await _run_in_password_hash_pool(
+        verify_password,
+        plain_password,
+        hashed_password,
+        function_name=async_verify_password.__name__,
+    )
+
+
+async def async_get_password_hash(password: str) -> str:
+    "`get_password_hash` on the password hash pool, without blocking the event loop"
+    return await _run_in_password_hash_pool(
+        get_password_hash,
+        password,
+        function_name=async_get_password_hash.__name__,
+    )
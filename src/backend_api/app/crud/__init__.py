@@ -34,7 +34,12 @@ from app.crud.user import CRUDUser
 
 from .base import CRUDBase
 
-CRUD_league = CRUDLeague(model=model_League, schema=League, create_schema=LeagueCreate)
+CRUD_league = CRUDLeague(
+    model=model_League,
+    schema=League,
+    create_schema=LeagueCreate,
+    is_reference_table=True,
+)
 
 CRUD_currency = CRUDCurrency(
     model=model_Currency,
@@ -45,7 +50,12 @@ CRUD_currency = CRUDCurrency(
 
 CRUD_itemBaseType = CRUDBase[
     model_ItemBaseType, ItemBaseType, ItemBaseTypeCreate, ItemBaseTypeUpdate
-](model=model_ItemBaseType, schema=ItemBaseType, create_schema=ItemBaseTypeCreate)
+](
+    model=model_ItemBaseType,
+    schema=ItemBaseType,
+    create_schema=ItemBaseTypeCreate,
+    is_reference_table=True,
+)
 
 
 CRUD_itemModifier = CRUDBase[
@@ -57,6 +67,8 @@ CRUD_itemModifier = CRUDBase[
     model=model_ItemModifier,
     schema=ItemModifier,
     create_schema=ItemModifierCreate,
+    # Primary key constraint is removed on the hypertable, `itemId` alone is not unique
+    order_keys=["itemId", "modifierId", "position"],
 )
 
 CRUD_item = CRUDBase[
@@ -76,6 +88,7 @@ CRUD_modifier = CRUDModifier(
     model=model_Modifier,
     schema=Modifier,
     create_schema=ModifierCreate,
+    is_reference_table=True,
 )
 
 CRUD_user = CRUDUser()
@@ -1,24 +1,41 @@
+import csv
+import io
+import json
 from collections.abc import Generator, Iterable
 from itertools import islice
-from typing import Any, Generic, Literal, TypeVar
-
-from pydantic import BaseModel, TypeAdapter
+from typing import IO, Any, Generic, Literal, TypeVar
+
+from asyncpg.exceptions import DataError, IntegrityConstraintViolationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import (
+    Column,
+    Select,
+    column,
+    func,
+    literal,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy import exc as sa_exc
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # from app.api.params import FilterParams
 from app.api.params import FilterParams
+from app.core.cache.reference_cache import reference_cache
 from app.exceptions import (
     ArgValueNotSupportedError,
     DbObjectDoesNotExistError,
     DbTooManyItemsDeleteError,
 )
 from app.exceptions.model_exceptions.db_exception import (
+    DbInvalidCopyDataError,
     DbObjectAlreadyExistsError,
     GeneralDBError,
 )
 from app.logs.logger import logger
-from app.utils.sort_algorithms import sort_with_reference
 
 ModelType = TypeVar("ModelType", bound=Any)
 SchemaType = TypeVar("SchemaType", bound=Any)
@@ -32,6 +49,8 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
         model: type[ModelType],
         schema: type[SchemaType],
         create_schema: type[CreateSchemaType],
+        order_keys: list[str] | None = None,
+        is_reference_table: bool = False,
     ):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
@@ -40,10 +59,16 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
 
         * `models`: A SQLAlchemy schema class
         * `schema`: A Pydantic schema (schema) class
+        * `order_keys`: Column names that uniquely identify a row, ordered on for stable
+        pagination. Defaults to the primary keys.
+        * `is_reference_table`: Writes invalidate the datasets of the table in the
+        reference cache.
         """
         self.model = model
         self.schema = schema
         self.create_schema = create_schema
+        self.order_keys = order_keys
+        self.is_reference_table = is_reference_table
 
         self.validate = TypeAdapter(SchemaType | list[SchemaType]).validate_python
 
@@ -51,29 +76,93 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
         # Formula: Query params limit (65535) / (max(len(on_conflict_dn_model_columns)) * 1.2) = ~10500
         self.create_batch_size_on_conflict = 10500
 
-    def _sort_objects(
-        self,
-        objs: list[ModelType],
-        sort_key: str | None = None,
-        sort_method: Literal["asc", "dec"] | None = None,
-    ) -> list[ModelType]:
+    async def _invalidate_reference_cache(self) -> None:
+        if self.is_reference_table:
+            await reference_cache.invalidate(self.model.__tablename__)
+
+    def _get_order_columns(self, sort_key: str | None = None) -> list[Column]:
         """
         `sort_key` is the column name to sort on. For example `createdAt`.
+
+        The primary keys are always ordered on last, which makes the order stable and
+        lets keyset pagination continue after any object.
         """
+        if self.order_keys is None:
+            primary_keys = list(self.model.__table__.primary_key)
+        else:
+            primary_keys = [
+                self.model.__table__.columns[key] for key in self.order_keys
+            ]
         if sort_key is None:
-            return objs
-        if sort_method is None:
-            sort_method = "asc"
-        unsorted_extracted_column = []
-        for obj in objs:
-            unsorted_extracted_column.append(getattr(obj, sort_key))
+            return primary_keys
+        if sort_key not in self.model.__table__.columns:
+            raise ArgValueNotSupportedError(
+                value=sort_key,
+                function_name=self._get_order_columns.__name__,
+                class_name=self.__class__.__name__,
+            )
+        sort_column = self.model.__table__.columns[sort_key]
+        return [sort_column, *(key for key in primary_keys if key is not sort_column)]
 
-        sorted_objs = sort_with_reference(objs, unsorted_extracted_column)
+    def _parse_after(self, after: str, *, order_columns: list[Column]) -> list[Any]:
+        """
+        `after` holds the values of the order columns of the last object on the
+        previous page, as a JSON array. A single value can be given without an array.
+        Values are converted to the python type of their column, so timestamps and
+        UUIDs can be given as strings.
+        """
+        try:
+            after_values = json.loads(after)
+        except ValueError:
+            after_values = after
+        if not isinstance(after_values, list):
+            after_values = [after_values]
+        if len(after_values) != len(order_columns):
+            raise ArgValueNotSupportedError(
+                value=after,
+                function_name=self._parse_after.__name__,
+                class_name=self.__class__.__name__,
+            )
+        try:
+            return [
+                TypeAdapter(column.type.python_type).validate_python(value)
+                for column, value in zip(order_columns, after_values, strict=True)
+            ]
+        except (ValidationError, NotImplementedError):
+            raise ArgValueNotSupportedError(
+                value=after,
+                function_name=self._parse_after.__name__,
+                class_name=self.__class__.__name__,
+            )
 
-        if sort_method == "asc":
-            return sorted_objs
-        else:
-            return sorted_objs[::-1]
+    def _order_query(
+        self,
+        query: Select,
+        *,
+        sort_key: str | None = None,
+        sort_method: Literal["asc", "desc"] | None = None,
+        after: str | None = None,
+    ) -> Select:
+        """
+        Orders the query in the database, and continues after the `after` cursor
+        if given. All order columns share the sort method, so the cursor is a single
+        row comparison which can use the primary key index.
+        """
+        order_columns = self._get_order_columns(sort_key)
+        descending = sort_method == "desc"
+        if after is not None:
+            # Bound with the column types, or asyncpg receives untyped parameters
+            after_row = tuple_(
+                *self._parse_after(after, order_columns=order_columns),
+                types=[column.type for column in order_columns],
+            )
+            if descending:
+                query = query.filter(tuple_(*order_columns) < after_row)
+            else:
+                query = query.filter(tuple_(*order_columns) > after_row)
+        return query.order_by(
+            *(column.desc() if descending else column.asc() for column in order_columns)
+        )
 
     def _map_obj_pks_to_value(
         self,
@@ -105,6 +194,68 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
 
         return obj_pks_values
 
+    def _dump_create_objects(
+        self, obj_in: CreateSchemaType | list[CreateSchemaType]
+    ) -> list[dict[str, Any]]:
+        """
+        Dump create objects for insertion. Primary keys left empty are left out, so
+        the database generates them. Reserved ids can be given up front instead.
+        """
+        if not isinstance(obj_in, list):
+            obj_in = [obj_in]
+
+        primary_keys = [
+            key.name
+            for key in self.model.__table__.primary_key
+            if key.name in self.create_schema.model_fields
+        ]
+
+        return [
+            obj.model_dump(
+                exclude={key for key in primary_keys if getattr(obj, key) is None}
+            )
+            for obj in obj_in
+        ]
+
+    async def reserve_ids(
+        self, db: AsyncSession, *, count: int
+    ) -> list[tuple[int, int]]:
+        """
+        Reserve `count` values of the identity sequence of the primary key, so
+        clients can assign ids before inserting.
+
+        Values are taken with `nextval`, so they are never handed out twice, even with
+        concurrent inserts. They are usually, but not always, contiguous. They are
+        returned as ascending inclusive ranges of `(first_id, last_id)`.
+        """
+        (primary_key,) = self.model.__table__.primary_key
+        quote = db.get_bind().dialect.identifier_preparer.quote
+        sequence_name = func.pg_get_serial_sequence(
+            self.model.__tablename__, quote(primary_key.name)
+        )
+        reserve_stmt = select(func.nextval(sequence_name)).select_from(
+            func.generate_series(1, count)
+        )
+        try:
+            async with db.begin():
+                reserved_ids = sorted((await db.scalars(reserve_stmt)).all())
+        except Exception as e:
+            raise GeneralDBError(
+                model_table_name=self.model.__tablename__,
+                function_name=self.reserve_ids.__name__,
+                class_name=self.__class__.__name__,
+                exception=e,
+            )
+
+        id_ranges: list[tuple[int, int]] = []
+        for reserved_id in reserved_ids:
+            if id_ranges and id_ranges[-1][1] == reserved_id - 1:
+                id_ranges[-1] = (id_ranges[-1][0], reserved_id)
+            else:
+                id_ranges.append((reserved_id, reserved_id))
+
+        return id_ranges
+
     def _batch_iterable(
         self, iterable: Iterable[Any], batch_size: int
     ) -> Generator[list[Any], None, None]:
@@ -115,15 +266,15 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
                 break
             yield batch
 
-    def _create_bulk_insert(
+    async def _create_bulk_insert(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         model_dict_list,
         return_nothing: bool | None = None,
     ) -> list[ModelType] | None:
         """
-        Create objects with bulk_insert.
+        Create objects with bulk_insert, in the transaction of the session.
 
         Approx. 3 times faster with `return_nothing=True`.
         """
@@ -131,12 +282,11 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
         create_stmt = insert(self.model)
         try:
             if return_nothing:
-                db.execute(create_stmt, model_dict_list)
+                await db.execute(create_stmt, model_dict_list)
             else:
                 create_stmt = create_stmt.returning(self.model)
-                created_objects = db.scalars(create_stmt, model_dict_list).all()
+                created_objects = (await db.scalars(create_stmt, model_dict_list)).all()
         except Exception as e:
-            db.rollback()
             reason = str(e.args[0])
             model_pks = self._map_obj_pks_to_value(model_dict_list)
             if "duplicate key value violates unique constraint" in reason:
@@ -156,16 +306,17 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
         if not return_nothing:
             return created_objects
 
-    def _create_with_on_conflict_do_nothing(
+    async def _create_with_on_conflict_do_nothing(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         model_dict_list: list[dict[str, Any]],
         return_nothing: bool | None = None,
         constraint: str | None = None,
     ) -> list[ModelType] | None:
         """
-        Create objects with on_conflict_do_nothing and batching.
+        Create objects with on_conflict_do_nothing and batching, in the transaction
+        of the session.
         """
         logger.debug(f"Total objects to create: {len(model_dict_list)}")
 
@@ -183,13 +334,12 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
                     .on_conflict_do_nothing(constraint=constraint)
                 )
                 if return_nothing:
-                    db.execute(create_stmt)
+                    await db.execute(create_stmt)
                 else:
                     create_stmt = create_stmt.returning(self.model)
-                    objs_returned = db.execute(create_stmt).scalars().all()
+                    objs_returned = (await db.scalars(create_stmt)).all()
                     created_objects.extend(objs_returned)
             except Exception as e:
-                db.rollback()
                 raise GeneralDBError(
                     model_table_name=self.model.__tablename__,
                     function_name=self.create.__name__,
@@ -200,22 +350,273 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
         if not return_nothing:
             return created_objects
 
+    def _rows_to_csv(
+        self, *, columns: list[str], model_dict_list: list[dict[str, Any]]
+    ) -> io.BytesIO:
+        """
+        Writes rows as CSV for `COPY FROM STDIN`. Non null values are quoted, so empty
+        strings stay empty strings.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+        for model_dict in model_dict_list:
+            writer.writerow(
+                json.dumps(value) if isinstance(value, dict | list) else value
+                for value in (model_dict[key] for key in columns)
+            )
+        return io.BytesIO(buffer.getvalue().encode("utf-8"))
+
+    async def _copy_csv(
+        self,
+        db: AsyncSession,
+        *,
+        table_name: str,
+        columns: list[str],
+        csv_file: IO[bytes],
+        header: bool = False,
+    ) -> None:
+        "Copy a CSV file into a table, in the transaction of the session"
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_to_table(
+            table_name,
+            source=csv_file,
+            columns=columns,
+            format="csv",
+            header=header,
+        )
+
+    async def _copy_into_table(
+        self,
+        db: AsyncSession,
+        *,
+        columns: list[str],
+        csv_file: IO[bytes],
+        header: bool = False,
+        return_nothing: bool | None = None,
+        on_duplicate_pkey_do_nothing: bool | None = None,
+        constraint: str | None = None,
+        defaults: dict[str, Any] | None = None,
+    ) -> list[ModelType] | None:
+        """
+        Rows are copied straight into the table when nothing is returned, duplicates
+        can't be ignored and no `defaults` are given for left out columns. Otherwise
+        they are copied into a staging table, and moved with `INSERT ... SELECT`, which
+        can use `ON CONFLICT DO NOTHING` and `RETURNING`.
+        """
+        table_name = self.model.__tablename__
+        defaults = defaults or {}
+        if return_nothing and not on_duplicate_pkey_do_nothing and not defaults:
+            await self._copy_csv(
+                db,
+                table_name=table_name,
+                columns=columns,
+                csv_file=csv_file,
+                header=header,
+            )
+            return None
+
+        staging_table = table(
+            f"{table_name}_staging", *(column(key) for key in columns)
+        )
+        dialect = db.get_bind().dialect
+        quote = dialect.identifier_preparer.quote
+        staging_select = select(
+            *(self.model.__table__.c[key] for key in columns)
+        ).compile(dialect=dialect)
+        # Dropped when the transaction commits, callers copy once per transaction
+        await db.execute(
+            text(
+                f"CREATE TEMPORARY TABLE {quote(staging_table.name)} ON COMMIT DROP "
+                f"AS {staging_select} "
+                "WITH NO DATA"
+            )
+        )
+        await self._copy_csv(
+            db,
+            table_name=staging_table.name,
+            columns=columns,
+            csv_file=csv_file,
+            header=header,
+        )
+        create_stmt = insert(self.model).from_select(
+            [*columns, *defaults],
+            select(
+                staging_table,
+                *(literal(value).label(key) for key, value in defaults.items()),
+            ),
+        )
+        if on_duplicate_pkey_do_nothing:
+            create_stmt = create_stmt.on_conflict_do_nothing(
+                constraint=f"{table_name}_pkey" if not constraint else constraint
+            )
+        if return_nothing:
+            await db.execute(create_stmt)
+            created_objects = None
+        else:
+            created_objects = (
+                await db.scalars(create_stmt.returning(self.model))
+            ).all()
+
+        return created_objects
+
+    async def _create_with_copy(
+        self,
+        db: AsyncSession,
+        *,
+        model_dict_list: list[dict[str, Any]],
+        return_nothing: bool | None = None,
+        on_duplicate_pkey_do_nothing: bool | None = None,
+        constraint: str | None = None,
+    ) -> list[ModelType] | None:
+        """
+        Create objects with `COPY FROM STDIN`, typically an order of magnitude faster
+        than executemany for large lists of objects.
+        """
+        if not model_dict_list:
+            return None if return_nothing else []
+
+        logger.debug(f"Total objects to copy: {len(model_dict_list)}")
+        columns = list(model_dict_list[0])
+        try:
+            return await self._copy_into_table(
+                db,
+                columns=columns,
+                csv_file=self._rows_to_csv(
+                    columns=columns, model_dict_list=model_dict_list
+                ),
+                return_nothing=return_nothing,
+                on_duplicate_pkey_do_nothing=on_duplicate_pkey_do_nothing,
+                constraint=constraint,
+            )
+        except Exception as e:
+            reason = str(e.args[0])
+            if "duplicate key value violates unique constraint" in reason:
+                raise DbObjectAlreadyExistsError(
+                    model_table_name=self.model.__tablename__,
+                    filter=self._map_obj_pks_to_value(model_dict_list),
+                    function_name=self.create.__name__,
+                    class_name=self.__class__.__name__,
+                )
+            else:
+                raise GeneralDBError(
+                    model_table_name=self.model.__tablename__,
+                    function_name=self.create.__name__,
+                    class_name=self.__class__.__name__,
+                    exception=e,
+                )
+
+    def _validate_csv_columns(self, columns: list[str]) -> dict[str, Any]:
+        """
+        Validates the columns of a CSV file against the create schema.
+
+        Returns the schema defaults of left out columns, as `COPY` does not apply them.
+        """
+        fields = self.create_schema.model_fields
+        unknown_columns = [key for key in columns if key not in fields]
+        missing_columns = [
+            key
+            for key, field in fields.items()
+            if key not in columns and field.is_required()
+        ]
+        if unknown_columns or missing_columns or len(set(columns)) != len(columns):
+            raise DbInvalidCopyDataError(
+                model_table_name=self.model.__tablename__,
+                reason=(
+                    f"Invalid columns. Unknown: {unknown_columns}. "
+                    f"Missing: {missing_columns}. Duplicated columns are not allowed."
+                ),
+                function_name=self.create_from_csv.__name__,
+                class_name=self.__class__.__name__,
+            )
+
+        return {
+            key: field.default
+            for key, field in fields.items()
+            if key not in columns and field.default is not None
+        }
+
+    async def create_from_csv(
+        self,
+        db: AsyncSession,
+        *,
+        csv_file: IO[bytes],
+        on_duplicate_pkey_do_nothing: bool | None = None,
+        on_conflict_constraint: str | None = None,
+    ) -> None:
+        """
+        Create objects from a CSV file with a header, without building objects per row.
+
+        The header is validated against the create schema once, and each column is
+        parsed by postgres while copying. Empty unquoted values are null.
+
+        **Parameters**
+
+        * db: A SQLAlchemy async session
+        * csv_file: A binary CSV file, with the column names in the first row
+        * on_duplicate_pkey_do_nothing: Ignore objects with duplicate primary keys.
+        """
+        header = csv_file.readline().decode("utf-8")
+        columns = next(csv.reader([header]), [])
+        defaults = self._validate_csv_columns(columns)
+        csv_file.seek(0)
+
+        try:
+            async with db.begin():
+                await self._copy_into_table(
+                    db,
+                    columns=columns,
+                    csv_file=csv_file,
+                    header=True,
+                    return_nothing=True,
+                    on_duplicate_pkey_do_nothing=on_duplicate_pkey_do_nothing,
+                    constraint=on_conflict_constraint,
+                    defaults=defaults,
+                )
+        except (
+            DataError,  # Raised by asyncpg itself on COPY
+            IntegrityConstraintViolationError,
+            sa_exc.DataError,
+            sa_exc.IntegrityError,
+        ) as e:
+            raise DbInvalidCopyDataError(
+                model_table_name=self.model.__tablename__,
+                reason=str(getattr(e, "orig", e)).strip(),
+                function_name=self.create_from_csv.__name__,
+                class_name=self.__class__.__name__,
+            )
+        except Exception as e:
+            raise GeneralDBError(
+                model_table_name=self.model.__tablename__,
+                function_name=self.create_from_csv.__name__,
+                class_name=self.__class__.__name__,
+                exception=e,
+            )
+        await self._invalidate_reference_cache()
+
     async def get(
         self,
-        db: Session,
+        db: AsyncSession,
         filter: dict[str, Any] | None = None,
         *,
         filter_params: FilterParams | None = None,
     ) -> ModelType | list[ModelType] | None:
-        query = db.query(self.model)
+        query = select(self.model)
         if filter is not None:
             query = query.filter_by(**filter)
         if filter_params is not None:
+            query = self._order_query(
+                query,
+                sort_key=filter_params.sort_key,
+                sort_method=filter_params.sort_method,
+                after=filter_params.after,
+            )
             if filter_params.skip is not None:
                 query = query.offset(filter_params.skip)
             if filter_params.limit is not None:
                 query = query.limit(filter_params.limit)
-        db_obj = query.all()
+        async with db.begin():
+            db_obj = (await db.scalars(query)).all()
 
         if not db_obj and not filter:  # Get all objs on an empty db
             pass
@@ -228,35 +629,28 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
             )
         if len(db_obj) == 1 and filter:
             db_obj = db_obj[0]
-        else:
-            if filter_params is None:
-                db_obj = self._sort_objects(db_obj)
-            else:
-                db_obj = self._sort_objects(
-                    db_obj,
-                    sort_key=filter_params.sort_key,
-                    sort_method=filter_params.sort_method,
-                )
         return self.validate(db_obj)
 
     async def create(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         obj_in: CreateSchemaType | list[CreateSchemaType],
         on_duplicate_pkey_do_nothing: bool | None = None,
         return_nothing: bool | None = None,
         on_conflict_constraint: str | None = None,
+        use_copy: bool | None = None,
     ) -> ModelType | list[ModelType] | None:
         """
         Create an object in the database.
 
         **Parameters**
 
-        * db: A SQLAlchemy session
+        * db: A SQLAlchemy async session
         * obj_in: A Pydantic model or list of Pydantic models
         * on_duplicate_pkey_do_nothing: Ignore objects with duplicate primary keys.
         * batch_size: The number of objects to insert in a single batch. Optimize number to max number of columns per query on insert.
+        * use_copy: Insert with `COPY FROM STDIN`. Faster for large lists of objects.
 
         **Returns**
 
@@ -266,30 +660,29 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
         """
         self.validate(obj_in)
 
-        primary_keys = [
-            field
-            for field in self.model.__table__.primary_key
-            if field in self.create_schema.model_fields
-        ]
+        model_dict_list = self._dump_create_objects(obj_in)
 
-        if isinstance(obj_in, list):
-            model_dict_list = [obj.model_dump(exclude=primary_keys) for obj in obj_in]
-        else:
-            model_dict_list = [obj_in.model_dump(exclude=primary_keys)]
-
-        if on_duplicate_pkey_do_nothing:
-            created_objects = self._create_with_on_conflict_do_nothing(
-                db,
-                model_dict_list=model_dict_list,
-                return_nothing=return_nothing,
-                constraint=on_conflict_constraint,
-            )
-        else:
-            created_objects = self._create_bulk_insert(
-                db, model_dict_list=model_dict_list, return_nothing=return_nothing
-            )
-
-        db.commit()
+        async with db.begin():
+            if use_copy:
+                created_objects = await self._create_with_copy(
+                    db,
+                    model_dict_list=model_dict_list,
+                    return_nothing=return_nothing,
+                    on_duplicate_pkey_do_nothing=on_duplicate_pkey_do_nothing,
+                    constraint=on_conflict_constraint,
+                )
+            elif on_duplicate_pkey_do_nothing:
+                created_objects = await self._create_with_on_conflict_do_nothing(
+                    db,
+                    model_dict_list=model_dict_list,
+                    return_nothing=return_nothing,
+                    constraint=on_conflict_constraint,
+                )
+            else:
+                created_objects = await self._create_bulk_insert(
+                    db, model_dict_list=model_dict_list, return_nothing=return_nothing
+                )
+        await self._invalidate_reference_cache()
 
         if not created_objects:
             return None
@@ -299,9 +692,48 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
 
         return self.validate(created_objects)
 
+    async def create_returning_ids(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: CreateSchemaType | list[CreateSchemaType],
+    ) -> list[int]:
+        """
+        Create objects, and return their generated primary key values in the same order
+        as `obj_in`. Only for models with a single primary key.
+
+        The ids are returned by the insert itself, so they are correct with concurrent
+        writers, unlike looking up the latest id afterwards.
+        """
+        self.validate(obj_in)
+        if not isinstance(obj_in, list):
+            obj_in = [obj_in]
+        if not obj_in:
+            return []
+
+        (primary_key,) = self.model.__table__.primary_key
+        create_stmt = insert(self.model).returning(
+            primary_key, sort_by_parameter_order=True
+        )
+        try:
+            async with db.begin():
+                created_ids = (
+                    await db.scalars(create_stmt, self._dump_create_objects(obj_in))
+                ).all()
+        except Exception as e:
+            raise GeneralDBError(
+                model_table_name=self.model.__tablename__,
+                function_name=self.create_returning_ids.__name__,
+                class_name=self.__class__.__name__,
+                exception=e,
+            )
+        await self._invalidate_reference_cache()
+
+        return list(created_ids)
+
     async def update(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         db_obj: ModelType,
         obj_in: UpdateSchemaType | dict[str, Any],
@@ -315,61 +747,70 @@ class CRUDBase(Generic[ModelType, SchemaType, CreateSchemaType, UpdateSchemaType
 
         # [0] because update can only update 1
         db_obj_primary_keys = self._map_obj_pks_to_value(db_obj)[0]
-        check_db_obj_exists = (
-            db.query(self.model).filter_by(**db_obj_primary_keys).first()
-        )
-        if not check_db_obj_exists:
-            raise DbObjectDoesNotExistError(
-                model_table_name=self.model.__tablename__,
-                filter=db_obj_primary_keys,
-                function_name=self.update.__name__,
-                class_name=self.__class__.__name__,
-            )
-
-        for field in obj_data:
-            if field in update_data:
-                logger.debug(
-                    f"Update field:{field}:Update data field:{update_data[field]}"
+        async with db.begin():
+            check_db_obj_exists = (
+                await db.scalars(
+                    select(self.model).filter_by(**db_obj_primary_keys).limit(1)
+                )
+            ).first()
+            if not check_db_obj_exists:
+                raise DbObjectDoesNotExistError(
+                    model_table_name=self.model.__tablename__,
+                    filter=db_obj_primary_keys,
+                    function_name=self.update.__name__,
+                    class_name=self.__class__.__name__,
                 )
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+
+            for field in obj_data:
+                if field in update_data:
+                    logger.debug(
+                        f"Update field:{field}:Update data field:{update_data[field]}"
+                    )
+                    setattr(db_obj, field, update_data[field])
+            db.add(db_obj)
+            await db.flush()
+            await db.refresh(db_obj)
+        await self._invalidate_reference_cache()
 
         return self.validate(db_obj)
 
     async def remove(
         self,
-        db: Session,
+        db: AsyncSession,
         *,
         filter: Any,
         sort_key: str | None = None,
-        sort_method: Literal["asc", "dec"] | None = None,
+        sort_method: Literal["asc", "desc"] | None = None,
         max_deletion_limit: int = 12,
     ) -> ModelType:
-        db_objs = db.query(self.model).filter_by(**filter).all()
-        if not db_objs:
-            raise DbObjectDoesNotExistError(
-                model_table_name=self.model.__tablename__,
-                filter=filter,
-                function_name=self.remove.__name__,
-                class_name=self.__class__.__name__,
-            )
-        elif (
-            len(db_objs) > max_deletion_limit
-        ):  # Arbitrary number, not too large, but should allow deleting all modifiers assosiated with an item
-            raise DbTooManyItemsDeleteError(
-                max_deletion_number=max_deletion_limit,
-                model_table_name=self.model.__tablename__,
-                function_name=self.remove.__name__,
-                class_name=self.__class__.__name__,
-            )
+        query = select(self.model).filter_by(**filter)
+        if sort_key is not None:
+            query = self._order_query(query, sort_key=sort_key, sort_method=sort_method)
+        async with db.begin():
+            db_objs = (await db.scalars(query)).all()
+            if not db_objs:
+                raise DbObjectDoesNotExistError(
+                    model_table_name=self.model.__tablename__,
+                    filter=filter,
+                    function_name=self.remove.__name__,
+                    class_name=self.__class__.__name__,
+                )
+            elif (
+                len(db_objs) > max_deletion_limit
+            ):  # Arbitrary number, not too large, but should allow deleting all modifiers assosiated with an item
+                raise DbTooManyItemsDeleteError(
+                    max_deletion_number=max_deletion_limit,
+                    model_table_name=self.model.__tablename__,
+                    function_name=self.remove.__name__,
+                    class_name=self.__class__.__name__,
+                )
+
+            if len(db_objs) == 1:
+                db_objs = db_objs[0]
+                await db.delete(db_objs)
+            else:
+                for obj in db_objs:
+                    await db.delete(obj)
+        await self._invalidate_reference_cache()
 
-        if len(db_objs) == 1:
-            db_objs = db_objs[0]
-            db.delete(db_objs)
-        else:
-            db_objs = self._sort_objects(db_objs, key=sort_key, sort_method=sort_method)
-            [db.delete(obj) for obj in db_objs]
-        db.commit()
         return self.validate(db_objs)
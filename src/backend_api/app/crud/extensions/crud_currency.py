@@ -1,6 +1,6 @@
 from pydantic import TypeAdapter
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import and_, func, or_
 
 from app.core.models.models import Currency as model_Currency
@@ -21,12 +21,13 @@ class CRUDCurrency(
         CurrencyUpdate,
     ]
 ):
-    async def get_latest_currency_id(self, db: Session) -> int:
+    async def get_latest_currency_id(self, db: AsyncSession) -> int:
         stmt = select(
             func.max(model_Currency.currencyId).label("latestCurrencyId")
         ).limit(1)
 
-        db_latest_currency_id = db.execute(stmt).mappings().first()
+        async with db.begin():
+            db_latest_currency_id = (await db.execute(stmt)).mappings().first()
         if db_latest_currency_id is not None:
             latest_currency_id = db_latest_currency_id["latestCurrencyId"]
         else:
@@ -47,11 +48,12 @@ class CRUDCurrency(
         )
 
     async def get_latest_hours(
-        self, db: Session, league_ids: list[int]
+        self, db: AsyncSession, league_ids: list[int]
     ) -> dict[int, int]:
         stmt = self._latest_hours_stmt(league_ids)
 
-        objs = db.execute(stmt).mappings().all()
+        async with db.begin():
+            objs = (await db.execute(stmt)).mappings().all()
         id_hour_map = {obj["leagueId"]: obj["latest_hour"] for obj in objs}
 
         validate = TypeAdapter(dict[int, int]).validate_python
@@ -59,7 +61,7 @@ class CRUDCurrency(
         return validate(id_hour_map)
 
     async def get_latest_currencies(
-        self, db: Session, league_ids: list[int]
+        self, db: AsyncSession, league_ids: list[int]
     ) -> list[Currency]:
         latest_hours = self._latest_hours_stmt(league_ids).subquery()
 
@@ -68,14 +70,15 @@ class CRUDCurrency(
             (model_Currency.leagueId == latest_hours.c.leagueId)
             & (model_Currency.createdHoursSinceLaunch == latest_hours.c.latest_hour),
         )
-        currencies = db.scalars(stmt).all()
+        async with db.begin():
+            currencies = (await db.scalars(stmt)).all()
 
         validate = TypeAdapter(list[Currency]).validate_python
 
         return validate(currencies)
 
     async def get_currency_from_query(
-        self, db: Session, query_list: list[CurrencyQuery]
+        self, db: AsyncSession, query_list: list[CurrencyQuery]
     ) -> list[Currency]:
         filters = []
         for query in query_list:
@@ -96,7 +99,8 @@ class CRUDCurrency(
                 filters.append(and_(*sub_filter))
         stmt = select(model_Currency).where(or_(*filters))
 
-        currencies = db.execute(stmt).scalars().all()
+        async with db.begin():
+            currencies = (await db.scalars(stmt)).all()
 
         validate = TypeAdapter(list[Currency]).validate_python
 
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import TypeAdapter
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models.models import League as model_League
 from app.core.schemas.league import (
@@ -14,7 +14,7 @@ from app.crud.base import CRUDBase
 
 
 class CRUDLeague(CRUDBase[model_League, League, LeagueCreate, LeagueUpdate]):
-    async def get_active_leagues(self, db: Session) -> list[League]:
+    async def get_active_leagues(self, db: AsyncSession) -> list[League]:
         now = datetime.now()
 
         stmt = select(model_League).where(
@@ -22,7 +22,8 @@ class CRUDLeague(CRUDBase[model_League, League, LeagueCreate, LeagueUpdate]):
             model_League.validTo.is_(None) | (model_League.validTo >= now),
         )
 
-        leagues = db.execute(stmt).scalars().all()
+        async with db.begin():
+            leagues = (await db.scalars(stmt)).all()
 
         validate = TypeAdapter(list[League]).validate_python
 
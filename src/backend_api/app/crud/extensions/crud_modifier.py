@@ -1,7 +1,7 @@
 from fastapi import HTTPException
 from pydantic import TypeAdapter
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models.models import Modifier as model_Modifier
 from app.core.schemas.modifier import (
@@ -22,7 +22,7 @@ class CRUDModifier(
     ]
 ):
     async def get_grouped_modifier_by_effect(
-        self, db: Session
+        self, db: AsyncSession
     ) -> GroupedModifierByEffect:
         stmt = select(
             model_Modifier.modifierId,
@@ -41,7 +41,10 @@ class CRUDModifier(
             ).label("groupedModifierProperties"),
         ).group_by(model_Modifier.modifierId)
 
-        grouped_modifier_by_effect_record = db.execute(stmt).mappings().all()
+        async with db.begin():
+            grouped_modifier_by_effect_record = (
+                (await db.execute(stmt)).mappings().all()
+            )
 
         if not grouped_modifier_by_effect_record:
             raise HTTPException(
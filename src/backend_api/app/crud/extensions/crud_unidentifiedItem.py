@@ -1,6 +1,6 @@
 from pydantic import TypeAdapter
 from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models.models import UnidentifiedItem as model_UnidentifiedItem
 from app.core.schemas.unidentified_item import (
@@ -19,7 +19,7 @@ class CRUDUnidentifiedItem(
         UnidentifiedItemUpdate,
     ]
 ):
-    async def get_non_aggregated(self, db: Session) -> list[UnidentifiedItem]:
+    async def get_non_aggregated(self, db: AsyncSession) -> list[UnidentifiedItem]:
         """
         Returns the non aggregated unidentified items
         """
@@ -27,18 +27,23 @@ class CRUDUnidentifiedItem(
             model_UnidentifiedItem.aggregated.isnot(True),
         )
 
-        non_aggregated = db.execute(stmt).scalars().all()
+        async with db.begin():
+            non_aggregated = (await db.scalars(stmt)).all()
 
         validate = TypeAdapter(list[UnidentifiedItem]).validate_python
 
         return validate(non_aggregated)
 
     async def add_aggregated(
-        self, db: Session, aggregated_objs: list[UnidentifiedItemCreate]
+        self, db: AsyncSession, aggregated_objs: list[UnidentifiedItemCreate]
     ):
         stmt = delete(model_UnidentifiedItem).where(
             model_UnidentifiedItem.aggregated.isnot(True),
         )
-        db.execute(stmt)
-
-        await self.create(db, obj_in=aggregated_objs, return_nothing=True)
+        async with db.begin():
+            await db.execute(stmt)
+            await self._create_bulk_insert(
+                db,
+                model_dict_list=self._dump_create_objects(aggregated_objs),
+                return_nothing=True,
+            )
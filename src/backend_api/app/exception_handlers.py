@@ -7,7 +7,6 @@ from fastapi.exception_handlers import (
 )
 from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi.responses import JSONResponse, PlainTextResponse, Response
-from slowapi.errors import RateLimitExceeded
 
 from app.exceptions.model_exceptions.rate_limit_exception import RateLimitExceededError
 from app.logs.logger import logger
@@ -71,25 +70,6 @@ async def unhandled_exception_handler(
     return PlainTextResponse(str(exc), status_code=500)
 
 
-async def slow_api_rate_limit_exceeded_handler(
-    request: Request,  # noqa: ARG001
-    exc: RateLimitExceeded,
-):
-    retry_after_seconds = exc.limit.limit.get_expiry()
-    max_amount_of_tries_per_time_period = exc.detail
-
-    response_body = {
-        "detail": f"POM API : Rate limit exceeded. Please try again later. "
-        f"max_tries: {max_amount_of_tries_per_time_period}s"
-    }
-
-    return JSONResponse(
-        status_code=429,
-        content=response_body,
-        headers={"Retry-After-Seconds": str(retry_after_seconds)},
-    )
-
-
 async def custom_rate_limit_exceeded_handler(
     request: Request,  # noqa: ARG001
     exc: RateLimitExceededError,
@@ -97,6 +97,28 @@ class DbObjectAlreadyExistsError(_DBErrorLogBase):
         )
 
 
+class DbInvalidCopyDataError(_DBErrorLogBase):
+    """Exception raised for invalid data copied into a table."""
+
+    def __init__(
+        self,
+        *,
+        model_table_name: str,
+        reason: str,
+        function_name: str | None = "Unknown function",
+        class_name: str | None = None,
+        status_code: int | None = status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ):
+        detail = f"Could not copy data into table '{model_table_name}'. {reason}"
+
+        super().__init__(
+            status_code=status_code,
+            function_name=function_name,
+            class_name=class_name,
+            detail=detail,
+        )
+
+
 class DbObjectDoesNotExistError(PathOfModifiersAPIError):
     """Exception raised for db object does not exist errors.
 
@@ -89,3 +89,56 @@ class PlotNoModifiersProvidedError(PathOfModifiersAPIError):
             class_name=class_name,
             detail=detail,
         )
+
+
+class PlotQueryTooExpensiveError(PathOfModifiersAPIError):
+    def __init__(
+        self,
+        *,
+        query_data: str,
+        estimated_cost: float | None = None,
+        function_name: str | None = "Unknown function",
+        class_name: str | None = None,
+        status_code: int | None = status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ):
+        reason = (
+            f"estimated cost {estimated_cost:.0f}"
+            if estimated_cost is not None
+            else "cancelled after running too long"
+        )
+        detail = (
+            f"Plot query is too broad ({reason}). "
+            f"Narrow it down with `start` and `end`, fewer leagues or a specific item. "
+            f"Query data: {query_data}"
+        )
+
+        # Call the parent constructor with a specific status code
+        super().__init__(
+            status_code=status_code,
+            function_name=function_name,
+            class_name=class_name,
+            detail=detail,
+        )
+
+
+class PlotQueryBusyError(PathOfModifiersAPIError):
+    def __init__(
+        self,
+        *,
+        query_data: str,
+        function_name: str | None = "Unknown function",
+        class_name: str | None = None,
+        status_code: int | None = status.HTTP_503_SERVICE_UNAVAILABLE,
+    ):
+        detail = (
+            "Too many expensive plot queries are running, try again later. "
+            f"Query data: {query_data}"
+        )
+
+        # Call the parent constructor with a specific status code
+        super().__init__(
+            status_code=status_code,
+            function_name=function_name,
+            class_name=class_name,
+            detail=detail,
+        )
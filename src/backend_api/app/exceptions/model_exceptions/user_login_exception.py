@@ -261,3 +261,22 @@ class UserUsernameRequiredError(PathOfModifiersAPIError):
             class_name=class_name,
             detail=detail,
         )
+
+
+class PasswordHashingBusyError(PathOfModifiersAPIError):
+    """Exception raised when too many password checks are waiting to run."""
+
+    def __init__(
+        self,
+        *,
+        function_name: str | None = "Unknown function",
+        class_name: str | None = None,
+        status_code: int | None = status.HTTP_503_SERVICE_UNAVAILABLE,
+    ):
+        detail = "Too many passwords are being checked, try again later."
+        super().__init__(
+            status_code=status_code,
+            function_name=function_name,
+            class_name=class_name,
+            detail=detail,
+        )
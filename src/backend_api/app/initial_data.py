@@ -1,22 +1,21 @@
+import asyncio
 import logging
 
-from sqlalchemy.orm import Session
-
-from app.core.models.database import engine
+from app.core.models.database import AsyncSessionLocal
 from app.core.models.init_db import init_db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def init() -> None:
-    with Session(engine) as session:
-        init_db(session)
+async def init() -> None:
+    async with AsyncSessionLocal() as session:
+        await init_db(session)
 
 
 def main() -> None:
     logger.info("Creating initial data")
-    init()
+    asyncio.run(init())
     logger.info("Initial data created")
 
 
@@ -23,4 +23,6 @@ logger_request = logging.getLogger("pom_app.request")
 
 plot_logger = logging.getLogger("pom_app.plot")
 
+pool_logger = logging.getLogger("pom_app.pool")
+
 test_logger = logging.getLogger("pom_app.test")
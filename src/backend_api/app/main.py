@@ -1,25 +1,31 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.routing import APIRoute
-from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException
 from starlette.middleware.cors import CORSMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from app.api.api import api_router
+from app.core.cache.cache import cache, cache_pool
 from app.core.config import settings
-from app.core.models.database import async_engine
+from app.core.models.database import (
+    async_engine,
+    heavy_async_engine,
+    low_priority_async_engine,
+)
+from app.core.models.pool_metrics import log_pool_metrics
+from app.core.security import password_hash_pool
 from app.exception_handlers import (
     custom_rate_limit_exceeded_handler,
     http_exception_handler,
     request_validation_exception_handler,
-    slow_api_rate_limit_exceeded_handler,
     unhandled_exception_handler,
 )
 from app.exceptions.model_exceptions.rate_limit_exception import RateLimitExceededError
-from app.logs.logger import setup_logging
+from app.logs.logger import logger, setup_logging
 from app.middleware.request_logs import log_request_middleware
 
 
@@ -31,8 +37,25 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 async def lifespan(app: FastAPI):  # noqa: ARG001
     # Load the ML model
     setup_logging()
+    try:
+        await cache.ping()
+    except Exception as e:
+        logger.warning(f"Redis is not reachable on startup: {e}")
+    engines = [async_engine, heavy_async_engine, low_priority_async_engine]
+    pool_metrics_task = asyncio.create_task(
+        log_pool_metrics(
+            engines,
+            cache_pool,
+            [password_hash_pool],
+            interval_seconds=settings.DATABASE_POOL_METRICS_INTERVAL_SECONDS,
+        )
+    )
     yield
-    await async_engine.dispose()
+    pool_metrics_task.cancel()
+    for engine in engines:
+        await engine.dispose()
+    await cache_pool.aclose()
+    password_hash_pool.shutdown()
 
 
 app = FastAPI(
@@ -64,7 +87,6 @@ app.middleware("http")(log_request_middleware)
 app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
-app.add_exception_handler(RateLimitExceeded, slow_api_rate_limit_exceeded_handler)
 app.add_exception_handler(RateLimitExceededError, custom_rate_limit_exceeded_handler)
 
 app.add_middleware(ProxyHeadersMiddleware)
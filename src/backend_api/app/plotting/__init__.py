@@ -1,3 +1,10 @@
+from app.core.cache.plot_cache import plot_cache
+
+from .formats import (
+    PLOT_COLUMNAR_MEDIA_TYPE,
+    accepts_columnar_plot_data,
+    to_columnar_plot_data,
+)
 from .plotter import PlotterService, configure_plotter_by_query
 
-plotter_service = PlotterService()
+plotter_service = PlotterService(plot_cache=plot_cache)
@@ -0,0 +1,47 @@
+from collections.abc import Sequence
+
+
+def largest_triangle_three_buckets(
+    x: Sequence[float], y: Sequence[float], threshold: int
+) -> list[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point, and from each of the `threshold` - 2 buckets in
+    between, the point forming the largest triangle with the previously kept point and
+    the average point of the next bucket. Keeps the visual shape of the series.
+
+    Returns the indices of the kept points, in order.
+    """
+    n_points = len(x)
+    if threshold >= n_points or threshold < 3:
+        return list(range(n_points))
+
+    bucket_size = (n_points - 2) / (threshold - 2)
+    kept_indices = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        next_start = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, n_points)
+        next_length = next_end - next_start
+        avg_x = sum(x[next_start:next_end]) / next_length
+        avg_y = sum(y[next_start:next_end]) / next_length
+
+        bucket_start = int(bucket * bucket_size) + 1
+        bucket_end = int((bucket + 1) * bucket_size) + 1
+        max_area = -1.0
+        kept = bucket_start
+        for index in range(bucket_start, bucket_end):
+            area = abs(
+                (x[previous] - avg_x) * (y[index] - y[previous])
+                - (x[previous] - x[index]) * (avg_y - y[previous])
+            )
+            if area > max_area:
+                max_area = area
+                kept = index
+
+        kept_indices.append(kept)
+        previous = kept
+
+    kept_indices.append(n_points - 1)
+    return kept_indices
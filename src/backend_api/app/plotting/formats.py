@@ -0,0 +1,36 @@
+from app.core.schemas.plot import ColumnarPlotData, PlotData, TimeseriesColumns
+
+PLOT_COLUMNAR_MEDIA_TYPE = "application/vnd.pom.plot.columnar+json"
+
+
+def accepts_columnar_plot_data(accept: str | None) -> bool:
+    "Whether the `Accept` header asks for columnar plot data"
+    if accept is None:
+        return False
+    return any(
+        media_range.split(";")[0].strip() == PLOT_COLUMNAR_MEDIA_TYPE
+        for media_range in accept.split(",")
+    )
+
+
+def to_columnar_plot_data(plot_data: PlotData) -> ColumnarPlotData:
+    """
+    Converts plot data to one array per `Datum` field and league. Key names are
+    only sent once per league, instead of once per hour.
+    """
+    data = [
+        TimeseriesColumns.model_construct(
+            leagueId=timeseries.leagueId,
+            confidenceRating=timeseries.confidenceRating,
+            hoursSinceLaunch=[datum.hoursSinceLaunch for datum in timeseries.data],
+            valueInChaos=[datum.valueInChaos for datum in timeseries.data],
+            valueInMostCommonCurrencyUsed=[
+                datum.valueInMostCommonCurrencyUsed for datum in timeseries.data
+            ],
+            confidence=[datum.confidence for datum in timeseries.data],
+        )
+        for timeseries in plot_data.data
+    ]
+    return ColumnarPlotData.model_construct(
+        mostCommonCurrencyUsed=plot_data.mostCommonCurrencyUsed, data=data
+    )
@@ -0,0 +1,88 @@
+from time import monotonic
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.logs.logger import plot_logger
+
+
+class ModifierSelectivity:
+    """
+    Some ModifierSelectivity mechanics:
+
+    Estimates the fraction of `item_modifier` rows that have a given `modifierId`,
+    using the same column statistics the postgres planner uses (`pg_stats`).
+
+    Frequent modifier ids are listed in `most_common_vals`, with their frequency in
+    `most_common_freqs`. The remaining frequency is spread evenly over the remaining
+    distinct modifier ids.
+
+    Statistics are kept in process and reloaded after `expire_seconds`.
+    """
+
+    stats_statement = text(
+        """
+        SELECT
+            most_common_vals::TEXT::INT[] AS most_common_vals,
+            most_common_freqs,
+            n_distinct
+        FROM pg_stats
+        WHERE tablename = 'item_modifier' AND attname = 'modifierId'
+        ORDER BY inherited DESC
+        LIMIT 1
+        """
+    )
+
+    def __init__(
+        self,
+        *,
+        expire_seconds: int = settings.PLOT_MODIFIER_SELECTIVITY_EXPIRE_SECONDS,
+    ) -> None:
+        self.expire_seconds = expire_seconds
+        self._most_common_freqs: dict[int, float] = {}
+        self._other_freq: float = 1.0
+        self._loaded_at: float | None = None
+
+    def _is_expired(self) -> bool:
+        return (
+            self._loaded_at is None
+            or monotonic() - self._loaded_at > self.expire_seconds
+        )
+
+    async def refresh(self, db: AsyncSession) -> None:
+        "Reloads statistics from `pg_stats` if they have expired"
+        if not self._is_expired():
+            return
+
+        self._loaded_at = monotonic()
+        try:
+            async with db.begin():
+                result = await db.execute(self.stats_statement)
+            stats = result.mappings().first()
+        except Exception as e:
+            plot_logger.warning(f"Could not load modifier selectivity: {e}")
+            return
+
+        if stats is None or stats["most_common_vals"] is None:
+            return
+
+        self._most_common_freqs = dict(
+            zip(stats["most_common_vals"], stats["most_common_freqs"], strict=True)
+        )
+        # Ids outside of `most_common_vals` are never more frequent than the least common one
+        self._other_freq = min(self._most_common_freqs.values(), default=1.0)
+        n_distinct = stats["n_distinct"]
+        if n_distinct > len(self._most_common_freqs):  # Negative when relative to rows
+            n_other = n_distinct - len(self._most_common_freqs)
+            self._other_freq = min(
+                self._other_freq,
+                (1 - sum(self._most_common_freqs.values())) / n_other,
+            )
+
+    def estimate(self, modifier_id: int) -> float:
+        "Estimated fraction of `item_modifier` rows with the modifier id"
+        return self._most_common_freqs.get(modifier_id, self._other_freq)
+
+
+modifier_selectivity = ModifierSelectivity()
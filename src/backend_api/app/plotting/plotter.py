@@ -1,26 +1,39 @@
+import json
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from time import perf_counter
 from typing import Any, Generic, TypeVar
 
-import pandas as pd
-from pydantic import TypeAdapter
+from asyncpg.exceptions import QueryCanceledError
 from pydantic.fields import FieldInfo
 from sqlalchemy import (
     BinaryExpression,
     ColumnElement,
     Label,
     Result,
+    RowMapping,
+    SmallInteger,
     and_,
     case,
     desc,
     func,
+    intersect,
+    literal,
+    literal_column,
     or_,
     select,
+    union_all,
 )
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
-from sqlalchemy.sql.expression import Select
+from sqlalchemy.sql.expression import CTE, CompoundSelect, Select
 
-from app.core.models.database import engine
+from app.core.cache.plot_cache import PlotCache, plot_cache
+from app.core.config import settings
+from app.core.models.database import LowPriorityAsyncSessionLocal, async_engine
 from app.core.models.models import (
     Currency as model_Currency,
 )
@@ -30,6 +43,9 @@ from app.core.models.models import (
 from app.core.models.models import (
     ItemBaseType as model_ItemBaseType,
 )
+from app.core.models.models import (
+    ItemHourlyPrice as model_ItemHourlyPrice,
+)
 from app.core.models.models import (
     ItemModifier as model_ItemModifier,
 )
@@ -41,29 +57,52 @@ from app.core.models.models import (
 )
 from app.core.schemas.plot import (
     BasePlotQuery,
+    Datum,
     IdentifiedPlotQuery,
     ItemSpecs,
     ModifierLimitation,
     PlotData,
     PlotQuery,
+    TimeseriesData,
     UnidentifiedPlotQuery,
     WantedModifier,
 )
 from app.exceptions.model_exceptions.plot_exception import (
+    PlotQueryBusyError,
     PlotQueryDataNotFoundError,
     PlotQueryInvalidError,
+    PlotQueryTooExpensiveError,
 )
 from app.logs.logger import plot_logger
+from app.plotting.downsampling import largest_triangle_three_buckets
+from app.plotting.modifier_selectivity import modifier_selectivity
+from app.utils.explain import Explain
+from app.utils.statement_fingerprint import StatementFingerprinter
 from app.utils.timing_tracker import async_timing_tracker, sync_timing_tracker
 
 Q = TypeVar("Q", bound=PlotQuery)
 
 
+PLOT_RESOLUTION_HOURS = {"1h": 1, "6h": 6, "1d": 24}
+
+statement_fingerprinter = StatementFingerprinter(
+    dialect=async_engine.dialect, max_size=settings.PLOT_STATEMENT_CACHE_SIZE
+)
+
+
+def _is_query_canceled(e: DBAPIError) -> bool:
+    "Whether postgres cancelled the statement, like on `statement_timeout`"
+    return (
+        isinstance(e.orig.__cause__, QueryCanceledError)
+        or getattr(e.orig, "sqlstate", None) == QueryCanceledError.sqlstate
+    )
+
+
 class _BasePlotter(ABC, Generic[Q]):
     "Base for plotting strategies"
 
-    def __init__(self):
-        self.validate = TypeAdapter(PlotData).validate_python
+    def __init__(self, *, plot_cache: PlotCache | None = None):
+        self.plot_cache = plot_cache
 
     @abstractmethod
     def _raise_invalid_query(self, query: Q) -> None:
@@ -77,14 +116,21 @@ class _BasePlotter(ABC, Generic[Q]):
     def _create_plot_statement(self, query: Q) -> Select:
         "Creates SQLAlchmy select statement from the plot query"
 
-    @abstractmethod
-    async def _plot_execute(self, db: AsyncSession, *, statement: Select) -> PlotData:
-        "Executes statement to the database. Returns result as rows."
-
     @abstractmethod
     async def plot(self, db: AsyncSession, *, query: Q) -> PlotData:
         "Main orchestrator. Performs all necessary actions to perform plot query and return plot data"
 
+    def _bucket_hours(
+        self, hours: InstrumentedAttribute[int], *, query: Q
+    ) -> InstrumentedAttribute[int] | Label[int]:
+        "Buckets `createdHoursSinceLaunch` by the resolution of the query"
+        bucket_hours = PLOT_RESOLUTION_HOURS[query.resolution or "1h"]
+        if bucket_hours == 1:
+            return hours
+        return func.time_bucket(literal(bucket_hours, SmallInteger), hours).label(
+            "createdHoursSinceLaunch"
+        )
+
     def _init_stmt(
         self,
         query: Q,
@@ -96,7 +142,7 @@ class _BasePlotter(ABC, Generic[Q]):
     ) -> Select:
         select_args: list[InstrumentedAttribute[Any] | Label[Any]] = [
             item_model.itemId,
-            item_model.createdHoursSinceLaunch,
+            self._bucket_hours(item_model.createdHoursSinceLaunch, query=query),
             item_model.leagueId,
             item_model.itemBaseTypeId,
             item_model.currencyId,
@@ -132,7 +178,7 @@ class _BasePlotter(ABC, Generic[Q]):
         self,
         statement: Select,
         *,
-        item_model: type[model_Item | model_UniItem],
+        item_model: type[model_Item | model_UniItem | model_ItemHourlyPrice],
         query: Q,
     ) -> Select:
         if query.itemSpecifications is not None:
@@ -154,7 +200,7 @@ class _BasePlotter(ABC, Generic[Q]):
         self,
         statement: Select,
         *,
-        item_model: type[model_Item | model_UniItem],
+        item_model: type[model_Item | model_UniItem | model_ItemHourlyPrice],
         query: Q,
     ) -> Select:
         base_spec_query = query.baseSpecifications
@@ -203,53 +249,277 @@ class _BasePlotter(ABC, Generic[Q]):
         return statement.where(and_(True, *item_lvls))
 
     @sync_timing_tracker
-    def _convert_result_to_df(self, result: Result) -> pd.DataFrame:
-        rows = result.fetchall()
-        df = pd.DataFrame(rows, columns=result.keys())  # type: ignore
-        return df
+    def _fetch_plot_rows(self, result: Result) -> Sequence[RowMapping]:
+        return result.mappings().all()
 
     @async_timing_tracker
     async def _perform_plot_db_statement(
-        self, db: AsyncSession, *, statement: Select
+        self, db: AsyncSession, *, statement: Select | CompoundSelect
     ) -> Result:
         async with db.begin():
             result = await db.execute(statement)
 
         return result
 
+    async def _estimate_plot_statement_cost(
+        self, db: AsyncSession, *, statement: Select | CompoundSelect
+    ) -> float:
+        "Total cost of the statement, as estimated by the postgres planner"
+        async with db.begin():
+            result = await db.execute(Explain(statement))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return float(plan[0]["Plan"]["Total Cost"])
+
+    async def _execute_plot_statement(
+        self,
+        db: AsyncSession,
+        *,
+        statement: Select | CompoundSelect,
+        query_data: str,
+    ) -> Result:
+        """
+        Executes the plot statement and logs its fingerprint and timing. Parameters are
+        only logged at debug level, and literal SQL only for statements slower than
+        `PLOT_SLOW_STATEMENT_MS`.
+
+        With admission control, statements are planned first. Statements estimated
+        above `PLOT_REJECT_COST` are rejected, and statements above `PLOT_LOW_PRIORITY_COST`
+        run in the low priority pool, which has a statement timeout.
+        """
+        fingerprint, params = statement_fingerprinter.fingerprint(statement)
+
+        low_priority = False
+        estimated_cost = None
+        if settings.PLOT_ADMISSION_CONTROL_ENABLED:
+            estimated_cost = await self._estimate_plot_statement_cost(
+                db, statement=statement
+            )
+            plot_logger.debug(
+                f"Plot statement '{fingerprint}' has estimated cost {estimated_cost:.0f}"
+            )
+            if estimated_cost > settings.PLOT_REJECT_COST:
+                raise PlotQueryTooExpensiveError(
+                    query_data=query_data,
+                    estimated_cost=estimated_cost,
+                    function_name=self._execute_plot_statement.__name__,
+                    class_name=self.__class__.__name__,
+                )
+            low_priority = estimated_cost > settings.PLOT_LOW_PRIORITY_COST
+
+        start_time = perf_counter()
+        try:
+            if low_priority:
+                async with LowPriorityAsyncSessionLocal() as low_priority_db:
+                    result = await self._perform_plot_db_statement(
+                        low_priority_db, statement=statement
+                    )
+            else:
+                result = await self._perform_plot_db_statement(db, statement=statement)
+        except SQLAlchemyTimeoutError:
+            # No connection of the low priority pool became free in time
+            raise PlotQueryBusyError(
+                query_data=query_data,
+                function_name=self._execute_plot_statement.__name__,
+                class_name=self.__class__.__name__,
+            )
+        except DBAPIError as e:
+            if not _is_query_canceled(e):
+                raise
+            # Cancelled by the statement timeout of the pool
+            raise PlotQueryTooExpensiveError(
+                query_data=query_data,
+                estimated_cost=estimated_cost,
+                function_name=self._execute_plot_statement.__name__,
+                class_name=self.__class__.__name__,
+            )
+        total_time = (perf_counter() - start_time) * 1000  # Convert to milliseconds
+
+        plot_logger.info(
+            f"Plot statement '{fingerprint}' took {total_time:.2f} ms"
+            f"{' (low priority)' if low_priority else ''}"
+        )
+        plot_logger.debug(f"Plot statement '{fingerprint}' params: {params}")
+        if total_time > settings.PLOT_SLOW_STATEMENT_MS:
+            plot_logger.warning(
+                f"Slow plot statement '{fingerprint}' took {total_time:.2f} ms:\n"
+                f"{statement_fingerprinter.render_literal(statement)}"
+            )
+
+        return result
+
+    async def _execute_plot_query(
+        self, db: AsyncSession, *, query: Q
+    ) -> Sequence[Mapping[str, Any]]:
+        "Creates and executes the plot statement. Returns one row per hour and league."
+        statement = self._create_plot_statement(query)
+        result = await self._execute_plot_statement(
+            db, statement=statement, query_data=str(query)
+        )
+        return self._fetch_plot_rows(result)
+
+    @staticmethod
+    def _dump_plot_rows(rows: Sequence[Mapping[str, Any]]) -> str:
+        return json.dumps(rows, default=dict)
+
+    async def _execute_incremental_plot_query(
+        self, db: AsyncSession, *, query: Q
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Timeseries plots are append-only by `createdHoursSinceLaunch`. The per hour rows of
+        a query are kept in the plot cache, and only hours from the last cached hour and
+        onwards are computed. The last cached hour is recomputed, since it may have
+        been cached before the hour was fully ingested.
+
+        The most common currency is computed over the whole plot range. If the newly
+        computed hours disagree with the cached rows on it, the full range is recomputed.
+
+        With a coarse `resolution`, the tail may start inside a bucket. Cached rows of
+        that bucket are replaced by the tail, which recomputes the whole bucket.
+        """
+        cached_rows = await self.plot_cache.get_rows(query)
+        if cached_rows is None:
+            rows = await self._execute_plot_query(db, query=query)
+            if rows:
+                await self.plot_cache.set_rows(query, self._dump_plot_rows(rows))
+            return rows
+
+        cached: list[dict[str, Any]] = json.loads(cached_rows)
+        last_cached_hour = max(row["hoursSinceLaunch"] for row in cached)
+        if query.end is not None and query.end < last_cached_hour:
+            # The most common currency of a shorter range may differ from the cached one
+            return await self._execute_plot_query(db, query=query)
+
+        tail_start = max(last_cached_hour, query.start or last_cached_hour)
+        bucket_hours = PLOT_RESOLUTION_HOURS[query.resolution or "1h"]
+        tail_bucket_start = tail_start - tail_start % bucket_hours
+        tail_query = query.model_copy(update={"start": tail_start})
+        tail_rows = await self._execute_plot_query(db, query=tail_query)
+
+        if not tail_rows:
+            return cached
+        if (
+            tail_rows[0]["mostCommonCurrencyUsed"]
+            != cached[0]["mostCommonCurrencyUsed"]
+        ):
+            plot_logger.debug("Most common currency changed, recomputing full plot")
+            rows = await self._execute_plot_query(db, query=query)
+        else:
+            rows = [
+                row for row in cached if row["hoursSinceLaunch"] < tail_bucket_start
+            ] + list(tail_rows)
+
+        await self.plot_cache.set_rows(query, self._dump_plot_rows(rows))
+        return rows
+
+    async def _plot_execute(self, db: AsyncSession, *, query: Q) -> PlotData:
+        "Executes the plot query to the database. Returns result as plot data."
+        if self.plot_cache is not None and settings.PLOT_INCREMENTAL_ENABLED:
+            rows = await self._execute_incremental_plot_query(db, query=query)
+        else:
+            rows = await self._execute_plot_query(db, query=query)
+
+        if not rows:
+            raise PlotQueryDataNotFoundError(
+                query_data=str(query),
+                function_name=self.plot.__name__,
+                class_name=self.__class__.__name__,
+            )
+
+        return self._create_plot_data(rows, downsample=query.downsample)
+
+    @staticmethod
+    def _most_common_confidence(confidences: Counter[str]) -> str:
+        # Ties are broken alphabetically, same as `pd.Series.mode`
+        return min(
+            confidences, key=lambda confidence: (-confidences[confidence], confidence)
+        )
+
     @sync_timing_tracker
-    def _create_plot_data(self, df: pd.DataFrame) -> PlotData:
-        mostCommonCurrencyUsed = df["mostCommonCurrencyUsed"].get(
-            0, "divine"
-        )  # TODO: set enum
-        data = []
-        for league in df["leagueId"].unique():
-            league_df: pd.DataFrame = df.loc[df["leagueId"] == league]
-            league_data = league_df[
-                [
-                    "hoursSinceLaunch",
-                    "valueInChaos",
-                    "valueInMostCommonCurrencyUsed",
-                    "confidence",
-                ]
-            ].to_dict(orient="records")  # type: ignore
-            timeseries_data = {
-                "leagueId": league,
-                "confidenceRating": league_df["confidence"].mode()[0],
-                "data": league_data,
-            }
-            data.append(timeseries_data)
+    def _create_plot_data(
+        self, rows: Sequence[Mapping[str, Any]], *, downsample: int | None = None
+    ) -> PlotData:
+        """
+        Groups the per hour rows into one timeseries per league in a single pass.
+        Rows are ordered by hour, so each timeseries is ordered by hour as well.
+        With `downsample`, each timeseries is reduced to at most that many points.
+
+        The rows come straight from the plot statement and already have the types
+        of `PlotData`, so the models are constructed without validation.
+        """
+        league_data: dict[int, list[Datum]] = {}
+        league_confidences: dict[int, Counter[str]] = {}
+        for row in rows:
+            league_id = row["leagueId"]
+            if league_id not in league_data:
+                league_data[league_id] = []
+                league_confidences[league_id] = Counter()
+
+            league_data[league_id].append(
+                Datum.model_construct(
+                    hoursSinceLaunch=row["hoursSinceLaunch"],
+                    valueInChaos=row["valueInChaos"],
+                    valueInMostCommonCurrencyUsed=row["valueInMostCommonCurrencyUsed"],
+                    confidence=row["confidence"],
+                )
+            )
+            league_confidences[league_id][row["confidence"]] += 1
+
+        if downsample is not None:
+            for league_id, timeseries in league_data.items():
+                kept_indices = largest_triangle_three_buckets(
+                    [datum.hoursSinceLaunch for datum in timeseries],
+                    [datum.valueInChaos for datum in timeseries],
+                    downsample,
+                )
+                league_data[league_id] = [timeseries[index] for index in kept_indices]
+
+        data = [
+            TimeseriesData.model_construct(
+                leagueId=league_id,
+                data=timeseries,
+                confidenceRating=self._most_common_confidence(
+                    league_confidences[league_id]
+                ),
+            )
+            for league_id, timeseries in league_data.items()
+        ]
 
-        return self.validate(
-            {"mostCommonCurrencyUsed": mostCommonCurrencyUsed, "data": data}
+        mostCommonCurrencyUsed = (
+            rows[0]["mostCommonCurrencyUsed"] if rows else "divine"
+        )  # TODO: set enum
+        return PlotData.model_construct(
+            mostCommonCurrencyUsed=mostCommonCurrencyUsed, data=data
         )
 
 
 class IdentifiedPlotter(_BasePlotter):
     "Plotter strategy for identified items"
 
+    # Item specifications that are dimensions of the `item_hourly_price` continuous aggregate
+    hourly_aggregate_item_specs = {"name", "identified"}
+
+    def _uses_hourly_aggregate(self, query: PlotQuery | IdentifiedPlotQuery) -> bool:
+        """
+        Named item queries without `wantedModifiers`, only filtering on dimensions of the
+        `item_hourly_price` continuous aggregate, are plotted from the aggregate.
+        """
+        if not settings.PLOT_HOURLY_AGGREGATE_ENABLED or query.wantedModifiers:
+            return False
+
+        item_spec_query = query.itemSpecifications
+        if item_spec_query is None or item_spec_query.name is None:
+            return False
+
+        return all(
+            value is None
+            for key, value in item_spec_query
+            if key not in self.hourly_aggregate_item_specs
+        )
+
     def _raise_invalid_query(self, query: PlotQuery) -> None:
-        if not query.wantedModifiers or len(query.wantedModifiers) == 0:
+        if not query.wantedModifiers and not self._uses_hourly_aggregate(query):
             detail = (
                 "Could not perform plot. Query does not have `wantedModifiers` "
                 "specified (wrong for this strategy)"
@@ -293,55 +563,27 @@ class IdentifiedPlotter(_BasePlotter):
                 )
             return and_(True, *and_conditions)
 
-    def _add_wanted_modifiers(
+    def _create_modifier_conditions(
         self,
-        statement: Select,
         *,
         wanted_modifier_query: list[WantedModifier],
         start: int | None,
         end: int | None,
-    ) -> Select:
-        """
-        Uses as few modifier ids as possible to filter. One modifier effect has multiple
-        modifier ids assosiated with it. Here, the ones with a roll limitation from the user
-        are prioritized. If none are found (modifier_roll_limitation_found=False), a random
-        one is chosen.
-        """
-        exists_conditions = []
+    ) -> list[tuple[int, list[ColumnElement[bool]]]]:
+        "Conditions on `item_modifier` rows, one list per modifier limitation"
+        modifier_conditions = []
         for wanted_modifier in wanted_modifier_query:
+            roll_conditions: list[ColumnElement[bool]] = [and_(True)]
             if wanted_modifier.modifierLimitations is not None:
-                for modifier_limitation in wanted_modifier.modifierLimitations:
-                    roll_condition = self._check_rolls(modifier_limitation)
-
-                    and_conditions = [
-                        model_Item.itemId == model_ItemModifier.itemId,
-                        model_ItemModifier.modifierId == wanted_modifier.modifierId,
-                        roll_condition,
-                    ]
-
-                    if start is not None:
-                        and_conditions.append(
-                            model_ItemModifier.createdHoursSinceLaunch >= start
-                        )
-
-                    if end is not None:
-                        and_conditions.append(
-                            model_ItemModifier.createdHoursSinceLaunch <= end
-                        )
-                    exists_conditions.append(
-                        select(1)
-                        .where(
-                            and_(
-                                True,
-                                *and_conditions,
-                            )
-                        )
-                        .exists()
-                    )
-            else:
+                roll_conditions = [
+                    self._check_rolls(modifier_limitation)
+                    for modifier_limitation in wanted_modifier.modifierLimitations
+                ]
+
+            for roll_condition in roll_conditions:
                 and_conditions = [
-                    model_Item.itemId == model_ItemModifier.itemId,
                     model_ItemModifier.modifierId == wanted_modifier.modifierId,
+                    roll_condition,
                 ]
                 if start is not None:
                     and_conditions.append(
@@ -351,18 +593,62 @@ class IdentifiedPlotter(_BasePlotter):
                     and_conditions.append(
                         model_ItemModifier.createdHoursSinceLaunch <= end
                     )
-                exists_conditions.append(
-                    select(1).where(and_(True, *and_conditions)).exists()
+                modifier_conditions.append((wanted_modifier.modifierId, and_conditions))
+
+        return modifier_conditions
+
+    def _add_wanted_modifiers(
+        self,
+        statement: Select,
+        *,
+        wanted_modifier_query: list[WantedModifier],
+        start: int | None,
+        end: int | None,
+        item_id: ColumnElement[int] | InstrumentedAttribute[int] = model_Item.itemId,
+    ) -> Select:
+        """
+        Filters items on having every wanted modifier, within the roll limitations.
+
+        With a single modifier limitation, a correlated `EXISTS` is used. With multiple,
+        the candidate item ids of each limitation are intersected instead, starting
+        with the modifier ids that have the fewest `item_modifier` rows. This avoids
+        probing `item_modifier` once per limitation for every candidate item.
+        """
+        modifier_conditions = self._create_modifier_conditions(
+            wanted_modifier_query=wanted_modifier_query, start=start, end=end
+        )
+
+        if len(modifier_conditions) < 2 or not settings.PLOT_MODIFIER_INTERSECT_ENABLED:
+            exists_conditions = [
+                select(1)
+                .where(
+                    and_(True, item_id == model_ItemModifier.itemId, *and_conditions)
                 )
+                .exists()
+                for _, and_conditions in modifier_conditions
+            ]
+            return statement.where(and_(True, *exists_conditions))
+
+        modifier_conditions.sort(
+            key=lambda modifier_condition: modifier_selectivity.estimate(
+                modifier_condition[0]
+            )
+        )
+        candidate_item_ids = intersect(
+            *[
+                select(model_ItemModifier.itemId).where(and_(True, *and_conditions))
+                for _, and_conditions in modifier_conditions
+            ]
+        )
 
-        return statement.where(and_(True, *exists_conditions))
+        return statement.where(item_id.in_(candidate_item_ids))
 
     def _filter_item_specs(
         self, statement: Select, *, item_spec_query: ItemSpecs
     ) -> Select:
-        item_spec_query_fields: dict[
-            str, FieldInfo
-        ] = item_spec_query.__class__.model_fields.copy()
+        item_spec_query_fields: dict[str, FieldInfo] = (
+            item_spec_query.__class__.model_fields.copy()
+        )
         item_specifications = []
 
         if item_spec_query.name is not None:
@@ -423,6 +709,9 @@ class IdentifiedPlotter(_BasePlotter):
         return statement
 
     def _create_plot_statement(self, query: IdentifiedPlotQuery) -> Select:
+        if self._uses_hourly_aggregate(query):
+            return self._create_hourly_aggregate_plot_statement(query)
+
         start, end = query.start, query.end
         statement = self._init_stmt(query, item_model=model_Item, start=start, end=end)
         statement = self._filter_base_specs(
@@ -438,15 +727,36 @@ class IdentifiedPlotter(_BasePlotter):
 
         base_query = statement.cte("baseQuery")
 
+        return self._create_ranked_plot_statement(
+            base_query,
+            price_rows=base_query,
+            trade_name_count=func.count(base_query.c.tradeName),
+        )
+
+    def _create_ranked_plot_statement(
+        self,
+        base_query: CTE,
+        *,
+        price_rows: CTE,
+        trade_name_count: ColumnElement[Any],
+        cte_suffix: str = "",
+    ) -> Select:
+        """
+        Averages the 20 cheapest prices per hour and league.
+
+        `base_query` holds one row per hour and currency used, `price_rows` holds one
+        row per price. `trade_name_count` counts items per currency in `base_query`.
+        `cte_suffix` keeps CTE names unique when statements are combined.
+        """
         most_common = (
             select(
                 base_query.c.tradeName.label("mostCommonTradeName"),
-                func.count(base_query.c.tradeName).label("nameCount"),
+                trade_name_count.label("nameCount"),
             )
             .group_by(base_query.c.leagueId, base_query.c.tradeName)
             .order_by(desc("nameCount"))  # Can use literal_column in complex cases
             .limit(1)
-            .cte("mostCommon")
+            .cte(f"mostCommon{cte_suffix}")
         )
 
         most_common_ids = (
@@ -459,7 +769,7 @@ class IdentifiedPlotter(_BasePlotter):
                 == select(most_common.c.mostCommonTradeName).scalar_subquery()
             )
             .group_by(base_query.c.createdHoursSinceLaunch)
-            .cte("mostCommonIds")
+            .cte(f"mostCommonIds{cte_suffix}")
         )
 
         most_common_prices = (
@@ -480,30 +790,30 @@ class IdentifiedPlotter(_BasePlotter):
                 )
             )
             .group_by(base_query.c.createdHoursSinceLaunch)
-            .cte("mostCommonPrices")
+            .cte(f"mostCommonPrices{cte_suffix}")
         )
 
         prices = (
             select(
-                base_query.c.createdHoursSinceLaunch,
-                base_query.c.leagueId,
-                (base_query.c.currencyAmount * base_query.c.valueInChaos).label(
+                price_rows.c.createdHoursSinceLaunch,
+                price_rows.c.leagueId,
+                (price_rows.c.currencyAmount * price_rows.c.valueInChaos).label(
                     "valueInChaos"
                 ),
                 (
-                    base_query.c.currencyAmount
-                    * base_query.c.valueInChaos
+                    price_rows.c.currencyAmount
+                    * price_rows.c.valueInChaos
                     / most_common_prices.c.mostCommonValueInChaos
                 ).label("valueInMostCommonCurrencyUsed"),
                 most_common_prices.c.mostCommonCurrencyUsed,
             )
-            .select_from(base_query)
+            .select_from(price_rows)
             .join(
                 most_common_prices,
-                base_query.c.createdHoursSinceLaunch
+                price_rows.c.createdHoursSinceLaunch
                 == most_common_prices.c.createdHoursSinceLaunch,
             )
-            .cte("prices")
+            .cte(f"prices{cte_suffix}")
         )
 
         ranked_prices = select(
@@ -514,7 +824,7 @@ class IdentifiedPlotter(_BasePlotter):
                 order_by=prices.c.valueInChaos.asc(),
             )
             .label("pos"),
-        ).cte("rankedPrices")
+        ).cte(f"rankedPrices{cte_suffix}")
 
         filtered_prices = (
             select(
@@ -531,7 +841,7 @@ class IdentifiedPlotter(_BasePlotter):
             )
             .where(ranked_prices.c.pos <= 20)
             .order_by(ranked_prices.c.createdHoursSinceLaunch)
-            .cte("filteredPrices")
+            .cte(f"filteredPrices{cte_suffix}")
         )
 
         final_query = (
@@ -555,35 +865,174 @@ class IdentifiedPlotter(_BasePlotter):
 
         return final_query
 
-    async def _plot_execute(self, db: AsyncSession, *, statement: Select) -> PlotData:
-        result = await self._perform_plot_db_statement(db, statement=statement)
-        df = self._convert_result_to_df(result)
+    def _create_hourly_aggregate_plot_statement(
+        self, query: IdentifiedPlotQuery
+    ) -> Select:
+        """
+        Plot statement over the `item_hourly_price` continuous aggregate. Skips the
+        raw `item` rows entirely, only the cheapest amounts per currency are ranked.
+        """
+        start, end = query.start, query.end
+        statement = select(
+            self._bucket_hours(
+                model_ItemHourlyPrice.createdHoursSinceLaunch, query=query
+            ),
+            model_ItemHourlyPrice.leagueId,
+            model_ItemHourlyPrice.itemBaseTypeId,
+            model_ItemHourlyPrice.currencyId,
+            model_ItemHourlyPrice.nItems,
+            model_ItemHourlyPrice.bottomCurrencyAmounts,
+            model_Currency.tradeName,
+            model_Currency.valueInChaos,
+        ).join(
+            model_Currency,
+            model_ItemHourlyPrice.currencyId == model_Currency.currencyId,
+        )
 
-        if df.empty:
-            raise PlotQueryDataNotFoundError(
-                query_data=str(statement),
-                function_name=self.plot.__name__,
-                class_name=self.__class__.__name__,
+        if isinstance(query.leagueId, list):
+            statement = statement.where(
+                model_ItemHourlyPrice.leagueId.in_(query.leagueId)
+            )
+        else:
+            statement = statement.where(
+                model_ItemHourlyPrice.leagueId == query.leagueId
             )
 
-        return self._create_plot_data(df)
+        if start is not None:
+            statement = statement.where(
+                model_ItemHourlyPrice.createdHoursSinceLaunch >= start
+            )
+        if end is not None:
+            statement = statement.where(
+                model_ItemHourlyPrice.createdHoursSinceLaunch <= end
+            )
+
+        statement = self._filter_item_names(
+            statement, item_model=model_ItemHourlyPrice, query=query
+        )
+        statement = self._filter_base_specs(
+            statement, item_model=model_ItemHourlyPrice, query=query
+        )
+        if (
+            query.itemSpecifications is not None
+            and query.itemSpecifications.identified is not None
+        ):
+            statement = statement.where(
+                model_ItemHourlyPrice.identified == query.itemSpecifications.identified
+            )
+
+        base_query = statement.cte("baseQuery")
+
+        price_rows = select(
+            base_query.c.createdHoursSinceLaunch,
+            base_query.c.leagueId,
+            base_query.c.valueInChaos,
+            func.unnest(base_query.c.bottomCurrencyAmounts).label("currencyAmount"),
+        ).cte("priceRows")
+
+        return self._create_ranked_plot_statement(
+            base_query,
+            price_rows=price_rows,
+            trade_name_count=func.sum(base_query.c.nItems),
+        )
 
     def _convert_plot_query_type(self, query: PlotQuery) -> IdentifiedPlotQuery:
         query_dump = query.model_dump()
+        if query_dump["wantedModifiers"] is None:
+            # Only valid when plotting from the hourly aggregate
+            query_dump["wantedModifiers"] = []
         return IdentifiedPlotQuery(**query_dump)
 
+    def _create_batch_plot_statement(
+        self, queries: Sequence[IdentifiedPlotQuery]
+    ) -> CompoundSelect:
+        """
+        Plots queries that only differ in `wantedModifiers` with one scan of `item`.
+        The item rows are shared, and every query filters them on its own modifiers.
+        Rows are labelled with `queryIndex`, the position of their query in `queries`.
+        """
+        shared_query = queries[0]
+        start, end = shared_query.start, shared_query.end
+        statement = self._init_stmt(
+            shared_query, item_model=model_Item, start=start, end=end
+        )
+        statement = self._filter_base_specs(
+            statement, item_model=model_Item, query=shared_query
+        )
+        statement = self._filter_item_names(
+            statement, item_model=model_Item, query=shared_query
+        )
+        statement = self.filter_item_lvl(
+            statement, item_model=model_Item, query=shared_query
+        )
+        if shared_query.itemSpecifications is not None:
+            statement = self._filter_item_specs(
+                statement, item_spec_query=shared_query.itemSpecifications
+            )
+
+        shared_base_query = statement.cte("sharedBaseQuery")
+
+        plot_statements = []
+        for query_index, query in enumerate(queries):
+            base_query = self._add_wanted_modifiers(
+                select(shared_base_query),
+                wanted_modifier_query=query.wantedModifiers,
+                start=start,
+                end=end,
+                item_id=shared_base_query.c.itemId,
+            ).cte(f"baseQuery{query_index}")
+            plot_statement = self._create_ranked_plot_statement(
+                base_query,
+                price_rows=base_query,
+                trade_name_count=func.count(base_query.c.tradeName),
+                cte_suffix=str(query_index),
+            )
+            plot_statements.append(
+                plot_statement.add_columns(
+                    literal(query_index).label("queryIndex")
+                ).order_by(None)
+            )
+
+        return union_all(*plot_statements).order_by(
+            literal_column('"queryIndex"'), literal_column('"hoursSinceLaunch"')
+        )
+
+    async def plot_batch(
+        self, db: AsyncSession, *, queries: Sequence[PlotQuery]
+    ) -> list[PlotData | None]:
+        """
+        Plots queries sharing every filter except `wantedModifiers` in one statement.
+        Returns plot data in the same order as `queries`, `None` for queries without data.
+        """
+        identified_queries = []
+        for query in queries:
+            self._raise_invalid_query(query)
+            identified_queries.append(self._convert_plot_query_type(query))
+        await modifier_selectivity.refresh(db)
+
+        statement = self._create_batch_plot_statement(identified_queries)
+        result = await self._execute_plot_statement(
+            db, statement=statement, query_data=str(identified_queries)
+        )
+
+        query_rows: list[list[RowMapping]] = [[] for _ in identified_queries]
+        for row in self._fetch_plot_rows(result):
+            query_rows[row["queryIndex"]].append(row)
+
+        return [
+            self._create_plot_data(rows, downsample=query.downsample) if rows else None
+            for query, rows in zip(identified_queries, query_rows, strict=True)
+        ]
+
     @async_timing_tracker
     async def plot(self, db: AsyncSession, *, query: PlotQuery) -> PlotData:
         self._raise_invalid_query(query)
 
         # Convert to make sure wantedModifiers are specified for identified items
         identified_query = self._convert_plot_query_type(query)
+        await modifier_selectivity.refresh(db)
 
-        stmt = self._create_plot_statement(identified_query)
-        # Logs statement in nice format
-        log_clause = stmt.compile(engine, compile_kwargs={"literal_binds": True})
-        plot_logger.info(f"{log_clause}")
-        return await self._plot_execute(db, statement=stmt)
+        return await self._plot_execute(db, query=identified_query)
 
 
 class UnidentifiedPlotter(_BasePlotter):
@@ -694,30 +1143,12 @@ class UnidentifiedPlotter(_BasePlotter):
 
         return final_query
 
-    async def _plot_execute(self, db: AsyncSession, *, statement: Select) -> PlotData:
-        result = await self._perform_plot_db_statement(db, statement=statement)
-        df = self._convert_result_to_df(result)
-
-        if df.empty:
-            raise PlotQueryDataNotFoundError(
-                query_data=str(statement),
-                function_name=self.plot.__name__,
-                class_name=self.__class__.__name__,
-            )
-
-        return self.validate(self._create_plot_data(df))
-
     async def plot(self, db: AsyncSession, *, query: PlotQuery) -> PlotData:
         self._raise_invalid_query(query)
 
         unidentified_query = self._convert_plot_query_type(query)
 
-        statement = self._create_plot_statement(unidentified_query)
-        # Logs statement in nice format
-        log_clause = statement.compile(engine, compile_kwargs={"literal_binds": True})
-        plot_logger.info(f"{log_clause}")
-
-        return await self._plot_execute(db, statement=statement)
+        return await self._plot_execute(db, query=unidentified_query)
 
 
 def configure_plotter_by_query(
@@ -733,15 +1164,87 @@ def configure_plotter_by_query(
     ):
         # NB: identified must be False for this plotter strategy
         # identified = None does not trigger this strategy
-        return UnidentifiedPlotter()
+        return UnidentifiedPlotter(plot_cache=plot_cache)
     else:
-        return IdentifiedPlotter()
+        return IdentifiedPlotter(plot_cache=plot_cache)
 
 
 class PlotterService:
     "Performs plotter strategy methods based on plotter configuration"
 
+    def __init__(self, plot_cache: PlotCache) -> None:
+        self.plot_cache = plot_cache
+
     async def plot(
         self, plotter: _BasePlotter, db: AsyncSession, query: BasePlotQuery
     ) -> PlotData:
-        return await plotter.plot(db, query=query)
+        cached_plot_data = await self.plot_cache.get(query)
+        if cached_plot_data is not None:
+            return cached_plot_data
+
+        plot_data = await plotter.plot(db, query=query)
+        await self.plot_cache.set(query, plot_data)
+
+        return plot_data
+
+    @staticmethod
+    async def _plot_or_none(
+        plotter: _BasePlotter, db: AsyncSession, query: PlotQuery
+    ) -> PlotData | None:
+        "Plots a query of a batch, `None` if no data matches it"
+        try:
+            return await plotter.plot(db, query=query)
+        except PlotQueryDataNotFoundError:
+            return None
+
+    @staticmethod
+    def _batch_key(query: PlotQuery) -> str:
+        "Queries with the same batch key only differ in `wantedModifiers`"
+        normalized_query = PlotCache.normalize_query(query)
+        normalized_query.pop("wantedModifiers", None)
+        return json.dumps(normalized_query, sort_keys=True)
+
+    async def plot_batch(
+        self, db: AsyncSession, queries: Sequence[PlotQuery]
+    ) -> list[PlotData | None]:
+        """
+        Plots multiple queries. Identified queries that only differ in `wantedModifiers`
+        are plotted together with one scan of `item`, others are plotted one by one.
+        Returns plot data in the same order as `queries`. Queries without matching data
+        get `None`, so they don't fail the rest of the batch.
+        """
+        plot_data: dict[str, PlotData | None] = {}
+        uncached_queries: dict[str, PlotQuery] = {}
+        for query in queries:
+            query_hash = PlotCache.hash_query(query)
+            if query_hash in plot_data or query_hash in uncached_queries:
+                continue
+            cached_plot_data = await self.plot_cache.get(query)
+            if cached_plot_data is not None:
+                plot_data[query_hash] = cached_plot_data
+            else:
+                uncached_queries[query_hash] = query
+
+        batches: dict[str, dict[str, PlotQuery]] = {}
+        for query_hash, query in uncached_queries.items():
+            plotter = configure_plotter_by_query(query)
+            if isinstance(plotter, IdentifiedPlotter) and query.wantedModifiers:
+                batch = batches.setdefault(self._batch_key(query), {})
+                batch[query_hash] = query
+            else:
+                plot_data[query_hash] = await self._plot_or_none(plotter, db, query)
+
+        for batch in batches.values():
+            plotter = IdentifiedPlotter(plot_cache=self.plot_cache)
+            if len(batch) == 1:
+                [(query_hash, query)] = batch.items()
+                plot_data[query_hash] = await self._plot_or_none(plotter, db, query)
+                continue
+            batch_plot_data = await plotter.plot_batch(db, queries=list(batch.values()))
+            plot_data.update(zip(batch.keys(), batch_plot_data, strict=True))
+
+        for query_hash, query in uncached_queries.items():
+            if plot_data[query_hash] is not None:
+                await self.plot_cache.set(query, plot_data[query_hash])
+
+        return [plot_data[PlotCache.hash_query(query)] for query in queries]
@@ -4,7 +4,7 @@ from typing import Any
 
 import pytest
 from httpx import AsyncClient, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.api_message_util import (
     get_delete_return_msg,
@@ -62,7 +62,7 @@ class TestAPI(BaseTest):
 
     async def _create_random_object_api(
         self,
-        db: Session,
+        db: AsyncSession,
         create_random_object_func: Callable[[], tuple[dict, ModelType, dict]] | Any,
         async_client: AsyncClient,
         route_prefix: str,
@@ -74,7 +74,7 @@ class TestAPI(BaseTest):
         the same as the object returned by the API
 
         Args:
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             create_random_object_func
             (Union[Callable[[], Tuple[Dict, ModelType, Dict]], Any]):
@@ -139,9 +139,9 @@ class TestAPI(BaseTest):
         async_client: AsyncClient,
         superuser_token_headers: dict[str, str],
         route_prefix: str,
-        db: Session,
+        db: AsyncSession,
         create_random_object_func: (
-            Callable[[Session], Awaitable[dict]] | Callable[[], dict]
+            Callable[[AsyncSession], Awaitable[dict]] | Callable[[], dict]
         ),
     ) -> None:
         """Test create instance
@@ -150,10 +150,10 @@ class TestAPI(BaseTest):
             async_client (AsyncClient): httpx test async client
             superuser_token_headers: dict[str, str] : Superuser headers
             route_prefix (str): Route name
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             create_random_object_func
-            (Union[ Callable[[Session], Awaitable[Dict]], Callable[[], Dict] ]):
+            (Union[ Callable[[AsyncSession], Awaitable[Dict]], Callable[[], Dict] ]):
             Function to create a random object
         """
         await self._create_random_object_api(
@@ -171,7 +171,7 @@ class TestAPI(BaseTest):
         superuser_token_headers: dict[str, str],
         crud_instance: CRUDBase,
         route_prefix: str,
-        db: Session,
+        db: AsyncSession,
         create_random_object_func: Callable[[], tuple[dict, ModelType]],
         on_duplicate_params: tuple[bool, str | None],
     ) -> None:
@@ -230,7 +230,7 @@ class TestAPI(BaseTest):
         self,
         async_client: AsyncClient,
         superuser_token_headers: dict[str, str],
-        db: Session,
+        db: AsyncSession,
         unique_identifier: str,
         ignore_test_columns: list[str],
         object_generator_func: Callable[[], tuple[dict, ModelType]],
@@ -242,7 +242,7 @@ class TestAPI(BaseTest):
         Args:
             async_client (AsyncClient): httpx test async client
             superuser_token_headers: dict[str, str] : Superuser headers
-            db (Session): DB session
+            db (AsyncSession): DB session
             unique_identifier (str): Unique identifier
             ignore_test_columns (List[str]): Columns to ignore
 
@@ -311,7 +311,7 @@ class TestAPI(BaseTest):
     async def test_get_instance_not_enough_permissions(
         self,
         async_client: AsyncClient,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         get_high_permissions: bool,
         route_prefix: str,
@@ -324,7 +324,7 @@ class TestAPI(BaseTest):
 
         Args:
             async_client (AsyncClient): httpx test async client
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             object_generator_func (Union[Callable[[], Tuple[Dict, ModelType]]]):
             Object generator function
@@ -358,7 +358,7 @@ class TestAPI(BaseTest):
         self,
         async_client: AsyncClient,
         superuser_token_headers: dict[str, str],
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         route_prefix: str,
         is_hypertable: bool,
@@ -368,7 +368,7 @@ class TestAPI(BaseTest):
         Args:
             async_client (AsyncClient): httpx test async client
             superuser_token_headers: dict[str, str] : Superuser headers
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             object_generator_func
             (Union[Callable[[], Tuple[Dict, ModelType]]]): Object generator function
@@ -394,7 +394,7 @@ class TestAPI(BaseTest):
         self,
         async_client: AsyncClient,
         superuser_token_headers: dict[str, str],
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         route_prefix: str,
         model_table_name: str,
@@ -407,7 +407,7 @@ class TestAPI(BaseTest):
         Args:
             async_client (AsyncClient): httpx test async client
             superuser_token_headers: dict[str, str] : Superuser headers
-            db (Session): DB session
+            db (AsyncSession): DB session
             object_generator_func (Union[Callable[[], Tuple[Dict, ModelType]]]): Object generator function
             route_prefix (str): Route name
             unique_identifier (str): Unique identifier
@@ -464,7 +464,7 @@ class TestAPI(BaseTest):
     async def test_update_instance_not_found(
         self,
         async_client: AsyncClient,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         superuser_token_headers: dict[str, str],
         object_generator_func: Callable[[], tuple[dict, ModelType]],
@@ -476,7 +476,7 @@ class TestAPI(BaseTest):
 
         Args:
             async_client (AsyncClient): httpx test async client
-            db (Session): DB session
+            db (AsyncSession): DB session
             superuser_token_headers: dict[str, str] : Superuser headers
 
             object_generator_func
@@ -539,7 +539,7 @@ class TestAPI(BaseTest):
     async def test_update_instance_not_enough_permissions(
         self,
         async_client: AsyncClient,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         route_prefix: str,
         model_table_name: str,
@@ -550,7 +550,7 @@ class TestAPI(BaseTest):
 
         Args:
             async_client (AsyncClient): httpx test async client
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             object_generator_func
             (Union[Callable[[], Tuple[Dict, ModelType]]]): Object generator function
@@ -610,7 +610,7 @@ class TestAPI(BaseTest):
         self,
         async_client: AsyncClient,
         superuser_token_headers: dict[str, str],
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         route_prefix: str,
         model_table_name: str,
@@ -621,7 +621,7 @@ class TestAPI(BaseTest):
         Args:
             async_client (AsyncClient): httpx test async client
             superuser_token_headers: dict[str, str] : Superuser headers
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             object_generator_func
             (Union[Callable[[], Tuple[Dict, ModelType]]]): Object generator function
@@ -657,7 +657,7 @@ class TestAPI(BaseTest):
     async def test_delete_instance_not_found(
         self,
         async_client: AsyncClient,
-        db: Session,
+        db: AsyncSession,
         superuser_token_headers: dict[str, str],
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         route_prefix: str,
@@ -705,7 +705,7 @@ class TestAPI(BaseTest):
     async def test_delete_instance_not_enough_permissions(
         self,
         async_client: AsyncClient,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         route_prefix: str,
         is_hypertable: bool,
@@ -714,7 +714,7 @@ class TestAPI(BaseTest):
 
         Args:
             async_client (AsyncClient): httpx test async client
-            db (Session): DB session
+            db (AsyncSession): DB session
 
             object_generator_func
             (Union[Callable[[], Tuple[Dict, ModelType]]]): Object generator function
@@ -2,10 +2,10 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 
 import pytest
-from slowapi import Limiter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.rate_limit.rate_limiters import RouteRateLimiter
 from app.tests.test_simulating_env.api.api_test_rate_limit_base import TestRateLimitBase
 from app.tests.utils.rate_limit import RateLimitPerTimeInterval
 
@@ -23,13 +23,13 @@ class TestRateLimitSlowAPI(TestRateLimitBase):
     @pytest.mark.anyio
     async def test_user_get_rate_limit(
         self,
-        db: Session,
+        db: AsyncSession,
         get_object_from_api_normal_user: Callable[[Any, Any], Awaitable[Any]],
         get_request_all_rate_limits_per_interval: (
             RateLimitPerTimeInterval | list[RateLimitPerTimeInterval]
         ),
         object_generator_func: Callable[[], dict],
-        user_rate_limiter: Limiter,  # noqa: ARG001 # Do not remove, used to enable user rate limiter
+        user_rate_limiter: RouteRateLimiter,  # noqa: ARG001 # Do not remove, used to enable user rate limiter
     ) -> None:
         """
         Tests rate limit with GET request. Uses user rate limiter.
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from app.api.deps import get_async_db, get_async_heavy_db
+from app.api.routes import item_modifier_prefix, item_prefix, unidentified_item_prefix
+from app.core.config import settings
+
+
+@pytest.mark.parametrize(
+    "route_prefix", [item_prefix, item_modifier_prefix, unidentified_item_prefix]
+)
+def test_ingestion_uses_heavy_db(app: FastAPI, route_prefix: str) -> None:
+    """
+    Bulk ingestion runs on the heavy pool, so its statements are not cancelled
+    after the statement timeout of the light pool.
+    """
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path == f"{settings.API_V1_STR}/{route_prefix}/"
+        and "POST" in route.methods
+    )
+    dependency_calls = [dependency.call for dependency in route.dependant.dependencies]
+
+    assert get_async_heavy_db in dependency_calls
+    assert get_async_db not in dependency_calls
+    assert (
+        settings.DATABASE_HEAVY_STATEMENT_TIMEOUT_MS
+        > settings.DATABASE_STATEMENT_TIMEOUT_MS
+    )
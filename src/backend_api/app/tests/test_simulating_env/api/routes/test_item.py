@@ -1,3 +1,5 @@
+import csv
+import json
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -5,7 +7,7 @@ import pytest
 import pytest_asyncio
 from fastapi import Response
 from httpx import AsyncClient
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.tests.test_simulating_env.api.api_routes_test_base as test_api
 from app.api.routes import (
@@ -99,17 +101,17 @@ def object_generator_func() -> Callable[[], tuple[dict, ModelType]]:
 
 
 @pytest.fixture(scope="module")
-def create_random_object_func() -> Callable[[Session], Awaitable[dict]]:
-    async def create_object(db: Session) -> dict:
+def create_random_object_func() -> Callable[[AsyncSession], Awaitable[dict]]:
+    async def create_object(db: AsyncSession) -> dict:
         return await create_random_item_dict(db)
 
     return create_object
 
 
 @pytest.fixture(scope="module")
-def object_generator_func_w_deps() -> (
-    Callable[[], tuple[dict, Item, list[dict | ItemBaseType | Currency]]]
-):
+def object_generator_func_w_deps() -> Callable[
+    [], tuple[dict, Item, list[dict | ItemBaseType | Currency]]
+]:
     def generate_random_item_w_deps(
         db,
     ) -> Callable[
@@ -173,4 +175,108 @@ def update_request_params_deps() -> list[str]:
 
 
 class TestItem(test_api.TestAPI):
-    pass
+    @pytest.mark.anyio
+    async def test_export_items(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """
+        Exported items as NDJSON and CSV hold the created item, and only items in the
+        hour range.
+        """
+        _, item = await generate_random_item(db)
+        export_params = {
+            "league_id": item.leagueId,
+            "start": item.createdHoursSinceLaunch,
+            "end": item.createdHoursSinceLaunch,
+        }
+
+        ndjson_response = await async_client.get(
+            f"{settings.API_V1_STR}/{item_prefix}/export/",
+            headers=superuser_token_headers,
+            params=export_params,
+        )
+        csv_response = await async_client.get(
+            f"{settings.API_V1_STR}/{item_prefix}/export/",
+            headers=superuser_token_headers,
+            params={**export_params, "export_format": "csv"},
+        )
+
+        assert ndjson_response.status_code == 200
+        assert csv_response.status_code == 200
+        ndjson_items = [json.loads(line) for line in ndjson_response.text.splitlines()]
+        csv_items = list(csv.DictReader(csv_response.text.splitlines()))
+        assert item.itemId in [ndjson_item["itemId"] for ndjson_item in ndjson_items]
+        assert str(item.itemId) in [csv_item["itemId"] for csv_item in csv_items]
+        assert all(
+            ndjson_item["createdHoursSinceLaunch"] == item.createdHoursSinceLaunch
+            for ndjson_item in ndjson_items
+        )
+
+    @pytest.mark.anyio
+    async def test_create_items_returning_ids(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """
+        Created items return their ids in the same order as the items.
+        """
+        item_dicts = [await create_random_item_dict(db) for _ in range(3)]
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{item_prefix}/",
+            headers=superuser_token_headers,
+            params={"return_ids": True},
+            json=item_dicts,
+        )
+
+        assert response.status_code == 200
+        item_ids = response.json()
+        assert len(item_ids) == len(item_dicts)
+        for item_id, item_dict in zip(item_ids, item_dicts, strict=True):
+            item = await CRUD_item.get(db, filter={"itemId": item_id})
+            assert item.currencyAmount == pytest.approx(item_dict["currencyAmount"])
+            assert item.createdHoursSinceLaunch == item_dict["createdHoursSinceLaunch"]
+
+    @pytest.mark.anyio
+    async def test_create_items_with_reserved_ids(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """
+        Reserved ids are unique, and can be assigned to items before creating them.
+        """
+        count = 3
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{item_prefix}/reserve_ids/",
+            headers=superuser_token_headers,
+            params={"count": count},
+        )
+
+        assert response.status_code == 200
+        reserved_ids = [
+            reserved_id
+            for first_id, last_id in response.json()["ranges"]
+            for reserved_id in range(first_id, last_id + 1)
+        ]
+        assert len(set(reserved_ids)) == count
+
+        item_dicts = [
+            {**await create_random_item_dict(db), "itemId": reserved_id}
+            for reserved_id in reserved_ids
+        ]
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{item_prefix}/",
+            headers=superuser_token_headers,
+            params={"return_ids": True},
+            json=item_dicts,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == reserved_ids
@@ -1,7 +1,10 @@
+import csv
+import json
 from collections.abc import Awaitable, Callable
 
 import pytest
-from sqlalchemy.orm import Session
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.routes import (
     currency_prefix,
@@ -10,6 +13,7 @@ from app.api.routes import (
     item_prefix,
     modifier_prefix,
 )
+from app.core.config import settings
 from app.core.models.models import (
     Currency,
     Item,
@@ -23,6 +27,10 @@ from app.tests.utils.model_utils.item_modifier import (
     create_random_item_modifier_dict,
     generate_random_item_modifier,
 )
+from app.tests.utils.model_utils.plot import (
+    generate_plot_dependencies,
+    generate_plot_items,
+)
 from app.tests.utils.utils import get_model_table_name, get_model_unique_identifier
 
 
@@ -106,8 +114,8 @@ def object_generator_func() -> Callable[[], tuple[dict, ModelType]]:
 
 
 @pytest.fixture(scope="module")
-def create_random_object_func() -> Callable[[Session], Awaitable[dict]]:
-    async def create_object(db: Session) -> dict:
+def create_random_object_func() -> Callable[[AsyncSession], Awaitable[dict]]:
+    async def create_object(db: AsyncSession) -> dict:
         return await create_random_item_modifier_dict(db)
 
     return create_object
@@ -178,3 +186,98 @@ def update_request_params_deps() -> list[str]:
 # TODO: Make item modifier tests work with hypertable
 # class TestItemModifier(test_api.TestAPI):
 #    pass
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestItemModifierExport:
+    @pytest.mark.anyio
+    async def test_export_item_modifiers(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """
+        Exported item modifiers as NDJSON and CSV are the item modifiers of items in
+        the league, and only those in the hour range.
+        """
+        (
+            league,
+            item_base_type,
+            currencies,
+            modifiers,
+        ) = await generate_plot_dependencies(db, modifier_count=2)
+        currency_ids = [currency.currencyId for currency in currencies]
+        exported_items = []
+        for hour in range(1, 4):
+            items = await generate_plot_items(
+                db,
+                league_id=league.leagueId,
+                item_base_type_id=item_base_type.itemBaseTypeId,
+                modifiers=modifiers,
+                currency_ids=currency_ids,
+                created_hours_since_launch=hour,
+            )
+            if hour == 2:
+                exported_items = items
+        # Same hour, but in another league
+        (
+            other_league,
+            other_item_base_type,
+            other_currencies,
+            other_modifiers,
+        ) = await generate_plot_dependencies(db)
+        await generate_plot_items(
+            db,
+            league_id=other_league.leagueId,
+            item_base_type_id=other_item_base_type.itemBaseTypeId,
+            modifiers=other_modifiers,
+            currency_ids=[currency.currencyId for currency in other_currencies],
+            created_hours_since_launch=2,
+        )
+        export_params = {"league_id": league.leagueId, "start": 2, "end": 2}
+
+        ndjson_response = await async_client.get(
+            f"{settings.API_V1_STR}/{item_modifier_prefix}/export/",
+            headers=superuser_token_headers,
+            params=export_params,
+        )
+        csv_response = await async_client.get(
+            f"{settings.API_V1_STR}/{item_modifier_prefix}/export/",
+            headers=superuser_token_headers,
+            params={**export_params, "export_format": "csv"},
+        )
+
+        assert ndjson_response.status_code == 200
+        assert csv_response.status_code == 200
+        ndjson_item_modifiers = [
+            json.loads(line) for line in ndjson_response.text.splitlines()
+        ]
+        csv_item_modifiers = list(csv.DictReader(csv_response.text.splitlines()))
+        expected_item_modifiers = {
+            (item.itemId, modifier.modifierId, modifier.position)
+            for item in exported_items
+            for modifier in modifiers
+        }
+        assert {
+            (
+                ndjson_item_modifier["itemId"],
+                ndjson_item_modifier["modifierId"],
+                ndjson_item_modifier["position"],
+            )
+            for ndjson_item_modifier in ndjson_item_modifiers
+        } == expected_item_modifiers
+        assert len(ndjson_item_modifiers) == len(expected_item_modifiers)
+        assert all(
+            set(ndjson_item_modifier) == set(ItemModifier.__table__.columns.keys())
+            and ndjson_item_modifier["createdHoursSinceLaunch"] == 2
+            for ndjson_item_modifier in ndjson_item_modifiers
+        )
+        assert {
+            (
+                int(csv_item_modifier["itemId"]),
+                int(csv_item_modifier["modifierId"]),
+                int(csv_item_modifier["position"]),
+            )
+            for csv_item_modifier in csv_item_modifiers
+        } == expected_item_modifiers
@@ -5,10 +5,10 @@ import pytest
 import pytest_asyncio
 from fastapi import Response
 from httpx import AsyncClient
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.tests.test_simulating_env.api.api_routes_test_base as test_api
-from app.api.routes import item_prefix
+from app.api.routes import item_prefix, league_prefix
 from app.core.config import settings
 from app.core.models.models import League
 from app.crud import CRUD_item
@@ -17,6 +17,7 @@ from app.tests.utils.model_utils.item import (
     create_random_item_dict,
     generate_random_item,
 )
+from app.tests.utils.model_utils.league import generate_random_league
 from app.tests.utils.utils import get_model_table_name, get_model_unique_identifier
 
 
@@ -95,8 +96,8 @@ def object_generator_func() -> Callable[[], tuple[dict, ModelType]]:
 
 
 @pytest.fixture(scope="module")
-def create_random_object_func() -> Callable[[Session], Awaitable[dict]]:
-    async def create_object(db: Session) -> dict:
+def create_random_object_func() -> Callable[[AsyncSession], Awaitable[dict]]:
+    async def create_object(db: AsyncSession) -> dict:
         return await create_random_item_dict(db)
 
     return create_object
@@ -125,4 +126,65 @@ def update_request_params_deps() -> list[str]:
 
 
 class TestLeague(test_api.TestAPI):
-    pass
+    @pytest.mark.anyio
+    async def test_get_league_not_modified(
+        self,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        db: AsyncSession,
+    ) -> None:
+        """
+        A league is not sent again while its ETag matches, until leagues are written.
+        """
+        _, league = await generate_random_league(db)
+        league_url = f"{settings.API_V1_STR}/{league_prefix}/{league.leagueId}"
+        response = await async_client.get(league_url, headers=superuser_token_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        not_modified_response = await async_client.get(
+            league_url, headers={**superuser_token_headers, "If-None-Match": etag}
+        )
+        assert not_modified_response.status_code == 304
+        assert not_modified_response.headers["etag"] == etag
+
+        await generate_random_league(db)
+        modified_response = await async_client.get(
+            league_url, headers={**superuser_token_headers, "If-None-Match": etag}
+        )
+        assert modified_response.status_code == 200
+        assert modified_response.json() == response.json()
+        assert modified_response.headers["etag"] != etag
+
+    @pytest.mark.anyio
+    async def test_get_league_body(
+        self,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        db: AsyncSession,
+    ) -> None:
+        """
+        Single and paginated league reads respond with the serialized leagues.
+        """
+        league_dict, league = await generate_random_league(db)
+        await generate_random_league(db)
+
+        response = await async_client.get(
+            f"{settings.API_V1_STR}/{league_prefix}/{league.leagueId}",
+            headers=superuser_token_headers,
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["leagueId"] == league.leagueId
+        assert body["name"] == league_dict["name"]
+
+        response = await async_client.get(
+            f"{settings.API_V1_STR}/{league_prefix}/",
+            headers=superuser_token_headers,
+            params={"limit": 1, "sort_key": "leagueId", "sort_method": "asc"},
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        leagues = response.json()
+        assert isinstance(leagues, list) and len(leagues) == 1
+        assert leagues[0]["leagueId"] == league.leagueId
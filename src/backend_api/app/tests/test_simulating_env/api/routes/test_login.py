@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from collections.abc import Awaitable
 
 import pytest
@@ -5,7 +7,9 @@ from fastapi import Response
 from httpx import AsyncClient
 
 from app.api.routes.login import login_access_session, login_prefix
+from app.core import security
 from app.core.config import settings
+from app.core.models.pool_metrics import TimedBoundedThreadPool
 from app.tests.test_simulating_env.api.api_test_rate_limit_base import TestRateLimitBase
 from app.tests.test_simulating_env.base_test import BaseTest
 from app.tests.utils.rate_limit import (
@@ -69,6 +73,41 @@ class TestLoginRoutes(BaseTest):
         )
         assert r.status_code == 401
 
+    @pytest.mark.anyio
+    async def test_get_access_token_password_hashing_busy(
+        self, async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Logins are rejected with 503 while every password hash thread is busy and no
+        more calls may wait, and are accepted again once a thread is free.
+        """
+        password_hash_pool = TimedBoundedThreadPool(
+            "password_hash", max_workers=1, max_queued=0
+        )
+        monkeypatch.setattr(security, "password_hash_pool", password_hash_pool)
+        login_data = {
+            "username": settings.FIRST_SUPERUSER,
+            "password": settings.FIRST_SUPERUSER_PASSWORD,
+        }
+
+        release = threading.Event()
+        busy_call = asyncio.create_task(password_hash_pool.run(release.wait))
+        await asyncio.sleep(0)  # Let the call take the only thread
+        try:
+            r = await async_client.post(
+                f"{settings.API_V1_STR}/{login_prefix}/access-token", data=login_data
+            )
+            assert r.status_code == 503
+        finally:
+            release.set()
+            await busy_call
+
+        r = await async_client.post(
+            f"{settings.API_V1_STR}/{login_prefix}/access-token", data=login_data
+        )
+        assert r.status_code == 200
+        password_hash_pool.shutdown()
+
 
 @pytest.mark.usefixtures("clear_db", autouse=True)
 @pytest.mark.skipif(
@@ -5,6 +5,7 @@ import pytest
 import pytest_asyncio
 from fastapi import Response
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.tests.test_simulating_env.api.api_routes_test_base as test_api
 from app.api.routes import modifier_prefix
@@ -127,7 +128,63 @@ def get_request_all_rate_limits_per_interval() -> list[RateLimitPerTimeInterval]
 
 
 class TestModifier(test_api.TestAPI):
-    pass
+    @pytest.mark.anyio
+    async def test_get_all_modifiers_etag(
+        self,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        db: AsyncSession,
+    ) -> None:
+        """
+        All modifiers are served with an ETag, which only changes when modifiers are written.
+        """
+        await generate_random_modifier(db)
+        response = await async_client.get(
+            f"{settings.API_V1_STR}/{modifier_prefix}/",
+            headers=superuser_token_headers,
+        )
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        not_modified_response = await async_client.get(
+            f"{settings.API_V1_STR}/{modifier_prefix}/",
+            headers={**superuser_token_headers, "If-None-Match": etag},
+        )
+        assert not_modified_response.status_code == 304
+        assert not_modified_response.content == b""
+
+        await generate_random_modifier(db)
+        modified_response = await async_client.get(
+            f"{settings.API_V1_STR}/{modifier_prefix}/",
+            headers={**superuser_token_headers, "If-None-Match": etag},
+        )
+        assert modified_response.status_code == 200
+        assert modified_response.headers["etag"] != etag
+        assert len(modified_response.json()) == len(response.json()) + 1
+
+    @pytest.mark.anyio
+    async def test_get_paginated_modifiers(
+        self,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        db: AsyncSession,
+    ) -> None:
+        """
+        A page of modifiers responds with the serialized modifiers of that page.
+        """
+        modifiers = [(await generate_random_modifier(db))[1] for _ in range(3)]
+        modifier_ids = sorted(modifier.modifierId for modifier in modifiers)
+
+        response = await async_client.get(
+            f"{settings.API_V1_STR}/{modifier_prefix}/",
+            headers=superuser_token_headers,
+            params={"limit": 2, "sort_key": "modifierId", "sort_method": "asc"},
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        page = response.json()
+        assert [modifier["modifierId"] for modifier in page] == modifier_ids[:2]
+        assert all(modifier["effect"] for modifier in page)
 
 
 # class TestModifierRateLimit(RateLimitSlowAPITestClass):
@@ -7,12 +7,25 @@ from typing import Any
 import pytest
 from fastapi import Response
 from httpx import AsyncClient
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.api.routes.plot import plot_prefix
+from app.core.cache.plot_cache import PlotCache, plot_cache
 from app.core.config import settings
 from app.core.rate_limit.rate_limit_config import rate_limit_settings
+from app.core.schemas.plot import PlotQuery
+from app.plotting import PLOT_COLUMNAR_MEDIA_TYPE
+from app.plotting import plotter as plotter_module
+from app.plotting.plotter import IdentifiedPlotter
 from app.tests.test_simulating_env.api.api_test_rate_limit_base import TestRateLimitBase
+from app.tests.test_simulating_env.setup_test_database import ASYNC_TEST_DATABASE_URL
+from app.tests.utils.model_utils.modifier import generate_random_modifier
 from app.tests.utils.model_utils.plot import create_minimal_random_plot_query_dict
 from app.tests.utils.rate_limit import RateLimitPerTimeInterval
 
@@ -22,7 +35,7 @@ class TestPlotAPI(TestRateLimitBase):
     @pytest.mark.anyio
     async def test_post_multiple_plots_with_different_users(
         self,
-        db: Session,
+        db: AsyncSession,
         async_client: AsyncClient,
         multiple_async_normal_user_token_headers: list[dict[str, str]],
         test_logger: Logger,
@@ -55,6 +68,415 @@ class TestPlotAPI(TestRateLimitBase):
         )
         await async_engine.dispose()  # Needs better solution
 
+    @pytest.mark.anyio
+    async def test_post_plot_equivalent_queries_share_cache(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Equivalent plot queries are normalized to the same cache entry, so the second
+        query is served from the cache without plotting.
+        """
+        cache_set = plot_cache.set
+        cached_queries = []
+
+        async def spy_cache_set(query, plot_data):
+            cached_queries.append(query)
+            await cache_set(query, plot_data)
+
+        monkeypatch.setattr(plot_cache, "set", spy_cache_set)
+
+        plot_query = await create_minimal_random_plot_query_dict(db)
+        equivalent_plot_query = {
+            **plot_query,
+            "leagueId": [plot_query["leagueId"]],
+            "itemSpecifications": {"name": None},
+            "start": None,
+        }
+
+        assert PlotCache.hash_query(PlotQuery(**plot_query)) == PlotCache.hash_query(
+            PlotQuery(**equivalent_plot_query)
+        )
+        assert await plot_cache.get(PlotQuery(**equivalent_plot_query)) is None
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=plot_query,
+        )
+        assert await plot_cache.get(PlotQuery(**equivalent_plot_query)) is not None
+
+        cached_response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=equivalent_plot_query,
+        )
+
+        assert response.status_code == 200
+        assert cached_response.status_code == 200
+        assert response.json() == cached_response.json()
+        # Only the first query was plotted and cached
+        assert len(cached_queries) == 1
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_plot_columnar(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+    ) -> None:
+        """
+        Columnar plot data holds the same values as the default plot data.
+        """
+        plot_query = await create_minimal_random_plot_query_dict(db)
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=plot_query,
+        )
+        columnar_response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers={**superuser_token_headers, "Accept": PLOT_COLUMNAR_MEDIA_TYPE},
+            json=plot_query,
+        )
+
+        assert response.status_code == 200
+        assert columnar_response.status_code == 200
+        assert columnar_response.headers["content-type"] == PLOT_COLUMNAR_MEDIA_TYPE
+        assert response.headers["vary"] == "Accept"
+        assert columnar_response.headers["vary"] == "Accept"
+
+        plot_data = response.json()
+        columnar_plot_data = columnar_response.json()
+        assert (
+            columnar_plot_data["mostCommonCurrencyUsed"]
+            == plot_data["mostCommonCurrencyUsed"]
+        )
+        for timeseries, columns in zip(
+            plot_data["data"], columnar_plot_data["data"], strict=True
+        ):
+            assert columns["leagueId"] == timeseries["leagueId"]
+            assert columns["hoursSinceLaunch"] == [
+                datum["hoursSinceLaunch"] for datum in timeseries["data"]
+            ]
+            assert columns["valueInChaos"] == [
+                datum["valueInChaos"] for datum in timeseries["data"]
+            ]
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_batch_plot(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Batched plot queries return the same plot data as separate plot queries.
+        """
+        # Without the cache, every query is plotted by the batch and by `/plot`
+        monkeypatch.setattr(plot_cache, "enabled", False)
+        batch_plot = IdentifiedPlotter.plot_batch
+        batch_sizes = []
+
+        async def spy_batch_plot(self, db, queries):
+            batch_sizes.append(len(queries))
+            return await batch_plot(self, db, queries=queries)
+
+        monkeypatch.setattr(IdentifiedPlotter, "plot_batch", spy_batch_plot)
+
+        plot_query = await create_minimal_random_plot_query_dict(db)
+        # Only differs in `wantedModifiers`, so it is plotted in the same statement
+        unlimited_plot_query = {
+            **plot_query,
+            "wantedModifiers": [
+                {**wanted_modifier, "modifierLimitations": [{"position": 0}]}
+                for wanted_modifier in plot_query["wantedModifiers"]
+            ],
+        }
+        queries = [unlimited_plot_query, plot_query]
+
+        batch_response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/batch",
+            headers=superuser_token_headers,
+            json={"queries": queries},
+        )
+        assert batch_response.status_code == 200
+        assert batch_sizes == [len(queries)]
+
+        for query, batch_plot_data in zip(queries, batch_response.json(), strict=True):
+            response = await async_client.post(
+                f"{settings.API_V1_STR}/{plot_prefix}/",
+                headers=superuser_token_headers,
+                json=query,
+            )
+            assert response.status_code == 200
+            assert batch_plot_data == response.json()
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_batch_plot_without_data(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Queries of a batch without matching data get `null`, and the other queries
+        still get their plot data.
+        """
+        monkeypatch.setattr(plot_cache, "enabled", False)
+        plot_query = await create_minimal_random_plot_query_dict(db)
+        _, unused_modifier = await generate_random_modifier(db)
+        # Plotted in the same statement as `plot_query`
+        unused_modifier_plot_query = {
+            **plot_query,
+            "wantedModifiers": [{"modifierId": unused_modifier.modifierId}],
+        }
+        # Plotted on its own
+        other_league_plot_query = {**plot_query, "leagueId": plot_query["leagueId"] + 1}
+        queries = [unused_modifier_plot_query, plot_query, other_league_plot_query]
+
+        batch_response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/batch",
+            headers=superuser_token_headers,
+            json={"queries": queries},
+        )
+        assert batch_response.status_code == 200
+        unused_modifier_plot_data, plot_data, other_league_plot_data = (
+            batch_response.json()
+        )
+        assert unused_modifier_plot_data is None
+        assert other_league_plot_data is None
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=plot_query,
+        )
+        assert response.status_code == 200
+        assert plot_data == response.json()
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_plot_resolution(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+    ) -> None:
+        """
+        Plot data with a daily resolution has one data point per day bucket.
+        """
+        plot_query = await create_minimal_random_plot_query_dict(db)
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json={**plot_query, "resolution": "1d", "downsample": 3},
+        )
+
+        assert response.status_code == 200
+        for timeseries in response.json()["data"]:
+            hours = [datum["hoursSinceLaunch"] for datum in timeseries["data"]]
+            assert len(hours) <= 3
+            assert all(hour % 24 == 0 for hour in hours)
+            assert hours == sorted(set(hours))
+        await async_engine.dispose()  # Needs better solution
+
+
+def _use_low_priority_engine(
+    monkeypatch: pytest.MonkeyPatch, engine: AsyncEngine
+) -> list[AsyncSession]:
+    "Runs low priority plot statements on `engine`. Returns the sessions opened on it."
+    session_maker = async_sessionmaker(engine, autobegin=False)
+    sessions = []
+
+    def create_low_priority_session() -> AsyncSession:
+        session = session_maker()
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(
+        plotter_module, "LowPriorityAsyncSessionLocal", create_low_priority_session
+    )
+    return sessions
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestPlotAdmissionControlAPI(TestRateLimitBase):
+    """
+    Plot statements are planned first, and rejected or run in the low priority pool
+    based on their estimated cost.
+    """
+
+    @pytest.fixture(autouse=True)
+    def admission_control(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Every request has to reach the database
+        monkeypatch.setattr(plot_cache, "enabled", False)
+        monkeypatch.setattr(settings, "PLOT_ADMISSION_CONTROL_ENABLED", True)
+        monkeypatch.setattr(settings, "PLOT_REJECT_COST", float("inf"))
+        monkeypatch.setattr(settings, "PLOT_LOW_PRIORITY_COST", float("inf"))
+
+    @pytest.mark.anyio
+    async def test_post_plot_rejected_by_estimated_cost(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Plot statements estimated above the reject cost are not run.
+        """
+        monkeypatch.setattr(settings, "PLOT_REJECT_COST", 0)
+        sessions = _use_low_priority_engine(monkeypatch, async_engine)
+        plot_query = await create_minimal_random_plot_query_dict(db)
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=plot_query,
+        )
+
+        assert response.status_code == 422
+        assert "estimated cost" in response.json()["detail"]
+        assert not sessions
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_plot_low_priority(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Plot statements estimated above the low priority cost run in the low priority
+        pool, and return the same plot data.
+        """
+        sessions = _use_low_priority_engine(monkeypatch, async_engine)
+        plot_query = await create_minimal_random_plot_query_dict(db)
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=plot_query,
+        )
+        assert response.status_code == 200
+        assert not sessions
+
+        monkeypatch.setattr(settings, "PLOT_LOW_PRIORITY_COST", 0)
+        low_priority_response = await async_client.post(
+            f"{settings.API_V1_STR}/{plot_prefix}/",
+            headers=superuser_token_headers,
+            json=plot_query,
+        )
+
+        assert low_priority_response.status_code == 200
+        assert len(sessions) == 1
+        assert low_priority_response.json() == response.json()
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_plot_low_priority_pool_busy(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Low priority plots are rejected with 503 when no connection of the low
+        priority pool becomes free in time.
+        """
+        monkeypatch.setattr(settings, "PLOT_LOW_PRIORITY_COST", 0)
+        low_priority_engine = create_async_engine(
+            str(ASYNC_TEST_DATABASE_URL), pool_size=1, max_overflow=0, pool_timeout=0.1
+        )
+        _use_low_priority_engine(monkeypatch, low_priority_engine)
+        plot_query = await create_minimal_random_plot_query_dict(db)
+
+        try:
+            # Holds the only connection of the pool
+            async with low_priority_engine.connect():
+                response = await async_client.post(
+                    f"{settings.API_V1_STR}/{plot_prefix}/",
+                    headers=superuser_token_headers,
+                    json=plot_query,
+                )
+        finally:
+            await low_priority_engine.dispose()
+
+        assert response.status_code == 503
+        await async_engine.dispose()  # Needs better solution
+
+    @pytest.mark.anyio
+    async def test_post_plot_cancelled_by_statement_timeout(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        async_engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Low priority plots cancelled by the statement timeout of the pool are answered
+        with 422, like plots estimated too expensive.
+        """
+        monkeypatch.setattr(settings, "PLOT_LOW_PRIORITY_COST", 0)
+        low_priority_engine = create_async_engine(
+            str(ASYNC_TEST_DATABASE_URL),
+            connect_args={"server_settings": {"statement_timeout": "100"}},
+        )
+        _use_low_priority_engine(monkeypatch, low_priority_engine)
+
+        perform_plot_db_statement = (
+            plotter_module._BasePlotter._perform_plot_db_statement
+        )
+
+        async def slow_perform_plot_db_statement(self, db, *, statement):
+            # Runs longer than the statement timeout of the low priority pool
+            async with db.begin():
+                await db.execute(select(func.pg_sleep(1)))
+            return await perform_plot_db_statement(self, db, statement=statement)
+
+        monkeypatch.setattr(
+            plotter_module._BasePlotter,
+            "_perform_plot_db_statement",
+            slow_perform_plot_db_statement,
+        )
+        plot_query = await create_minimal_random_plot_query_dict(db)
+
+        try:
+            response = await async_client.post(
+                f"{settings.API_V1_STR}/{plot_prefix}/",
+                headers=superuser_token_headers,
+                json=plot_query,
+            )
+        finally:
+            await low_priority_engine.dispose()
+
+        assert response.status_code == 422
+        assert "cancelled after running too long" in response.json()["detail"]
+        await async_engine.dispose()  # Needs better solution
+
 
 @pytest.mark.usefixtures("clear_db", autouse=True)
 @pytest.mark.skipif(
@@ -65,7 +487,7 @@ class TestPlotRateLimitAPI(TestRateLimitBase):
     @pytest.mark.anyio
     async def test_post_plot_rate_limit(
         self,
-        db: Session,
+        db: AsyncSession,
         async_client: AsyncClient,
     ) -> None:
         """
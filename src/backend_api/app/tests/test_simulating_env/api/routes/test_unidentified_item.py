@@ -0,0 +1,108 @@
+import csv
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes import unidentified_item_prefix
+from app.core.config import settings
+from app.core.models.models import UnidentifiedItem
+from app.core.schemas.unidentified_item import UnidentifiedItemCreate
+from app.crud import CRUD_unidentifiedItem
+from app.tests.utils.model_utils.plot import generate_plot_dependencies
+from app.tests.utils.utils import random_float, random_int, random_lower_string
+
+
+async def _generate_unidentified_items(
+    db: AsyncSession, *, count: int, created_hours_since_launch: int
+) -> list[UnidentifiedItem]:
+    "Generates unidentified items in a new league, all created in the same hour"
+    league, item_base_type, currencies, _ = await generate_plot_dependencies(
+        db, currency_count=1, modifier_count=0
+    )
+    unidentified_items = await CRUD_unidentifiedItem.create(
+        db,
+        obj_in=[
+            UnidentifiedItemCreate(
+                name=random_lower_string(),
+                leagueId=league.leagueId,
+                itemBaseTypeId=item_base_type.itemBaseTypeId,
+                createdHoursSinceLaunch=created_hours_since_launch,
+                ilvl=random_int(small_int=True),
+                rarity=random_lower_string(),
+                currencyAmount=random_float(small_float=True),
+                currencyId=currencies[0].currencyId,
+            )
+            for _ in range(count)
+        ],
+    )
+    if not isinstance(unidentified_items, list):
+        unidentified_items = [unidentified_items]
+    return unidentified_items
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestUnidentifiedItemExport:
+    @pytest.mark.anyio
+    async def test_export_unidentified_items(
+        self,
+        db: AsyncSession,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """
+        Exported unidentified items as NDJSON and CSV are the unidentified items of
+        the league, and only those in the hour range.
+        """
+        unidentified_items = await _generate_unidentified_items(
+            db, count=3, created_hours_since_launch=2
+        )
+        league_id = unidentified_items[0].leagueId
+        # Same league, outside of the hour range
+        for created_hours_since_launch in (1, 3):
+            await CRUD_unidentifiedItem.create(
+                db,
+                obj_in=UnidentifiedItemCreate.model_validate(
+                    unidentified_items[0]
+                ).model_copy(
+                    update={"createdHoursSinceLaunch": created_hours_since_launch}
+                ),
+            )
+        # Same hour, but in another league
+        await _generate_unidentified_items(db, count=2, created_hours_since_launch=2)
+        export_params = {"league_id": league_id, "start": 2, "end": 2}
+
+        ndjson_response = await async_client.get(
+            f"{settings.API_V1_STR}/{unidentified_item_prefix}/export/",
+            headers=superuser_token_headers,
+            params=export_params,
+        )
+        csv_response = await async_client.get(
+            f"{settings.API_V1_STR}/{unidentified_item_prefix}/export/",
+            headers=superuser_token_headers,
+            params={**export_params, "export_format": "csv"},
+        )
+
+        assert ndjson_response.status_code == 200
+        assert csv_response.status_code == 200
+        ndjson_items = {
+            ndjson_item["itemId"]: ndjson_item
+            for ndjson_item in map(json.loads, ndjson_response.text.splitlines())
+        }
+        csv_items = list(csv.DictReader(csv_response.text.splitlines()))
+        assert set(ndjson_items) == {
+            unidentified_item.itemId for unidentified_item in unidentified_items
+        }
+        for unidentified_item in unidentified_items:
+            ndjson_item = ndjson_items[unidentified_item.itemId]
+            assert set(ndjson_item) == set(UnidentifiedItem.__table__.columns.keys())
+            assert ndjson_item["name"] == unidentified_item.name
+            assert ndjson_item["leagueId"] == league_id
+            assert ndjson_item["createdHoursSinceLaunch"] == 2
+            assert ndjson_item["currencyAmount"] == pytest.approx(
+                unidentified_item.currencyAmount
+            )
+        assert sorted(int(csv_item["itemId"]) for csv_item in csv_items) == sorted(
+            ndjson_items
+        )
@@ -0,0 +1,52 @@
+import pytest
+from httpx import AsyncClient
+
+from app.api.deps import get_token_from_headers
+from app.api.routes import modifier_prefix, user_prefix
+from app.core.cache.user_cache import UserCache
+from app.core.config import settings
+from app.tests.test_simulating_env.base_test import BaseTest
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestUserRoutes(BaseTest):
+    @pytest.mark.anyio
+    async def test_change_is_active_user_invalidates_cached_user(
+        self,
+        async_client: AsyncClient,
+        superuser_token_headers: dict[str, str],
+        normal_user_token_headers: dict[str, str],
+    ) -> None:
+        """
+        A deactivated user is rejected right away, even though the user is cached.
+        """
+        user_id = UserCache.extract_user_id_from_token(
+            get_token_from_headers(normal_user_token_headers)
+        )
+        response = await async_client.get(
+            f"{settings.API_V1_STR}/{modifier_prefix}/",
+            headers=normal_user_token_headers,
+        )
+        assert response.status_code == 200
+        assert await UserCache.get_user(user_id) is not None
+
+        try:
+            response = await async_client.patch(
+                f"{settings.API_V1_STR}/{user_prefix}/is_active/{user_id}",
+                headers=superuser_token_headers,
+                params={"is_active": False},
+            )
+            assert response.status_code == 200
+            assert await UserCache.get_user(user_id) is None
+
+            response = await async_client.get(
+                f"{settings.API_V1_STR}/{modifier_prefix}/",
+                headers=normal_user_token_headers,
+            )
+            assert response.status_code == 403
+        finally:
+            await async_client.patch(
+                f"{settings.API_V1_STR}/{user_prefix}/is_active/{user_id}",
+                headers=superuser_token_headers,
+                params={"is_active": True},
+            )
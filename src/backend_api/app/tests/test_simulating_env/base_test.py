@@ -3,8 +3,8 @@ import math
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import Session
 
 from app.core.models.database import insp
 from app.crud.base import (
@@ -31,7 +31,7 @@ class BaseTest:
 
     async def _create_object_crud(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         create_object: dict,
         on_duplicate_params: tuple[bool, str | None] | None = None,
@@ -58,7 +58,7 @@ class BaseTest:
 
     async def _create_multiple_objects_crud(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         create_objects: list[dict],
         on_duplicate_params: tuple[bool, str | None] | None = None,
@@ -85,9 +85,9 @@ class BaseTest:
 
     async def _create_random_object_crud(
         self,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: (
-            Callable[[Session], Awaitable[tuple[dict, ModelType]]] | Any
+            Callable[[AsyncSession], Awaitable[tuple[dict, ModelType]]] | Any
         ),
     ) -> tuple[dict, ModelType]:
         """
@@ -99,7 +99,7 @@ class BaseTest:
 
     async def _create_multiple_random_objects_crud(
         self,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]] | Any,
         count: int,
     ) -> tuple[tuple[dict], tuple[ModelType]]:
@@ -181,14 +181,14 @@ class BaseTest:
 
     async def _create_object_cascade_crud(
         self,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: tuple[dict, ModelType, list[dict | ModelType] | None],
         retrieve_dependencies: bool | None = False,
     ) -> tuple[dict, ModelType, list[dict | ModelType] | None]:
         """A private method used to create objects, with option to retrieve dependencies
 
         Args:
-            db (Session): Database session
+            db (AsyncSession): Database session
             object_generator_func (tuple[ dict, ModelType, list[dict | ModelType]]]): A tuple containing the object dictionary, the object model and optionally a list of dependencies
             retrieve_dependencies (bool, optional): whether to retrieve dependencies. Defaults to False.
 
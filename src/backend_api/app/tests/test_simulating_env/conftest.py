@@ -10,21 +10,29 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 from redis.asyncio import Redis
-from slowapi import Limiter
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
+    async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_async_db, get_db
-from app.core.cache.cache import cache
+from app.api.deps import (
+    get_async_db,
+    get_async_heavy_db,
+    get_async_heavy_sessionmaker,
+)
+from app.core.cache.cache import cache, cache_pool
 from app.core.cache.user_cache import UserCache, UserCacheTokenType
 from app.core.config import settings
 from app.core.models.init_db import init_db
-from app.core.rate_limit.rate_limiters import limiter_ip, limiter_user
+from app.core.rate_limit.rate_limiters import (
+    RouteRateLimiter,
+    limiter_ip,
+    limiter_user,
+)
 from app.main import app as actual_app
 from app.tests.test_simulating_env.setup_test_database import (
     ASYNC_TEST_DATABASE_URL,
@@ -65,16 +73,13 @@ def setup_db(engine: Engine) -> Generator[Session, None, None]:
         session.rollback()
 
 
-@pytest.fixture
-def db(setup_db: Session) -> Generator[Session, None, None]:
-    yield setup_db
-
-
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def setup_async_db(
     async_engine: AsyncEngine,
 ) -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(async_engine) as session:
+    async with AsyncSession(
+        async_engine, autobegin=False, expire_on_commit=False
+    ) as session:
         yield session
         await session.rollback()
 
@@ -86,6 +91,11 @@ async def async_db(
     yield setup_async_db
 
 
+@pytest_asyncio.fixture
+async def db(async_db: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    yield async_db
+
+
 @pytest.fixture(scope="function")
 def client(app: FastAPI) -> Generator[TestClient, None]:
     with TestClient(app=app) as c:
@@ -101,24 +111,26 @@ async def async_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
 
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
-async def session_override(
-    app: FastAPI, engine: Engine, async_engine: AsyncEngine
-) -> None:
-    def override_get_db():
-        with Session(engine) as db:
-            init_db(db)
-            yield db
-
+async def session_override(app: FastAPI, async_engine: AsyncEngine) -> None:
     async def override_get_async_db():
-        async with AsyncSession(async_engine) as db:
+        async with AsyncSession(
+            async_engine, autobegin=False, expire_on_commit=False
+        ) as db:
+            await init_db(db)
             yield db
 
-    app.dependency_overrides[get_db] = override_get_db
+    def override_get_async_heavy_sessionmaker():
+        return async_sessionmaker(async_engine, autobegin=False, expire_on_commit=False)
+
     app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_heavy_db] = override_get_async_db
+    app.dependency_overrides[get_async_heavy_sessionmaker] = (
+        override_get_async_heavy_sessionmaker
+    )
 
 
 @pytest.fixture
-def user_rate_limiter() -> Generator[Limiter, None, None]:
+def user_rate_limiter() -> Generator[RouteRateLimiter, None, None]:
     """
     Fixture that enables user rate limiter for tests.
     Only need to be set as test function param
@@ -129,7 +141,7 @@ def user_rate_limiter() -> Generator[Limiter, None, None]:
 
 
 @pytest.fixture
-def ip_rate_limiter() -> Generator[Limiter, None, None]:
+def ip_rate_limiter() -> Generator[RouteRateLimiter, None, None]:
     """
     Fixture that enables ip rate limiter for tests.
     Only need to be set as test function param
@@ -150,6 +162,16 @@ async def get_cache() -> AsyncGenerator[Redis, None]:
     await cache.aclose()
 
 
+@pytest.fixture(autouse=True)
+def reset_cache_pool() -> Generator[None, None, None]:
+    """
+    Each test runs in its own event loop, so connections opened during a test
+    can't be reused by the next one.
+    """
+    yield
+    cache_pool.reset()
+
+
 @pytest_asyncio.fixture
 async def user_cache_password_reset() -> AsyncGenerator[UserCache, None]:
     async with UserCache(
@@ -192,7 +214,7 @@ async def superuser_token_headers(
 
 @pytest_asyncio.fixture
 async def normal_user_token_headers(
-    async_client: AsyncClient, db: Session
+    async_client: AsyncClient, db: AsyncSession
 ) -> dict[str, str]:
     return await authentication_token_from_email(
         async_client=async_client,
@@ -205,13 +227,15 @@ async def normal_user_token_headers(
 @pytest_asyncio.fixture
 async def multiple_async_normal_user_token_headers(
     async_client: AsyncClient,
-    engine: Engine,
+    async_engine: AsyncEngine,
 ) -> list[dict[str, str]]:
     """Used to perform multiple requests with different users in parallel"""
     number_of_headers = 2  # Currently only works with a few since there's a bug in caching upon multiple requests
     headers = []
     for i in range(number_of_headers):
-        with Session(engine, expire_on_commit=False, autocommit=False) as db:
+        async with AsyncSession(
+            async_engine, autobegin=False, expire_on_commit=False
+        ) as db:
             header = await authentication_token_from_email(
                 async_client=async_client,
                 email=str(i) + settings.TEST_USER_EMAIL,
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.models.pool_metrics import TimedBoundedThreadPool
+
+
+@pytest.mark.anyio
+async def test_cancelled_call_pending_until_done() -> None:
+    """
+    A cancelled call keeps its thread until it returns, so no more calls are admitted
+    than there are threads and queue slots for.
+    """
+    pool = TimedBoundedThreadPool("test", max_workers=1, max_queued=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def busy() -> None:
+        started.set()
+        release.wait()
+
+    call = asyncio.create_task(pool.run(busy))
+    assert await asyncio.to_thread(started.wait, 5)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert pool.pending == 1
+    with pytest.raises(asyncio.QueueFull):
+        await pool.run(busy)
+
+    release.set()
+    for _ in range(100):
+        if pool.pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert pool.pending == 0
+    assert await pool.run(lambda: "done") == "done"
+    pool.shutdown()
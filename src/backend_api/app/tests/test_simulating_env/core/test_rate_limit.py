@@ -0,0 +1,262 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import Request, Response
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.rate_limit import custom_rate_limiter
+from app.core.rate_limit.custom_rate_limiter import (
+    LocalTokenBuckets,
+    RateLimiter,
+    RateLimitState,
+    RateSpec,
+)
+from app.core.rate_limit.rate_limiters import RouteRateLimiter
+from app.exceptions.model_exceptions.rate_limit_exception import RateLimitExceededError
+
+
+def _create_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+def _get_cache_key(rate_limiter: RateLimiter) -> str:
+    return rate_limiter._make_cache_key(
+        unique_key=rate_limiter._unique_key,
+        rate_specs=rate_limiter._rate_specs,
+        cache_prefix=rate_limiter._cache_prefix,
+    )
+
+
+@pytest.fixture
+def leased_amounts(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """
+    Uses empty local token buckets, and records the requests leased from redis.
+    """
+    monkeypatch.setattr(custom_rate_limiter, "local_token_buckets", LocalTokenBuckets())
+    run_script = RateLimiter._run_script
+    leased_amounts = []
+
+    async def spy_run_script(self, cache_key):
+        state, leased = await run_script(self, cache_key)
+        leased_amounts.append(leased)
+        return state, leased
+
+    monkeypatch.setattr(RateLimiter, "_run_script", spy_run_script)
+    return leased_amounts
+
+
+def test_local_token_buckets() -> None:
+    """
+    Leased requests are taken until none are left, and are lost when expired.
+    """
+    local_token_buckets = LocalTokenBuckets()
+    state = RateLimitState(
+        allowed=True, requests=10, remaining=5, reset_seconds=1, cooldown_seconds=1
+    )
+    assert local_token_buckets.take("key") is None
+
+    local_token_buckets.put("key", tokens=2, lease_seconds=60, state=state)
+    assert local_token_buckets.take("key") == state._replace(remaining=6)
+    assert local_token_buckets.take("key") == state._replace(remaining=5)
+    assert local_token_buckets.take("key") is None
+
+    local_token_buckets.put("key", tokens=2, lease_seconds=0, state=state)
+    assert local_token_buckets.take("key") is None
+
+
+@pytest.mark.skipif(
+    settings.SKIP_RATE_LIMIT_TEST is True or settings.SKIP_RATE_LIMIT_TEST == "True",
+    reason="Rate limit test is disabled",
+)
+class TestRateLimit:
+    @pytest.mark.anyio
+    async def test_route_rate_limiter_windows(
+        self,
+        get_cache: Redis,  # noqa: ARG002 # Do not remove, used to close the cache
+    ) -> None:
+        """
+        Requests are allowed until the tightest window is full. Headers hold the
+        quota of the tightest window, rejections when to retry.
+        """
+        key = uuid4().hex
+        limiter = RouteRateLimiter(
+            key_func=lambda _: key, cache_prefix="test_rate_limit:", enabled=True
+        )
+
+        @limiter.limit("2/second", "3/minute")
+        async def route(request: Request, response: Response) -> str:  # noqa: ARG001
+            return "ok"
+
+        async def call_route() -> Response:
+            response = Response()
+            assert await route(request=_create_request(), response=response) == "ok"
+            return response
+
+        response = await call_route()
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+        assert response.headers["X-RateLimit-Reset"] == "1"
+
+        response = await call_route()
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await call_route()
+        assert exc_info.value.headers["Retry-After-Seconds"] == "1"
+
+        await asyncio.sleep(1.1)
+
+        # The second window is free again, so the minute window is the tightest
+        response = await call_route()
+        assert response.headers["X-RateLimit-Limit"] == "3"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        assert 58 <= int(response.headers["X-RateLimit-Reset"]) <= 60
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await call_route()
+        assert 58 <= int(exc_info.value.headers["Retry-After-Seconds"]) <= 60
+
+    @pytest.mark.anyio
+    async def test_route_rate_limiter_returned_response(
+        self,
+        get_cache: Redis,  # noqa: ARG002 # Do not remove, used to close the cache
+    ) -> None:
+        """
+        Headers are set on a response returned by the route.
+        """
+        key = uuid4().hex
+        limiter = RouteRateLimiter(
+            key_func=lambda _: key, cache_prefix="test_rate_limit:", enabled=True
+        )
+
+        @limiter.limit("5/minute")
+        async def route(request: Request) -> Response:  # noqa: ARG001
+            return Response(content="ok")
+
+        response = await route(request=_create_request())
+        assert response.headers["X-RateLimit-Limit"] == "5"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+
+    @pytest.mark.anyio
+    async def test_rejected_requests_not_recorded(
+        self,
+        get_cache: Redis,
+    ) -> None:
+        """
+        Only allowed requests are recorded, so rejected requests don't extend the limit.
+        """
+        rate_limiter = RateLimiter(
+            unique_key=uuid4().hex,
+            rate_spec=[RateSpec(requests=2, cooldown_seconds=1)],
+            backend=get_cache,
+            cache_prefix="test_rate_limit:",
+        )
+        cache_key = _get_cache_key(rate_limiter)
+
+        for _ in range(2):
+            async with rate_limiter:
+                pass
+        for _ in range(3):
+            with pytest.raises(RateLimitExceededError):
+                async with rate_limiter:
+                    pass
+        assert await get_cache.zcard(cache_key) == 2
+
+        await asyncio.sleep(1.1)
+
+        async with rate_limiter:
+            pass
+        assert rate_limiter.state.remaining == 1
+
+    @pytest.mark.anyio
+    async def test_leased_requests_served_locally(
+        self,
+        get_cache: Redis,
+        leased_amounts: list[int],
+    ) -> None:
+        """
+        Leased requests are recorded in redis at once, and then served in process.
+        """
+        rate_limiter = RateLimiter(
+            unique_key=uuid4().hex,
+            rate_spec=RateSpec(requests=100, cooldown_seconds=60),
+            backend=get_cache,
+            cache_prefix="test_rate_limit:",
+            lease_size=4,
+            lease_seconds=60,
+        )
+        cache_key = _get_cache_key(rate_limiter)
+
+        remaining = []
+        for _ in range(5):
+            async with rate_limiter:
+                remaining.append(rate_limiter.state.remaining)
+
+        assert leased_amounts == [4, 4]
+        assert await get_cache.zcard(cache_key) == 8
+        assert remaining == [99, 98, 97, 96, 95]
+
+    @pytest.mark.anyio
+    async def test_leased_requests_within_limit(
+        self,
+        get_cache: Redis,
+        leased_amounts: list[int],
+    ) -> None:
+        """
+        Leases shrink near the limit, down to checking each request in redis, so no more
+        requests than the limit are allowed.
+        """
+        rate_limiter = RateLimiter(
+            unique_key=uuid4().hex,
+            rate_spec=RateSpec(requests=10, cooldown_seconds=60),
+            backend=get_cache,
+            cache_prefix="test_rate_limit:",
+            lease_size=4,
+            lease_seconds=60,
+        )
+        cache_key = _get_cache_key(rate_limiter)
+
+        allowed = 0
+        for _ in range(15):
+            try:
+                async with rate_limiter:
+                    allowed += 1
+            except RateLimitExceededError:
+                pass
+
+        assert allowed == 10
+        assert await get_cache.zcard(cache_key) == 10
+        assert leased_amounts[:5] == [4, 3, 1, 1, 1]
+        assert set(leased_amounts[5:]) == {0}
+
+    @pytest.mark.anyio
+    async def test_leased_requests_expire(
+        self,
+        get_cache: Redis,
+        leased_amounts: list[int],
+    ) -> None:
+        """
+        Leased requests not used within the lease time are lost.
+        """
+        rate_limiter = RateLimiter(
+            unique_key=uuid4().hex,
+            rate_spec=RateSpec(requests=100, cooldown_seconds=60),
+            backend=get_cache,
+            cache_prefix="test_rate_limit:",
+            lease_size=4,
+            lease_seconds=0.2,
+        )
+        cache_key = _get_cache_key(rate_limiter)
+
+        async with rate_limiter:
+            pass
+        await asyncio.sleep(0.3)
+        async with rate_limiter:
+            pass
+
+        assert leased_amounts == [4, 4]
+        assert await get_cache.zcard(cache_key) == 8
+        assert rate_limiter.state.remaining == 95
@@ -1,21 +1,19 @@
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable
 
 import pytest
-from sqlalchemy.orm import Session
+import pytest_asyncio
 
 import app.tests.test_simulating_env.crud.crud_test_base as test_crud
-from app.core.models.database import engine
+from app.core.models.database import AsyncSessionLocal
 from app.crud import CRUD_league
 from app.crud.base import CRUDBase
 from app.tests.utils.model_utils.league import generate_random_league
 
 
-@pytest.fixture(scope="session")
-def db() -> Generator:
-    with Session(engine) as session:
+@pytest_asyncio.fixture(scope="session")
+async def db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as session:
         yield session
-    session.rollback()
-    session.close()
 
 
 @pytest.fixture(scope="module")
@@ -1,6 +1,9 @@
 import pytest
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.tests.test_simulating_env.crud.crud_test_base as test_crud
+from app.api.params import FilterParams
 from app.crud import CRUD_modifier
 from app.crud.base import CRUDBase
 from app.tests.utils.model_utils.modifier import generate_random_modifier
@@ -32,4 +35,31 @@ def on_duplicate_params() -> tuple[bool, str | None]:
 
 
 class TestModifierCRUD(test_crud.TestCRUD):
-    pass
+    @pytest.mark.asyncio
+    async def test_get_paginated_by_timestamp(self, db: AsyncSession) -> None:
+        """
+        Pages continue after a cursor on a timestamp sort key, given as a string.
+        """
+        for _ in range(5):
+            await generate_random_modifier(db)
+        filter_params = FilterParams(sort_key="createdAt", sort_method="desc")
+        all_objects = await CRUD_modifier.get(db, filter_params=filter_params)
+
+        order_keys = [
+            column.name for column in CRUD_modifier._get_order_columns("createdAt")
+        ]
+        paged_objects = []
+        after = None
+        while True:
+            page = await CRUD_modifier.get(
+                db,
+                filter_params=filter_params.model_copy(
+                    update={"limit": 2, "after": after}
+                ),
+            )
+            if not page:
+                break
+            paged_objects.extend(page)
+            after = to_json([getattr(page[-1], key) for key in order_keys]).decode()
+
+        assert paged_objects == all_objects
@@ -1,8 +1,12 @@
+import csv
+import io
+import json
 from collections.abc import Callable
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.params import FilterParams
 from app.crud.base import (
     CRUDBase,
     ModelType,
@@ -20,7 +24,7 @@ class TestCRUD(BaseTest):
     @pytest.mark.asyncio
     async def test_get(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         is_hypertable: bool,
@@ -46,10 +50,45 @@ class TestCRUD(BaseTest):
 
         self._test_object(stored_get_object, object_dict)
 
+    @pytest.mark.asyncio
+    async def test_get_keyset_pagination(
+        self,
+        db: AsyncSession,
+        crud_instance: CRUDBase,
+        object_generator_func: Callable[[], tuple[dict, ModelType]],
+        count: int = 5,
+    ) -> None:
+        """
+        A test function.
+
+        1. Uses the create method to create multiple objects.
+        2. Gets all objects in a single page.
+        3. Gets all objects in pages, continuing after the last object of the previous page.
+        4. Checks that the pages hold the same objects, in the same order.
+        """
+        await self._create_multiple_random_objects_crud(
+            db, object_generator_func, count=count
+        )
+        all_objects = await crud_instance.get(db, filter_params=FilterParams())
+
+        order_keys = [column.name for column in crud_instance._get_order_columns()]
+        paged_objects = []
+        after = None
+        while True:
+            page = await crud_instance.get(
+                db, filter_params=FilterParams(limit=2, after=after)
+            )
+            if not page:
+                break
+            paged_objects.extend(page)
+            after = json.dumps([getattr(page[-1], key) for key in order_keys])
+
+        assert paged_objects == all_objects
+
     @pytest.mark.asyncio
     async def test_create(
         self,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
     ) -> None:
         """
@@ -66,7 +105,7 @@ class TestCRUD(BaseTest):
     @pytest.mark.asyncio
     async def test_create_multiple(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         count: int = 5,
@@ -94,10 +133,114 @@ class TestCRUD(BaseTest):
 
         assert final_object_count == initial_object_count + count
 
+    @pytest.mark.asyncio
+    async def test_create_multiple_with_copy(
+        self,
+        db: AsyncSession,
+        crud_instance: CRUDBase,
+        object_generator_func: Callable[[], tuple[dict, ModelType]],
+        is_hypertable: bool,
+        count: int = 5,
+    ) -> None:
+        """
+        A test function.
+
+        1. Creates multiple objects, to get valid object dicts.
+        2. Uses the create method with `use_copy` to create the same objects again.
+        3. Tests if the copied objects are valid.
+        4. Checks that the specified amount of objects have been copied.
+        """
+        if not is_hypertable:
+            pytest.skip("Only hypertables allow creating the same objects twice")
+
+        multiple_object_dict, _ = await self._create_multiple_random_objects_crud(
+            db, object_generator_func, count=count
+        )
+        initial_object_count = len(await crud_instance.get(db))
+
+        copied_objects = await crud_instance.create(
+            db,
+            obj_in=[
+                crud_instance.create_schema(**object_dict)
+                for object_dict in multiple_object_dict
+            ],
+            use_copy=True,
+        )
+        self._test_object(copied_objects, multiple_object_dict)
+
+        final_object_count = len(await crud_instance.get(db))
+
+        assert final_object_count == initial_object_count + count
+
+    @pytest.mark.asyncio
+    async def test_create_empty_with_copy(
+        self,
+        db: AsyncSession,
+        crud_instance: CRUDBase,
+    ) -> None:
+        """
+        A test function.
+
+        1. Uses the create method with `use_copy` and no objects.
+        2. Checks that nothing is created.
+        """
+        initial_object_count = len(await crud_instance.get(db))
+
+        copied_objects = await crud_instance.create(db, obj_in=[], use_copy=True)
+
+        assert copied_objects is None
+        assert len(await crud_instance.get(db)) == initial_object_count
+
+    @pytest.mark.asyncio
+    async def test_create_from_csv(
+        self,
+        db: AsyncSession,
+        crud_instance: CRUDBase,
+        object_generator_func: Callable[[], tuple[dict, ModelType]],
+        is_hypertable: bool,
+        count: int = 5,
+    ) -> None:
+        """
+        A test function.
+
+        1. Creates multiple objects, to get valid object dicts.
+        2. Writes the object dicts as CSV, leaving null values empty.
+        3. Uses the create_from_csv method to create the same objects again.
+        4. Checks that the specified amount of objects have been created.
+        """
+        if not is_hypertable:
+            pytest.skip("Only hypertables allow creating the same objects twice")
+
+        multiple_object_dict, _ = await self._create_multiple_random_objects_crud(
+            db, object_generator_func, count=count
+        )
+        initial_object_count = len(await crud_instance.get(db))
+
+        columns = list(multiple_object_dict[0])
+        csv_file = io.StringIO()
+        writer = csv.writer(csv_file, quoting=csv.QUOTE_NOTNULL)
+        writer.writerow(columns)
+        writer.writerows(
+            [
+                json.dumps(object_dict[key])
+                if isinstance(object_dict[key], dict)
+                else object_dict[key]
+                for key in columns
+            ]
+            for object_dict in multiple_object_dict
+        )
+        await crud_instance.create_from_csv(
+            db, csv_file=io.BytesIO(csv_file.getvalue().encode("utf-8"))
+        )
+
+        final_object_count = len(await crud_instance.get(db))
+
+        assert final_object_count == initial_object_count + count
+
     @pytest.mark.asyncio
     async def test_create_duplicate_one_instance(
         self,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         crud_instance: CRUDBase,
         on_duplicate_params: tuple[bool, str | None],
@@ -126,7 +269,7 @@ class TestCRUD(BaseTest):
     @pytest.mark.asyncio
     async def test_create_duplicate_multiple_instances(
         self,
-        db: Session,
+        db: AsyncSession,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         crud_instance: CRUDBase,
         on_duplicate_params: tuple[bool, str | None],
@@ -159,7 +302,7 @@ class TestCRUD(BaseTest):
     @pytest.mark.asyncio
     async def test_delete(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         is_hypertable: bool,
@@ -192,7 +335,7 @@ class TestCRUD(BaseTest):
     @pytest.mark.asyncio
     async def test_update(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         is_hypertable: bool,
@@ -242,7 +385,7 @@ class TestCRUD(BaseTest):
     @pytest.mark.asyncio
     async def test_update_not_exists(
         self,
-        db: Session,
+        db: AsyncSession,
         crud_instance: CRUDBase,
         object_generator_func: Callable[[], tuple[dict, ModelType]],
         is_hypertable: bool,
@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.plotting.modifier_selectivity import ModifierSelectivity
+
+
+def _create_modifier_selectivity(stats_statement: str) -> ModifierSelectivity:
+    "Reads statistics from `stats_statement` instead of `pg_stats`"
+    modifier_selectivity = ModifierSelectivity()
+    modifier_selectivity.stats_statement = text(stats_statement)
+    return modifier_selectivity
+
+
+class TestModifierSelectivity:
+    @pytest.mark.anyio
+    async def test_estimate_without_stats(self, db: AsyncSession) -> None:
+        """
+        Without a `pg_stats` row, for example before `item_modifier` is analyzed,
+        every modifier id is estimated to be in all rows.
+        """
+        modifier_selectivity = _create_modifier_selectivity(
+            """
+            SELECT
+                NULL::INT[] AS most_common_vals,
+                NULL::REAL[] AS most_common_freqs,
+                NULL::REAL AS n_distinct
+            WHERE FALSE
+            """
+        )
+        await modifier_selectivity.refresh(db)
+
+        assert modifier_selectivity.estimate(1) == 1.0
+
+    @pytest.mark.anyio
+    async def test_estimate_most_common_value(self, db: AsyncSession) -> None:
+        """
+        Modifier ids in `most_common_vals` are estimated by their frequency.
+        """
+        modifier_selectivity = _create_modifier_selectivity(
+            """
+            SELECT
+                ARRAY[1, 2]::INT[] AS most_common_vals,
+                ARRAY[0.5, 0.25]::REAL[] AS most_common_freqs,
+                4::REAL AS n_distinct
+            """
+        )
+        await modifier_selectivity.refresh(db)
+
+        assert modifier_selectivity.estimate(1) == pytest.approx(0.5)
+        assert modifier_selectivity.estimate(2) == pytest.approx(0.25)
+
+    @pytest.mark.anyio
+    async def test_estimate_other_value(self, db: AsyncSession) -> None:
+        """
+        Modifier ids outside of `most_common_vals` share the remaining frequency
+        evenly, but are never estimated above the least common value.
+        """
+        modifier_selectivity = _create_modifier_selectivity(
+            """
+            SELECT
+                ARRAY[1, 2]::INT[] AS most_common_vals,
+                ARRAY[0.5, 0.25]::REAL[] AS most_common_freqs,
+                12::REAL AS n_distinct
+            """
+        )
+        await modifier_selectivity.refresh(db)
+
+        # 0.25 remaining over 10 other distinct modifier ids
+        assert modifier_selectivity.estimate(3) == pytest.approx(0.025)
+
+        modifier_selectivity = _create_modifier_selectivity(
+            """
+            SELECT
+                ARRAY[1, 2]::INT[] AS most_common_vals,
+                ARRAY[0.5, 0.1]::REAL[] AS most_common_freqs,
+                3::REAL AS n_distinct
+            """
+        )
+        await modifier_selectivity.refresh(db)
+
+        # 0.4 remaining over 1 other distinct modifier id, capped by the least common
+        assert modifier_selectivity.estimate(3) == pytest.approx(0.1)
+
+    @pytest.mark.anyio
+    async def test_estimate_relative_n_distinct(self, db: AsyncSession) -> None:
+        """
+        A negative `n_distinct` is relative to the row count, so modifier ids outside
+        of `most_common_vals` are estimated by the least common value.
+        """
+        modifier_selectivity = _create_modifier_selectivity(
+            """
+            SELECT
+                ARRAY[1, 2]::INT[] AS most_common_vals,
+                ARRAY[0.5, 0.25]::REAL[] AS most_common_freqs,
+                -0.5::REAL AS n_distinct
+            """
+        )
+        await modifier_selectivity.refresh(db)
+
+        assert modifier_selectivity.estimate(3) == pytest.approx(0.25)
@@ -0,0 +1,365 @@
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache.cache import cache
+from app.core.cache.plot_cache import plot_cache
+from app.core.config import settings
+from app.core.schemas.plot import PlotData, PlotQuery
+from app.plotting.plotter import IdentifiedPlotter, _BasePlotter
+from app.tests.utils.database_utils import (
+    clear_all_tables,
+    refresh_continuous_aggregates_in_test_db,
+)
+from app.tests.utils.model_utils.plot import (
+    generate_plot_dependencies,
+    generate_plot_items,
+)
+from app.tests.utils.utils import random_lower_string
+
+
+async def _plot_without_incremental(
+    db: AsyncSession, query: PlotQuery, monkeypatch: pytest.MonkeyPatch
+) -> PlotData:
+    with monkeypatch.context() as m:
+        m.setattr(settings, "PLOT_INCREMENTAL_ENABLED", False)
+        return await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestIncrementalPlot:
+    """
+    Plots with cached rows only compute the hours from the last cached hour onwards,
+    and must equal plots computed in full.
+    """
+
+    @pytest.fixture(autouse=True)
+    def incremental_plots(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(plot_cache, "enabled", True)
+        monkeypatch.setattr(settings, "PLOT_INCREMENTAL_ENABLED", True)
+
+    @pytest.fixture
+    def plotted_ranges(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> list[tuple[int | None, int | None]]:
+        "Records the `start` and `end` of every plot statement executed"
+        execute_plot_query = _BasePlotter._execute_plot_query
+        plotted_ranges = []
+
+        async def spy_execute_plot_query(self, db, *, query):
+            plotted_ranges.append((query.start, query.end))
+            return await execute_plot_query(self, db, query=query)
+
+        monkeypatch.setattr(_BasePlotter, "_execute_plot_query", spy_execute_plot_query)
+        return plotted_ranges
+
+    async def _create_plot_query(
+        self, db: AsyncSession, **query_fields: Any
+    ) -> tuple[PlotQuery, dict[str, Any]]:
+        """
+        Creates the plotted dependencies, and a plot query of them without cached rows.
+        """
+        (
+            league,
+            item_base_type,
+            currencies,
+            modifiers,
+        ) = await generate_plot_dependencies(db)
+        query = PlotQuery(
+            leagueId=league.leagueId,
+            wantedModifiers=[{"modifierId": modifiers[0].modifierId}],
+            **query_fields,
+        )
+        identified_query = IdentifiedPlotter(
+            plot_cache=plot_cache
+        )._convert_plot_query_type(query)
+        await cache.delete(plot_cache._create_rows_cache_key(identified_query))
+        item_fields = {
+            "league_id": league.leagueId,
+            "item_base_type_id": item_base_type.itemBaseTypeId,
+            "modifiers": modifiers,
+        }
+        currency_ids = [currency.currencyId for currency in currencies]
+        return query, {**item_fields, "currency_ids": currency_ids}
+
+    async def _generate_items(
+        self,
+        db: AsyncSession,
+        item_fields: dict[str, Any],
+        *,
+        hours: range,
+        common_count: int,
+        uncommon_count: int,
+    ) -> None:
+        "Generates items per hour, priced in the first and the second currency"
+        common_currency_id, uncommon_currency_id = item_fields["currency_ids"]
+        for hour in hours:
+            await generate_plot_items(
+                db,
+                league_id=item_fields["league_id"],
+                item_base_type_id=item_fields["item_base_type_id"],
+                modifiers=item_fields["modifiers"],
+                currency_ids=[common_currency_id] * common_count
+                + [uncommon_currency_id] * uncommon_count,
+                created_hours_since_launch=hour,
+            )
+
+    @pytest.mark.anyio
+    async def test_plot_appends_new_hours(
+        self,
+        db: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        plotted_ranges: list[tuple[int | None, int | None]],
+    ) -> None:
+        """
+        New hours are merged onto the cached rows, and the last cached hour is
+        recomputed, as it may have been cached before it was fully ingested.
+        """
+        query, item_fields = await self._create_plot_query(db)
+        await self._generate_items(
+            db, item_fields, hours=range(0, 4), common_count=3, uncommon_count=1
+        )
+        await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+        await self._generate_items(
+            db, item_fields, hours=range(3, 6), common_count=2, uncommon_count=1
+        )
+        plot_data = await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+        assert plotted_ranges == [(None, None), (3, None)]
+        assert [datum.hoursSinceLaunch for datum in plot_data.data[0].data] == list(
+            range(0, 6)
+        )
+        full_plot_data = await _plot_without_incremental(db, query, monkeypatch)
+        assert plot_data.model_dump() == full_plot_data.model_dump()
+
+    @pytest.mark.anyio
+    async def test_plot_recomputed_when_most_common_currency_changes(
+        self,
+        db: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        plotted_ranges: list[tuple[int | None, int | None]],
+    ) -> None:
+        """
+        The cached rows are priced in the most common currency. When new hours change
+        it, the full range is recomputed.
+        """
+        query, item_fields = await self._create_plot_query(db)
+        await self._generate_items(
+            db, item_fields, hours=range(0, 4), common_count=3, uncommon_count=1
+        )
+        cached_plot_data = await IdentifiedPlotter(plot_cache=plot_cache).plot(
+            db, query=query
+        )
+
+        # The uncommon currency becomes the most common one
+        await self._generate_items(
+            db, item_fields, hours=range(4, 6), common_count=1, uncommon_count=9
+        )
+        plot_data = await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+        assert plotted_ranges == [(None, None), (3, None), (None, None)]
+        assert (
+            plot_data.mostCommonCurrencyUsed != cached_plot_data.mostCommonCurrencyUsed
+        )
+        full_plot_data = await _plot_without_incremental(db, query, monkeypatch)
+        assert plot_data.model_dump() == full_plot_data.model_dump()
+
+    @pytest.mark.anyio
+    async def test_plot_ending_before_cached_rows(
+        self,
+        db: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        plotted_ranges: list[tuple[int | None, int | None]],
+    ) -> None:
+        """
+        Cached rows are shared by queries with another `end`. Queries ending before the
+        last cached hour are computed in full.
+        """
+        query, item_fields = await self._create_plot_query(db)
+        await self._generate_items(
+            db, item_fields, hours=range(0, 6), common_count=3, uncommon_count=1
+        )
+        await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+        ending_query = query.model_copy(update={"end": 2})
+        plot_data = await IdentifiedPlotter(plot_cache=plot_cache).plot(
+            db, query=ending_query
+        )
+
+        assert plotted_ranges == [(None, None), (None, 2)]
+        assert [datum.hoursSinceLaunch for datum in plot_data.data[0].data] == [0, 1, 2]
+        full_plot_data = await _plot_without_incremental(db, ending_query, monkeypatch)
+        assert plot_data.model_dump() == full_plot_data.model_dump()
+
+    @pytest.mark.anyio
+    async def test_plot_replaces_partial_bucket(
+        self,
+        db: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+        plotted_ranges: list[tuple[int | None, int | None]],
+    ) -> None:
+        """
+        With a coarse resolution and a `start` inside a bucket, the cached row of that
+        bucket is replaced by the recomputed bucket, instead of being kept twice.
+        """
+        query, item_fields = await self._create_plot_query(db, start=4, resolution="6h")
+        await self._generate_items(
+            db, item_fields, hours=range(4, 6), common_count=3, uncommon_count=1
+        )
+        await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+        await self._generate_items(
+            db, item_fields, hours=range(5, 8), common_count=2, uncommon_count=1
+        )
+        plot_data = await IdentifiedPlotter(plot_cache=plot_cache).plot(db, query=query)
+
+        assert plotted_ranges == [(4, None), (4, None)]
+        assert [datum.hoursSinceLaunch for datum in plot_data.data[0].data] == [0, 6]
+        full_plot_data = await _plot_without_incremental(db, query, monkeypatch)
+        assert plot_data.model_dump() == full_plot_data.model_dump()
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestHourlyAggregatePlot:
+    """
+    Named item queries without `wantedModifiers` are plotted from the `item_hourly_price`
+    continuous aggregate, and must equal plots computed from the raw `item` rows.
+    """
+
+    @pytest.fixture(autouse=True)
+    def hourly_aggregate(
+        self, engine: Engine, monkeypatch: pytest.MonkeyPatch
+    ) -> Generator[None, None, None]:
+        monkeypatch.setattr(settings, "PLOT_HOURLY_AGGREGATE_ENABLED", True)
+        yield
+        # Materialized rows of deleted items are only removed by a refresh
+        clear_all_tables(engine)
+        refresh_continuous_aggregates_in_test_db(engine)
+
+    @pytest.mark.anyio
+    async def test_plot_equals_raw_item_plot(
+        self,
+        db: AsyncSession,
+        engine: Engine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Materialized hours and hours served in real time from `item` are both plotted
+        from the cheapest items of each currency.
+        """
+        (
+            league,
+            item_base_type,
+            currencies,
+            _,
+        ) = await generate_plot_dependencies(db)
+        name = random_lower_string()
+        common_currency_id, uncommon_currency_id = [
+            currency.currencyId for currency in currencies
+        ]
+
+        async def generate_items(hours: range) -> None:
+            for hour in hours:
+                await generate_plot_items(
+                    db,
+                    league_id=league.leagueId,
+                    item_base_type_id=item_base_type.itemBaseTypeId,
+                    modifiers=[],
+                    # More items than are averaged over, so the cheapest are picked
+                    currency_ids=[common_currency_id] * 20 + [uncommon_currency_id] * 5,
+                    created_hours_since_launch=hour,
+                    name=name,
+                )
+
+        await generate_items(range(0, 3))
+        refresh_continuous_aggregates_in_test_db(engine)
+        await generate_items(range(3, 5))
+
+        query = PlotQuery(leagueId=league.leagueId, itemSpecifications={"name": name})
+        plotter = IdentifiedPlotter()
+        plot_data = await plotter.plot(db, query=query)
+
+        with monkeypatch.context() as m:
+            m.setattr(settings, "PLOT_HOURLY_AGGREGATE_ENABLED", False)
+            # Queries without `wantedModifiers` are only valid for the aggregate
+            raw_plot_data = await plotter._plot_execute(
+                db, query=plotter._convert_plot_query_type(query)
+            )
+
+        assert plot_data.mostCommonCurrencyUsed == raw_plot_data.mostCommonCurrencyUsed
+        (timeseries,) = plot_data.data
+        (raw_timeseries,) = raw_plot_data.data
+        assert timeseries.confidenceRating == raw_timeseries.confidenceRating
+        assert [datum.hoursSinceLaunch for datum in timeseries.data] == list(
+            range(0, 5)
+        )
+        for datum, raw_datum in zip(timeseries.data, raw_timeseries.data, strict=True):
+            assert datum.hoursSinceLaunch == raw_datum.hoursSinceLaunch
+            assert datum.confidence == raw_datum.confidence
+            # Averages may be summed in another order
+            assert datum.valueInChaos == pytest.approx(raw_datum.valueInChaos)
+            assert datum.valueInMostCommonCurrencyUsed == pytest.approx(
+                raw_datum.valueInMostCommonCurrencyUsed
+            )
+
+
+@pytest.mark.usefixtures("clear_db", autouse=True)
+class TestModifierIntersectPlot:
+    """
+    Queries with multiple wanted modifiers intersect the item ids of each modifier,
+    and must equal plots filtering each modifier with `EXISTS`.
+    """
+
+    @pytest.mark.anyio
+    async def test_plot_equals_exists_plot(
+        self, db: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "PLOT_MODIFIER_INTERSECT_ENABLED", True)
+        (
+            league,
+            item_base_type,
+            currencies,
+            modifiers,
+        ) = await generate_plot_dependencies(db, modifier_count=2)
+        currency_ids = [currency.currencyId for currency in currencies]
+
+        for hour, item_modifiers in [
+            (0, modifiers),
+            (1, modifiers),
+            (1, modifiers[:1]),
+            (2, modifiers[:1]),
+            (2, modifiers[1:]),
+        ]:
+            await generate_plot_items(
+                db,
+                league_id=league.leagueId,
+                item_base_type_id=item_base_type.itemBaseTypeId,
+                modifiers=item_modifiers,
+                currency_ids=currency_ids * 3,
+                created_hours_since_launch=hour,
+            )
+
+        query = PlotQuery(
+            leagueId=league.leagueId,
+            wantedModifiers=[
+                {"modifierId": modifier.modifierId} for modifier in modifiers
+            ],
+        )
+        plotter = IdentifiedPlotter()
+        statement = plotter._create_plot_statement(
+            plotter._convert_plot_query_type(query)
+        )
+        assert "INTERSECT" in str(statement)
+        plot_data = await plotter.plot(db, query=query)
+
+        with monkeypatch.context() as m:
+            m.setattr(settings, "PLOT_MODIFIER_INTERSECT_ENABLED", False)
+            exists_plot_data = await plotter.plot(db, query=query)
+
+        # Hour 2 has no item with both modifiers
+        assert [datum.hoursSinceLaunch for datum in plot_data.data[0].data] == [0, 1]
+        assert plot_data.model_dump() == exists_plot_data.model_dump()
@@ -0,0 +1,52 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.models.models import Item
+from app.utils.statement_fingerprint import StatementFingerprinter
+
+
+def _create_fingerprinter(max_size: int = 10) -> StatementFingerprinter:
+    return StatementFingerprinter(dialect=postgresql.dialect(), max_size=max_size)
+
+
+def test_fingerprint_ignores_literals() -> None:
+    """
+    Statements with the same shape share a fingerprint, whatever their literals.
+    """
+    fingerprinter = _create_fingerprinter()
+
+    fingerprint, params = fingerprinter.fingerprint(
+        select(Item.itemId).where(Item.leagueId == 1, Item.name == "first")
+    )
+    other_fingerprint, other_params = fingerprinter.fingerprint(
+        select(Item.itemId).where(Item.leagueId == 2, Item.name == "second")
+    )
+    shape_fingerprint, _ = fingerprinter.fingerprint(
+        select(Item.itemId).where(Item.leagueId == 1)
+    )
+
+    assert fingerprint == other_fingerprint
+    assert params == [1, "first"]
+    assert other_params == [2, "second"]
+    assert shape_fingerprint != fingerprint
+
+
+def test_fingerprint_cache_evicts_least_recently_used() -> None:
+    """
+    Only the `max_size` most recently used statement shapes are kept.
+    """
+    fingerprinter = _create_fingerprinter(max_size=2)
+    statements = [
+        select(Item.itemId).where(Item.leagueId == 1),
+        select(Item.itemId).where(Item.name == "name"),
+        select(Item.itemId).where(Item.ilvl == 1),
+    ]
+    cache_keys = [statement._generate_cache_key().key for statement in statements]
+
+    fingerprinter.fingerprint(statements[0])
+    fingerprinter.fingerprint(statements[1])
+    # Using the first shape again makes the second one the least recently used
+    fingerprinter.fingerprint(statements[0])
+    fingerprinter.fingerprint(statements[2])
+
+    assert list(fingerprinter._fingerprints) == [cache_keys[0], cache_keys[2]]
@@ -1,3 +1,6 @@
+from pathlib import Path
+
+from alembic.script import ScriptDirectory
 from sqlalchemy import Engine, MetaData, delete
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -8,12 +11,16 @@ from app.core.models.models import User
 src_db_metadata = MetaData()
 test_db_metadata = MetaData()
 
+ALEMBIC_SCRIPT_LOCATION = Path(__file__).parents[2] / "alembic"
+ITEM_HOURLY_PRICE_REVISION = "b1e7d4c2a9f0"
+
 
 def mock_src_database_for_test_db(test_db_engine: Engine):
     """Mock the source database to create the test database schema."""
 
     src_conn = src_db_engine.connect()
     tgt_conn = test_db_engine.connect()
+    drop_continuous_aggregates_in_test_db(test_db_engine)
     test_db_metadata.reflect(bind=test_db_engine)
 
     # drop all tables in test database
@@ -37,6 +44,51 @@ def mock_src_database_for_test_db(test_db_engine: Engine):
     src_conn.close()
     tgt_conn.close()
 
+    create_continuous_aggregates_in_test_db(test_db_engine)
+
+
+def drop_continuous_aggregates_in_test_db(test_db_engine: Engine):
+    """Drop the continuous aggregates, as they depend on the reflected tables."""
+    with test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as conn:
+        conn.exec_driver_sql("DROP MATERIALIZED VIEW IF EXISTS item_hourly_price;")
+
+
+def create_continuous_aggregates_in_test_db(test_db_engine: Engine):
+    """
+    Reflecting only creates plain tables. Turn `item` into a hypertable and create
+    the continuous aggregates over it, with the specs of their alembic revisions.
+    """
+    revision = (
+        ScriptDirectory(str(ALEMBIC_SCRIPT_LOCATION))
+        .get_revision(ITEM_HOURLY_PRICE_REVISION)
+        .module
+    )
+    with test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as conn:
+        conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS timescaledb;")
+        # Indexes are reflected from the source database already
+        conn.exec_driver_sql(
+            "SELECT create_hypertable('item', by_range('createdHoursSinceLaunch', 168), "
+            "create_default_indexes => FALSE);"
+        )
+        conn.exec_driver_sql(revision.ITEM_CURRENT_HOUR_FUNCTION)
+        conn.exec_driver_sql(revision.SET_ITEM_INTEGER_NOW_FUNCTION)
+        conn.exec_driver_sql(revision.ITEM_HOURLY_PRICE_VIEW)
+        conn.exec_driver_sql(revision.ITEM_HOURLY_PRICE_INDEX)
+
+
+def refresh_continuous_aggregates_in_test_db(test_db_engine: Engine):
+    """Materialize the continuous aggregates, up to and including the latest hour."""
+    with test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as conn:
+        conn.exec_driver_sql(
+            "CALL refresh_continuous_aggregate('item_hourly_price', NULL, NULL);"
+        )
+
 
 def clear_all_tables(test_db_engine: Engine):
     """Clear all tables in the test database."""
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.models.models import Currency, League
@@ -12,12 +12,12 @@ from app.tests.utils.utils import (
 
 
 async def create_random_currency_dict(
-    db: Session, retrieve_dependencies: bool | None = False
+    db: AsyncSession, retrieve_dependencies: bool | None = False
 ) -> dict | tuple[dict, list[dict | League]]:
     """Create a random currency dictionary.
 
     Args:
-        db (Session): DB session.
+        db (AsyncSession): DB session.
         retrieve_dependencies (bool, optional): Whether to retrieve dependencies. Defaults to False.
 
     Returns:
@@ -46,12 +46,12 @@ async def create_random_currency_dict(
 
 
 async def generate_random_currency(
-    db: Session, retrieve_dependencies: bool | None = False
+    db: AsyncSession, retrieve_dependencies: bool | None = False
 ) -> tuple[dict, Currency, list[dict | League] | None]:
     """Generates a random currency.
 
     Args:
-        db (Session): DB session.
+        db (AsyncSession): DB session.
 
     Returns:
         Tuple[ Dict, Currency,  List[ Union[ Dict, League, ] ] ], ]: \n
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.models.models import ItemBaseType as model_ItemBaseType
@@ -30,12 +30,12 @@ def create_random_item_base_type_dict() -> dict:
 
 
 async def generate_random_item_base_type(
-    db: Session,
+    db: AsyncSession,
 ) -> tuple[dict, model_ItemBaseType]:
     """Generate a random item base type.
 
     Args:
-        db (Session): DB session.
+        db (AsyncSession): DB session.
 
     Returns:
         Tuple[Dict, ItemBaseType]: Random item base type dict and ItemBaseType db object.
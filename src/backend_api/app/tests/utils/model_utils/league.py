@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.models.models import League
@@ -31,11 +31,11 @@ def create_random_league_dict() -> dict:
     return league
 
 
-async def generate_random_league(db: Session) -> tuple[dict, League]:
+async def generate_random_league(db: AsyncSession) -> tuple[dict, League]:
     """Generates a random league.
 
     Args:
-        db (Session): DB session.
+        db (AsyncSession): DB session.
 
     Returns:
         Tuple[Dict, League]: Random league dict and League db object.
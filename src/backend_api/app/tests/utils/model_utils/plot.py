@@ -1,19 +1,40 @@
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import crud
+from app.core.models.models import (
+    Currency as model_Currency,
+)
+from app.core.models.models import (
+    Item as model_Item,
+)
+from app.core.models.models import (
+    ItemBaseType as model_ItemBaseType,
+)
 from app.core.models.models import (
     League as model_League,
 )
 from app.core.models.models import (
     Modifier as model_Modifier,
 )
+from app.core.schemas.item import ItemCreate
+from app.core.schemas.item_modifier import ItemModifierCreate
+from app.tests.utils.model_utils.currency import generate_random_currency
+from app.tests.utils.model_utils.item_base_type import generate_random_item_base_type
 from app.tests.utils.model_utils.item_modifier import (
     generate_random_item_modifier,
 )
+from app.tests.utils.model_utils.league import generate_random_league
+from app.tests.utils.model_utils.modifier import generate_random_modifier
+from app.tests.utils.utils import (
+    random_float,
+    random_int,
+    random_lower_string,
+)
 
 
-async def create_minimal_random_plot_query_dict(db: Session) -> dict[str, Any]:
+async def create_minimal_random_plot_query_dict(db: AsyncSession) -> dict[str, Any]:
     """
     Create a random plot query dictionary.
 
@@ -39,3 +60,76 @@ async def create_minimal_random_plot_query_dict(db: Session) -> dict[str, Any]:
     }
 
     return plot_query
+
+
+async def generate_plot_dependencies(
+    db: AsyncSession, *, currency_count: int = 2, modifier_count: int = 1
+) -> tuple[
+    model_League, model_ItemBaseType, list[model_Currency], list[model_Modifier]
+]:
+    """
+    Generate the league, item base type, currencies and modifiers that plotted items
+    are created with, see `generate_plot_items`.
+
+    Returns:
+        Tuple[League, ItemBaseType, List[Currency], List[Modifier]]: Generated db objects.
+    """
+    _, league = await generate_random_league(db)
+    _, item_base_type = await generate_random_item_base_type(db)
+    currencies = [
+        (await generate_random_currency(db))[1] for _ in range(currency_count)
+    ]
+    modifiers = [(await generate_random_modifier(db))[1] for _ in range(modifier_count)]
+    return league, item_base_type, currencies, modifiers
+
+
+async def generate_plot_items(
+    db: AsyncSession,
+    *,
+    league_id: int,
+    item_base_type_id: int,
+    modifiers: list[model_Modifier],
+    currency_ids: list[int],
+    created_hours_since_launch: int,
+    name: str | None = None,
+) -> list[model_Item]:
+    """
+    Generate priced items with every modifier in `modifiers`, all created in the same
+    hour. One item is generated per currency id, so repeating a currency id makes it
+    more common.
+
+    Returns:
+        List[Item]: Generated Item db objects.
+    """
+    item_creates = [
+        ItemCreate(
+            name=name,
+            leagueId=league_id,
+            itemBaseTypeId=item_base_type_id,
+            createdHoursSinceLaunch=created_hours_since_launch,
+            ilvl=random_int(small_int=True),
+            rarity=random_lower_string(),
+            currencyAmount=random_float(small_float=True),
+            currencyId=currency_id,
+        )
+        for currency_id in currency_ids
+    ]
+    items = await crud.CRUD_item.create(db, obj_in=item_creates)
+    if not isinstance(items, list):
+        items = [items]
+
+    item_modifier_creates = [
+        ItemModifierCreate(
+            itemId=item.itemId,
+            modifierId=modifier.modifierId,
+            position=modifier.position,
+            roll=random_float(),
+            createdHoursSinceLaunch=created_hours_since_launch,
+        )
+        for item in items
+        for modifier in modifiers
+    ]
+    if item_modifier_creates:
+        await crud.CRUD_itemModifier.create(db, obj_in=item_modifier_creates)
+
+    return items
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any, Literal
+
+from sqlalchemy import Select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.config import settings
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def filter_hours(
+    statement: Select,
+    created_hours_since_launch: InstrumentedAttribute,
+    *,
+    start: int | None = None,
+    end: int | None = None,
+) -> Select:
+    "Filters on an inclusive hour range, which also excludes hypertable chunks"
+    if start is not None:
+        statement = statement.where(created_hours_since_launch >= start)
+    if end is not None:
+        statement = statement.where(created_hours_since_launch <= end)
+    return statement
+
+
+def _to_csv_value(value: Any) -> Any:
+    if isinstance(value, dict | list):
+        return json.dumps(value)
+    return value
+
+
+def _format_ndjson(rows: Sequence[RowMapping]) -> str:
+    return "".join(json.dumps(dict(row), default=str) + "\n" for row in rows)
+
+
+def _format_csv(rows: Sequence[RowMapping]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_to_csv_value(value) for value in row.values()] for row in rows)
+    return buffer.getvalue()
+
+
+async def stream_export(
+    statement: Select,
+    *,
+    session_maker: async_sessionmaker[AsyncSession],
+    export_format: ExportFormat,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+) -> AsyncGenerator[str, None]:
+    """
+    Streams the rows of `statement` from a server side cursor, formatted as NDJSON or
+    CSV, `batch_size` rows at a time. Memory use is independent of the number of rows.
+
+    The session is opened from `session_maker` inside the generator, as it must
+    outlive the route function.
+    """
+    if export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(
+            column.name for column in statement.selected_columns
+        )
+        yield buffer.getvalue()
+
+    format_rows = _format_csv if export_format == "csv" else _format_ndjson
+    async with session_maker() as db, db.begin():
+        result = await db.stream(statement.execution_options(yield_per=batch_size))
+        async for rows in result.mappings().partitions():
+            yield format_rows(rows)
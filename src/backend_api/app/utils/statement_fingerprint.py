@@ -0,0 +1,62 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.expression import Executable
+
+
+class StatementFingerprinter:
+    """
+    Some StatementFingerprinter mechanics:
+
+    A statement fingerprint is a short hash of the SQL a statement compiles to, with
+    its bound parameters left as placeholders. Statements with the same shape, but
+    different parameters, share a fingerprint.
+
+    Compiling large statements is expensive, so fingerprints are cached by the
+    SQLAlchemy cache key of the statement, which also identifies statement shapes.
+    The cache keeps the `max_size` most recently used shapes.
+
+    Literal SQL is only rendered on request, for example for slow statements.
+    """
+
+    def __init__(self, *, dialect: Dialect, max_size: int) -> None:
+        self.dialect = dialect
+        self.max_size = max_size
+        self._fingerprints: OrderedDict[Any, str] = OrderedDict()
+
+    def _create_fingerprint(self, statement: ClauseElement) -> str:
+        compiled_statement = str(statement.compile(dialect=self.dialect))
+        return hashlib.sha256(compiled_statement.encode("utf-8")).hexdigest()[:16]
+
+    def fingerprint(
+        self, statement: Executable | ClauseElement
+    ) -> tuple[str, list[Any]]:
+        "Returns the fingerprint and bound parameter values of the statement"
+        cache_key = statement._generate_cache_key()
+        if cache_key is None:
+            # Statement contains elements that can not be cached
+            return self._create_fingerprint(statement), []
+
+        params = [bind.effective_value for bind in cache_key.bindparams]
+        fingerprint = self._fingerprints.get(cache_key.key)
+        if fingerprint is not None:
+            self._fingerprints.move_to_end(cache_key.key)
+            return fingerprint, params
+
+        fingerprint = self._create_fingerprint(statement)
+        self._fingerprints[cache_key.key] = fingerprint
+        if len(self._fingerprints) > self.max_size:
+            self._fingerprints.popitem(last=False)
+
+        return fingerprint, params
+
+    def render_literal(self, statement: ClauseElement) -> str:
+        "Renders the statement with its parameters inlined"
+        return str(
+            statement.compile(
+                dialect=self.dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
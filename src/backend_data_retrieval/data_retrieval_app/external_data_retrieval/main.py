@@ -71,10 +71,18 @@ class ContinuousDataRetrieval:
         )
         self.currency_transformer = TransformCurrencyAPIData()
 
+        # Modifiers are only downloaded again when their ETag has changed
+        self.modifier_etag: str | None = None
+        self.modifier_dfs: dict[str, pd.DataFrame] = {}
+
     def _get_modifiers(self) -> dict[str, pd.DataFrame]:
-        response = get_data_safe(
-            self.modifier_url, headers=self.pom_auth_headers, logger=logger
-        )
+        headers = self.pom_auth_headers
+        if self.modifier_etag is not None:
+            headers = {**headers, "If-None-Match": self.modifier_etag}
+        response = get_data_safe(self.modifier_url, headers=headers, logger=logger)
+        if response.status_code == 304:
+            logger.info("Modifiers are unchanged since the last retrieval.")
+            return self.modifier_dfs
         # Check if the request was successful
         modifier_df = pd.DataFrame()
         # Load the JSON data into a pandas DataFrame
@@ -98,6 +106,9 @@ class ContinuousDataRetrieval:
                 modifier_dfs[modifier_type] = modifier_df.loc[
                     ~modifier_df[modifier_type].isna()
                 ]
+
+        self.modifier_etag = response.headers.get("ETag")
+        self.modifier_dfs = modifier_dfs
         return modifier_dfs
 
     def _get_leagues(self) -> list[dict[str, Any]]:
@@ -3,7 +3,7 @@ import pandas as pd
 from data_retrieval_app.external_data_retrieval.config import settings
 from data_retrieval_app.logs.logger import transform_logger as logger
 from data_retrieval_app.pom_api_authentication import get_superuser_token_headers
-from data_retrieval_app.utils import get_data_safe, insert_data
+from data_retrieval_app.utils import get_data_safe, insert_data, reserve_ids
 
 
 class TransformCurrencyAPIData:
@@ -92,20 +92,6 @@ class TransformCurrencyAPIData:
         )
         return currency_df
 
-    def _get_latest_currency_id_series(self, currency_df: pd.DataFrame) -> pd.Series:
-        response = get_data_safe(
-            f"{self.base_url}/currency/latest_currency_id/",
-            headers=self.pom_api_headers,
-            logger=logger,
-        )
-        latest_currency_id = int(response.text)
-
-        currency_id = pd.Series(
-            range(latest_currency_id - len(currency_df) + 1, latest_currency_id + 1),
-            dtype=int,
-        )
-        return currency_id
-
     def transform_into_tables(
         self, currency_df: pd.DataFrame, current_hours: dict[int, int]
     ) -> pd.DataFrame:
@@ -120,6 +106,15 @@ class TransformCurrencyAPIData:
         currency_df = self._clean_currency_table(currency_df)
         logger.debug("Successfully cleaned currency table data.")
 
+        currency_df = currency_df.assign(
+            currencyId=reserve_ids(
+                len(currency_df),
+                url=self.base_url,
+                table_name="currency",
+                headers=self.pom_api_headers,
+            )
+        )
+
         logger.debug("Inserting currency data into database.")
         insert_data(
             currency_df,
@@ -130,9 +125,5 @@ class TransformCurrencyAPIData:
         )
         logger.debug("Successfully inserted currency data into database.")
 
-        currency_id = self._get_latest_currency_id_series(currency_df)
-        logger.debug("Latest currency id found: " + str(currency_id))
-
-        currency_df = currency_df.assign(currencyId=currency_id)
         logger.debug("Successfully transformed data into tables.")
         return currency_df
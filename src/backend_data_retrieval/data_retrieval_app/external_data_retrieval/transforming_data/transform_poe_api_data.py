@@ -10,7 +10,7 @@ from data_retrieval_app.external_data_retrieval.transforming_data.roll_processor
 from data_retrieval_app.external_data_retrieval.utils import sync_timing_tracker
 from data_retrieval_app.logs.logger import transform_logger as logger
 from data_retrieval_app.pom_api_authentication import get_superuser_token_headers
-from data_retrieval_app.utils import get_data_safe, insert_data
+from data_retrieval_app.utils import get_data_safe, insert_data, reserve_ids
 
 pd.options.mode.chained_assignment = None  # default="warn"
 
@@ -252,20 +252,6 @@ class PoEAPIDataTransformerBase:
 
         return item_df
 
-    def _get_latest_item_id_series(self, item_df: pd.DataFrame) -> pd.Series:
-        response = get_data_safe(
-            f"{self.base_url}/item/latest_item_id/",
-            headers=self.pom_auth_headers,
-            logger=logger,
-        )
-        latest_item_id = int(response.text)
-
-        item_id = pd.Series(
-            range(latest_item_id - len(item_df) + 1, latest_item_id + 1), dtype=int
-        )
-
-        return item_id
-
     def _process_item_table(
         self,
         df: pd.DataFrame,
@@ -281,6 +267,16 @@ class PoEAPIDataTransformerBase:
             item_df, currency_df, item_base_types, current_hours=current_hours
         )
         item_df = self._clean_item_table(item_df)
+        item_id = pd.Series(
+            reserve_ids(
+                len(item_df),
+                url=self.base_url,
+                table_name="item",
+                headers=self.pom_auth_headers,
+            ),
+            dtype=int,
+        )
+        item_df["itemId"] = item_id.to_numpy()
         insert_data(
             item_df,
             url=self.base_url,
@@ -288,8 +284,7 @@ class PoEAPIDataTransformerBase:
             logger=logger,
             headers=self.pom_auth_headers,
         )
-        item_id = self._get_latest_item_id_series(item_df)
-        logger.debug("Latest item id found: " + str(item_id))
+        logger.debug(f"Created {len(item_id)} items.")
         return item_id
 
     @sync_timing_tracker
@@ -431,6 +426,7 @@ class PoEAPIDataTransformerBase:
             table_name="unidentifiedItem",
             logger=logger,
             headers=self.pom_auth_headers,
+            as_csv=True,
         )
 
     def _create_item_modifier_table(
@@ -481,6 +477,7 @@ class PoEAPIDataTransformerBase:
             table_name="itemModifier",
             logger=logger,
             headers=self.pom_auth_headers,
+            as_csv=True,
         )
 
     def transform_into_tables(
@@ -1,3 +1,4 @@
+import json
 import logging
 from collections.abc import Generator
 from datetime import UTC, datetime
@@ -53,6 +54,28 @@ def df_to_JSON(
         )
 
 
+def df_to_csv(df: pd.DataFrame) -> str:
+    """
+    Transforms data into CSV with a header row, for the CSV insert routes. Works per
+    column instead of per row. Missing values become empty fields, which are null.
+    """
+    logger.debug("Transforming data into CSV.")
+    df = df.mask(df.isin(["nan", "None"]))
+    for column in df.columns:
+        series = df[column]
+        if series.dtype == object:
+            is_nested = series.map(lambda value: isinstance(value, dict | list))
+            if is_nested.any():
+                df[column] = series.mask(is_nested, series[is_nested].map(json.dumps))
+        elif pd.api.types.is_float_dtype(series):
+            # Integer columns with missing values are floats in pandas
+            non_missing = series.dropna()
+            if (non_missing % 1 == 0).all():
+                df[column] = series.astype("Int64")
+
+    return df.to_csv(index=False)
+
+
 def find_hours_since_launch(leagues_df: list[dict]) -> dict[int, int]:
     """
     Finds the number of hours since launch for each of the leagues in the given dataframe
@@ -82,21 +105,35 @@ def insert_data(
     logger: logging.Logger,
     on_duplicate_pkey_do_nothing: bool = False,
     headers: dict[str, str] | None = None,
+    as_csv: bool = False,
 ) -> None:
+    """
+    `as_csv` sends the data to the CSV insert route of the table, which copies it
+    straight into the database. The JSON route is used to locate unprocessable rows.
+    """
     logger.debug("Inserting data into database.")
     if df.empty:
         logger.info(f"Found no data to insert into {table_name} table.")
         return None
-    data = df_to_JSON(df, request_method="post")
-    params = {"return_nothing": True}
-    if on_duplicate_pkey_do_nothing:
-        params["on_duplicate_pkey_do_nothing"] = True
     logger.debug("Sending data to database.")
-    response = requests.post(
-        f"{url}/{table_name}/", json=data, headers=headers, params=params
-    )
+    if as_csv:
+        response = requests.post(
+            f"{url}/{table_name}/csv/",
+            data=df_to_csv(df).encode("utf-8"),
+            headers={**(headers or {}), "Content-Type": "text/csv"},
+        )
+    else:
+        data = df_to_JSON(df, request_method="post")
+        params = {"return_nothing": True}
+        if on_duplicate_pkey_do_nothing:
+            params["on_duplicate_pkey_do_nothing"] = True
+        response = requests.post(
+            f"{url}/{table_name}/", json=data, headers=headers, params=params
+        )
     logger.debug("Sent request to insert data into the database.")
     if response.status_code == 422:
+        if as_csv:
+            data = df_to_JSON(df, request_method="post")
         logger.warning(
             f"Recieved a 422 response, indicating an unprocessable entity was submitted, while posting a {table_name} table.\nSending smaller batches, trying to locate specific error."
         )
@@ -129,6 +166,30 @@ def insert_data(
         response.raise_for_status()
 
 
+def reserve_ids(
+    count: int,
+    *,
+    url: HttpUrl,
+    table_name: str,
+    headers: dict[str, str] | None = None,
+) -> list[int]:
+    """
+    Reserves `count` ids of the table, which can be assigned before inserting.
+    Returns the ids in ascending order.
+    """
+    if count == 0:
+        return []
+    response = requests.post(
+        f"{url}/{table_name}/reserve_ids/", params={"count": count}, headers=headers
+    )
+    response.raise_for_status()
+    return [
+        reserved_id
+        for first_id, last_id in response.json()["ranges"]
+        for reserved_id in range(first_id, last_id + 1)
+    ]
+
+
 def get_data_safe(
     url: str,
     *,